@@ -0,0 +1,95 @@
+# Copyright (c) 2023 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+The timing and reporting shared by the benchmarks of the packages.
+"""
+
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import numpy
+
+
+def time_operation(make_operation, repeat):
+    """
+    Times an operation several times.
+
+    Before each run the operation is made again, without being timed, so
+    any preparation it needs is not counted.
+
+    :param ~collections.abc.Callable[[],~collections.abc.Callable[[],object]]\
+            make_operation:
+        Prepares for a run and returns the operation to time
+    :param int repeat: How many times to time the operation
+    :return: The time of each run, in seconds
+    :rtype: list(float)
+    """
+    times = []
+    for _ in range(repeat):
+        operation = make_operation()
+        start = time.perf_counter()
+        operation()
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def _commit():
+    """
+    The commit of the code being benchmarked, if known.
+
+    :rtype: str or None
+    """
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, check=True,
+            text=True, cwd=os.path.dirname(__file__)).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def describe_environment(**details):
+    """
+    Describes where and on what code benchmarks were run.
+
+    :param details: Anything else to add to the description
+    :return: The description, ready to be written as JSON
+    :rtype: dict
+    """
+    description = {
+        "commit": _commit(),
+        "python": platform.python_version(),
+        "numpy": numpy.__version__,
+        "platform": platform.platform(),
+        "time": time.strftime("%Y-%m-%dT%H:%M:%S")}
+    description.update(details)
+    return description
+
+
+def write_results(results, output=None):
+    """
+    Writes benchmark results as JSON.
+
+    :param dict results: The results
+    :param output: The file to write to, or ``None`` for standard output
+    :type output: str or None
+    """
+    if output:
+        with open(output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=1)
+    else:
+        json.dump(results, sys.stdout, indent=1)
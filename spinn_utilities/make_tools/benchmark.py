@@ -0,0 +1,240 @@
+# Copyright (c) 2023 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Benchmarks how the time to convert C source grows with the size of the
+log dictionary it is added to, or with ``--scanner`` how fast lines that
+must be scanned a character at a time are converted.
+
+Each dictionary size is timed converting the sources for the first time,
+converting them again after their outputs are removed, so every log is
+found in the dictionary, and running again with nothing to convert.
+
+For example::
+
+    python -m spinn_utilities.make_tools.benchmark \
+        --dictionary-sizes 0 100000 --output convert.json
+"""
+
+import argparse
+import os
+import shutil
+import sqlite3
+import statistics
+import sys
+import tempfile
+from spinn_utilities.benchmark_utils import (
+    describe_environment, time_operation, write_results)
+from .converter import convert
+from .file_converter import FileConverter
+from .log_sqllite_database import LogSqlLiteDatabase, SCHEMA_VERSION
+
+#: The numbers of logs already in the dictionary benchmarked by default
+DICTIONARY_SIZES = (0, 10000, 100000, 1000000)
+
+#: The indexes dropped to benchmark the schema before they were added
+LOOKUP_INDEXES = ("log_lookup", "file_lookup", "directory_lookup")
+
+#: A line with a string, a comment and a log, which has to be scanned
+SCANNER_LINE = (
+    '    total = sum(values, "a /* b */ string"); /* running total */ '
+    'log_info("total %d of %d", total, count); // checked\n')
+
+
+def _write_sources(src, files, logs):
+    for file_num in range(files):
+        with open(os.path.join(src, f"file{file_num}.c"), "w",
+                  encoding="utf-8") as f:
+            f.write(f"void function{file_num}(int value) {{\n")
+            for log_num in range(logs):
+                f.write(f'    log_info("log {log_num} of file {file_num} '
+                        f'has %d", value);\n')
+            f.write("}\n")
+
+
+def _fill_dictionary(database_file, dictionary_size, indexed):
+    """
+    Adds logs from some other source to a new dictionary.
+    """
+    if os.path.exists(database_file):
+        os.remove(database_file)
+    LogSqlLiteDatabase(True).close()
+    db = sqlite3.connect(database_file)
+    with db:
+        db.execute(
+            "INSERT INTO directory(src_path, dest_path) "
+            "VALUES('other', 'other')")
+        db.execute(
+            "INSERT INTO file(directory_id, file_name, convert_time, "
+            "last_build) VALUES(1, 'other.c', 0, 1)")
+        db.executemany(
+            "INSERT INTO log(log_level, line_num, original, file_id) "
+            "VALUES(20, ?, ?, 1)",
+            ((num, f"other log {num}") for num in range(dictionary_size)))
+        if not indexed:
+            for index in LOOKUP_INDEXES:
+                db.execute(f"DROP INDEX {index}")
+    db.close()
+
+
+def _benchmark(dictionary_size, indexed, files, logs, repeat):
+    work = tempfile.mkdtemp()
+    old_dict = os.environ.get("C_LOGS_DICT")
+    try:
+        src = os.path.join(work, "src")
+        os.mkdir(src)
+        _write_sources(src, files, logs)
+        os.environ["C_LOGS_DICT"] = os.path.join(work, "logs.sqlite3")
+        dest = os.path.join(work, "dest")
+
+        def conversion():
+            convert(src, dest, False)
+
+        def fresh():
+            # Every log has to be added
+            _fill_dictionary(
+                os.environ["C_LOGS_DICT"], dictionary_size, indexed)
+            shutil.rmtree(dest, ignore_errors=True)
+            return conversion
+
+        def again():
+            # Every file is converted again and every log found
+            fresh()()
+            shutil.rmtree(dest)
+            return conversion
+
+        def unchanged():
+            # Every file is skipped as converted already
+            fresh()()
+            return conversion
+
+        first_times = time_operation(fresh, repeat)
+        again_times = time_operation(again, repeat)
+        unchanged_times = time_operation(unchanged, repeat)
+    finally:
+        if old_dict is None:
+            os.environ.pop("C_LOGS_DICT", None)
+        else:
+            os.environ["C_LOGS_DICT"] = old_dict
+        shutil.rmtree(work)
+    return {
+        "dictionary_size": dictionary_size, "indexed": indexed,
+        "files": files, "logs": logs,
+        "first": min(first_times),
+        "first_median": statistics.median(first_times),
+        "again": min(again_times),
+        "again_median": statistics.median(again_times),
+        "unchanged": min(unchanged_times),
+        "unchanged_median": statistics.median(unchanged_times)}
+
+
+def run_benchmarks(
+        dictionary_sizes=DICTIONARY_SIZES, indexed=(True, False), files=50,
+        logs=20, repeat=3, log=None):
+    """
+    Runs the benchmarks.
+
+    :param iterable(int) dictionary_sizes:
+        The numbers of logs already in the dictionary
+    :param iterable(bool) indexed:
+        Whether to run with the lookup indexes, without them, or both
+    :param int files: The number of C files to convert
+    :param int logs: The number of logs in each file
+    :param int repeat: How many times to time each benchmark
+    :param log: Where to report progress, if anywhere
+    :type log: ~io.TextIOBase or None
+    :return: The results, ready to be written as JSON
+    :rtype: dict
+    """
+    results = []
+    for dictionary_size in dictionary_sizes:
+        for with_indexes in indexed:
+            result = _benchmark(
+                dictionary_size, with_indexes, files, logs, repeat)
+            results.append(result)
+            if log is not None:
+                log.write(
+                    f"{dictionary_size:>8} "
+                    f"{'indexed' if with_indexes else 'unindexed':9} "
+                    f"first {result['first']:.4f}s "
+                    f"again {result['again']:.4f}s "
+                    f"unchanged {result['unchanged']:.4f}s\n")
+    return describe_environment(
+        sqlite=sqlite3.sqlite_version, schema_version=SCHEMA_VERSION,
+        repeat=repeat, results=results)
+
+
+def run_scanner_benchmark(lines=20000, repeat=3):
+    """
+    Times converting, in memory, source made up of lines that have to be
+    scanned a character at a time.
+
+    :param int lines: The number of lines to convert
+    :param int repeat: How many times to time the conversion
+    :return: The results, ready to be written as JSON
+    :rtype: dict
+    """
+    text = SCANNER_LINE * lines
+    times = time_operation(lambda: lambda: FileConverter.render_in_memory(
+        "scanner.c", "scanner.c", text), repeat)
+    best = min(times)
+    return describe_environment(
+        repeat=repeat, lines=lines, characters=len(text), best=best,
+        median=statistics.median(times),
+        characters_per_second=len(text) / best)
+
+
+def main(arguments=None):
+    """
+    Command line interface.
+
+    :param list(str) arguments: Command line arguments.
+    """
+    parser = argparse.ArgumentParser(
+        description="Benchmark converting C source against the size of the "
+                    "log dictionary")
+    parser.add_argument(
+        "--dictionary-sizes", nargs="+", type=int, default=DICTIONARY_SIZES,
+        help="The numbers of logs already in the dictionary")
+    parser.add_argument(
+        "--indexed-only", action="store_true",
+        help="Do not also run without the lookup indexes")
+    parser.add_argument(
+        "--files", type=int, default=50, help="The number of C files")
+    parser.add_argument(
+        "--logs", type=int, default=20, help="The number of logs per file")
+    parser.add_argument(
+        "--repeat", type=int, default=3, help="Times to run each benchmark")
+    parser.add_argument(
+        "--scanner", type=int, metavar="LINES",
+        help="Instead time converting this many lines that have to be "
+             "scanned a character at a time")
+    parser.add_argument("--output", help="File to write the results to")
+    args = parser.parse_args(arguments)
+
+    if args.scanner is not None:
+        results = run_scanner_benchmark(args.scanner, args.repeat)
+        sys.stderr.write(
+            f"{results['characters_per_second'] / 1e6:.2f} "
+            f"M characters/s\n")
+    else:
+        indexed = (True, ) if args.indexed_only else (True, False)
+        results = run_benchmarks(
+            args.dictionary_sizes, indexed, args.files, args.logs,
+            args.repeat, sys.stderr)
+    write_results(results, args.output)
+
+
+if __name__ == "__main__":
+    main()  # pragma: no cover
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from concurrent.futures import ProcessPoolExecutor
 import os
 import sys
 from .file_converter import FileConverter
@@ -24,35 +25,48 @@ SKIPPABLE_FILES = frozenset([
     "neural_build.mk", "Makefile.neural_build"])
 
 
-def convert(src, dest, new_dict):
+def convert(src, dest, new_dict, jobs=1):
     """
     Converts a whole directory including sub-directories.
 
+    With more than one job the files are converted in a pool of processes,
+    but the log IDs are still given out by this process in the same order,
+    so the files and dictionary written are the same as with one job.
+
     :param str src: Full source directory
     :param str dest: Full destination directory
     :param bool new_dict:
         Whether we should generate a new dictionary/DB.
         If not, we add to the existing one.
+    :param jobs:
+        The number of processes to convert with;
+        ``None`` to use one per CPU
+    :type jobs: int or None
     """
-    if new_dict:
-        LogSqlLiteDatabase(new_dict)
-
     src_path = os.path.abspath(src)
     if not os.path.exists(src_path):
+        if new_dict:
+            LogSqlLiteDatabase(new_dict).close()
         raise FileNotFoundError(
             f"Unable to locate source directory {src_path}")
     dest_path = os.path.abspath(dest)
-    _convert_dir(src_path, dest_path)
+    with LogSqlLiteDatabase(new_dict) as log_database:
+        _convert_dir(src_path, dest_path, log_database, jobs=jobs)
 
 
-def _convert_dir(src_path, dest_path, make_directories=False):
+def _convert_dir(src_path, dest_path, log_database, make_directories=False,
+                 jobs=1):
     """
     Converts a whole directory including sub directories.
 
     :param str src_path: Full source directory
     :param str dest_path: Full destination directory
+    :param LogSqlLiteDatabase log_database: The database to add the logs to
     :param bool make_directories: Whether to do `mkdir()` first
+    :param jobs: The number of processes to convert with
+    :type jobs: int or None
     """
+    to_convert = []
     if make_directories:
         _mkdir(dest_path)
     for src_dir, _, file_list in os.walk(src_path):
@@ -62,12 +76,47 @@ def _convert_dir(src_path, dest_path, make_directories=False):
         for file_name in file_list:
             _, extension = os.path.splitext(file_name)
             if extension in ALLOWED_EXTENSIONS:
-                FileConverter.convert(src_dir, dest_dir, file_name)
+                to_convert.append((src_dir, dest_dir, file_name))
             elif file_name in SKIPPABLE_FILES:
                 pass
             else:
                 source = os.path.join(src_dir, file_name)
                 print(f"Unexpected file {source}")
+    if jobs == 1 or len(to_convert) < 2:
+        for src_dir, dest_dir, file_name in to_convert:
+            FileConverter.convert(
+                src_dir, dest_dir, file_name, log_database)
+    else:
+        _convert_parallel(to_convert, log_database, jobs)
+
+
+def _convert_parallel(to_convert, log_database, jobs):
+    """
+    Renders the files that have changed in a pool of processes, then adds
+    their logs to the database and writes them in order.
+
+    :param list(tuple(str, str, str)) to_convert:
+        The source directory, destination directory and name of each file
+    :param LogSqlLiteDatabase log_database: The database to add the logs to
+    :param jobs: The number of processes to use
+    :type jobs: int or None
+    """
+    to_convert = [
+        task for task in to_convert
+        if not FileConverter.is_unchanged(*task, log_database)]
+    if not to_convert:
+        return
+    with ProcessPoolExecutor(jobs) as executor:
+        rendered = executor.map(
+            FileConverter.render_with_marks, *zip(*to_convert), chunksize=4)
+        for (src_dir, dest_dir, file_name), result in zip(
+                to_convert, rendered):
+            if result is None:
+                FileConverter.convert(
+                    src_dir, dest_dir, file_name, log_database)
+            else:
+                FileConverter.convert_rendered(
+                    src_dir, dest_dir, file_name, result, log_database)
 
 
 def _mkdir(destination):
@@ -84,4 +133,8 @@ if __name__ == '__main__':
         _new_dict = bool(sys.argv[3])
     else:
         _new_dict = False
-    convert(_src, _dest, _new_dict)
+    if len(sys.argv) > 4:
+        _jobs = int(sys.argv[4]) or None
+    else:
+        _jobs = 1
+    convert(_src, _dest, _new_dict, _jobs)
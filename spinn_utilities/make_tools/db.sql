@@ -12,9 +12,6 @@
 -- See the License for the specific language governing permissions and
 -- limitations under the License.
 
--- https://www.sqlite.org/pragma.html#pragma_synchronous
-PRAGMA main.synchronous = OFF;
-
 -- - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
 -- A table holding each log message
 CREATE TABLE IF NOT EXISTS log(
@@ -32,7 +29,9 @@ CREATE TABLE IF NOT EXISTS file(
     directory_id INTEGER NOT NULL REFERENCES directory(directory_id) ON DELETE RESTRICT,
 	file_name STRING NOT NULL,
     convert_time INTEGER,
-    last_build INTEGER
+    last_build INTEGER,
+    content_hash STRING,
+    content_size INTEGER
 	);
 
 -- - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
@@ -43,6 +42,18 @@ CREATE TABLE IF NOT EXISTS directory(
 	dest_path STRING NOT NULL
 	);
 
+-- - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+-- Indexes for looking up existing logs, files and directories
+CREATE INDEX IF NOT EXISTS log_lookup ON log(log_level, line_num, original);
+CREATE INDEX IF NOT EXISTS file_lookup ON file(directory_id, file_name);
+CREATE INDEX IF NOT EXISTS directory_lookup ON directory(src_path, dest_path);
+
+-- - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+-- The version of this schema; see SCHEMA_VERSION in log_sqllite_database.py
+CREATE TABLE IF NOT EXISTS schema_version(
+    version INTEGER NOT NULL
+	);
+
 -- - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
 -- Glue the bits together to show the information that people think is here
 CREATE VIEW IF NOT EXISTS current_file_view AS
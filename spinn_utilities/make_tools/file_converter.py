@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import enum
+import hashlib
+import io
 import os
 import re
 from spinn_utilities.exceptions import UnexpectedCException
@@ -26,12 +28,18 @@ LOG_END_REGEX = re.compile(r'\)(\s)*;')
 END_COMMENT_REGEX = re.compile(r"/*/")
 LOG_START_REGEX = re.compile(
     r"log_((info)|(error)|(debug)|(warning))(\s)*\(")
+#: The rest of a string literal, up to but not including the closing quote
+STRING_BODY_REGEX = re.compile(r'(?:[^"\\\n]|\\[^\n])*')
 DOUBLE_HEX = ", double_to_upper({0}), double_to_lower({0})"
 LEVELS = {"log_info(": 20,
           "log_error(": 40,
           "log_debug(": 10,
           "log_warning(": 30}
 
+#: Marks where a log ID goes in text rendered before the IDs are known
+ID_MARK = chr(0)  # Null, which is not valid in C source
+ID_MARK_REGEX = re.compile(ID_MARK + r"(\d+)" + ID_MARK)
+
 MINIS = {"log_info(": "log_mini_info(",
          "log_error(": "log_mini_error(",
          "log_debug(": "log_mini_debug(",
@@ -48,6 +56,79 @@ class State(enum.Enum):
     IN_LOG_CLOSE_BRACKET = 3
 
 
+#: By status, the next place in a line where _process_chars has work to do;
+#: every character before it would just be passed over
+_NEXT_TOKEN_REGEXES = {
+    State.NORMAL_CODE: re.compile(r'[/"\n]|' + LOG_START_REGEX.pattern),
+    State.COMMENT: re.compile(r"\*/|\n"),
+    State.IN_LOG: re.compile(r'[/"\n]|' + LOG_END_REGEX.pattern)}
+
+
+def _read_source(source):
+    """
+    Reads a source file.
+
+    :param str source: Absolute path to the source file
+    :return: The text, as read in text mode, and the hash and size in bytes
+        of the content
+    :rtype: tuple(str, str, int)
+    """
+    if not os.path.exists(source):
+        raise UnexpectedCException(f"Unable to locate source {source}")
+    with open(source, "rb") as src_f:
+        content = src_f.read()
+    text = io.TextIOWrapper(io.BytesIO(content), encoding="utf-8").read()
+    return text, hashlib.sha256(content).hexdigest(), len(content)
+
+
+def _write_if_changed(destination, text):
+    """
+    Writes a file, unless it already holds exactly the same text, so that
+    its modification time only changes when its content does.
+    The file is replaced atomically, so is never seen half written.
+
+    :param str destination: Absolute path to the file
+    :param str text: The text to write, with ``\n`` line ends
+    :return: Whether the file was written
+    :rtype: bool
+    """
+    if os.linesep != "\n":
+        text = text.replace("\n", os.linesep)
+    content = text.encode("utf-8")
+    if os.path.exists(destination):
+        with open(destination, "rb") as dest_f:
+            if dest_f.read() == content:
+                return False
+    # Opened normally, rather than with tempfile, to get the usual mode
+    temp = f"{destination}.{os.getpid()}.tmp"
+    try:
+        with open(temp, "wb") as temp_f:
+            temp_f.write(content)
+        os.replace(temp, destination)
+    except OSError:
+        if os.path.exists(temp):
+            os.remove(temp)
+        raise
+    return True
+
+
+class _LogRecorder(object):
+    """
+    Stands in for the database when rendering a file before the log IDs are
+    known, recording each log and giving a mark in place of its ID.
+    """
+
+    __slots__ = ["logs"]
+
+    def __init__(self):
+        self.logs = []
+
+    def set_log_info(self, log_level, line_num, original, file_id):
+        # pylint: disable=unused-argument
+        self.logs.append((log_level, line_num, original))
+        return f"{ID_MARK}{len(self.logs) - 1}{ID_MARK}"
+
+
 class FileConverter(object):
     """
     Converts a file. See :py:meth:`convert`.
@@ -66,7 +147,7 @@ class FileConverter(object):
         "_too_many_lines"
     ]
 
-    def __call__(self, src, dest, log_file_id, log_database):
+    def __call__(self, src, dest, log_file_id, log_database, text=None):
         """
         Creates the file_convertor to convert one file.
 
@@ -76,6 +157,31 @@ class FileConverter(object):
             Id in the database for this file
         :param LogSqlLiteDatabase log_database:
             The database which handles the mapping of id to log messages.
+        :param text: The text of the source file, if already read
+        :type text: str or None
+        """
+        if text is None:
+            with open(src, encoding="utf-8") as src_f:
+                text = src_f.read()
+        _write_if_changed(
+            dest, self.render(src, dest, log_file_id, log_database, text))
+
+    def render(self, src, dest, log_file_id, log_database, text):
+        """
+        Converts the text of one file in memory.
+
+        :param str src: Absolute path to source file
+        :param str dest: Absolute path to destination file
+        :param log_file_id:
+            Id in the database for this file, if it has one yet
+        :type log_file_id: int or None
+        :param log_database:
+            The database which handles the mapping of id to log messages,
+            or anything else with a matching ``set_log_info`` method
+        :type log_database: LogSqlLiteDatabase
+        :param str text: The text of the source file
+        :return: The converted text
+        :rtype: str
         """
         #: Absolute path to source file
         #:
@@ -122,25 +228,36 @@ class FileConverter(object):
         #: :type: State
         self._previous_status = None
 
-        with open(src, encoding="utf-8") as src_f:
-            with open(dest, 'w', encoding="utf-8") as dest_f:
-                dest_f.write(
-                    f"// DO NOT EDIT! THIS FILE WAS GENERATED FROM "
-                    f"{os.path.relpath(src, dest)}\n\n")
-                self._too_many_lines = 2
-                self._status = State.NORMAL_CODE
-                for line_num, text in enumerate(src_f):
-                    if self._too_many_lines > 0:
-                        # Try to recover the lines added by do not edit
-                        check = text.strip()
-                        if len(check) == 0 or check == "*":
-                            self._too_many_lines -= 1
-                            continue
-                    previous_status = self._status
-                    if not self._process_line(dest_f, line_num, text):
-                        self._status = previous_status
-                        self._process_chars(dest_f, line_num, text)
+        return self._render(text, dest)
+
+    def _render(self, text, dest):
+        """
+        Converts the text of the source file.
+
+        :param str text: The text of the source file
+        :param str dest: Absolute path to destination file
+        :return: The converted text
+        :rtype: str
+        """
+        dest_f = io.StringIO()
+        dest_f.write(
+            f"// DO NOT EDIT! THIS FILE WAS GENERATED FROM "
+            f"{os.path.relpath(self._src, dest)}\n\n")
+        self._too_many_lines = 2
+        self._status = State.NORMAL_CODE
+        for line_num, text in enumerate(io.StringIO(text)):
+            if self._too_many_lines > 0:
+                # Try to recover the lines added by do not edit
+                check = text.strip()
+                if len(check) == 0 or check == "*":
+                    self._too_many_lines -= 1
+                    continue
+            previous_status = self._status
+            if not self._process_line(dest_f, line_num, text):
+                self._status = previous_status
+                self._process_chars(dest_f, line_num, text)
         self._check_end_status()
+        return dest_f.getvalue()
 
     def _check_end_status(self):
         if self._status == State.NORMAL_CODE:
@@ -499,6 +616,23 @@ class FileConverter(object):
             dest_f.write("*/")
             dest_f.write(end * (self._log_lines - 1))
 
+    def _next_token(self, text, pos):
+        """
+        Skips to the next character that could change what is written.
+
+        :param str text: Text of the line including whitespace
+        :param int pos: Where to start looking
+        :return: Where the next token starts; the end of the text if none
+        :rtype: int
+        """
+        regex = _NEXT_TOKEN_REGEXES.get(self._status)
+        if regex is None:
+            return pos
+        match = regex.search(text, pos)
+        if match is None:
+            return len(text)
+        return match.start()
+
     def _process_chars(self, dest_f, line_num, text):
         """
         Deals with complex lines that can not be handled in one go.
@@ -508,7 +642,7 @@ class FileConverter(object):
         :param str text: Text of that line including whitespace
         :raises UnexpectedCException:
         """
-        pos = 0
+        pos = self._next_token(text, 0)
         write_flag = 0
         while text[pos] != "\n":
             if self._status == State.COMMENT:
@@ -544,23 +678,14 @@ class FileConverter(object):
                     pos += 1
 
             elif text[pos] == '"':
-                str_pos = pos + 1
-                while text[str_pos] != '"':
-                    if text[str_pos] == "\n":
-                        raise UnexpectedCException(
-                            f"Unclosed string literal in {self._src} "
-                            f"at line: {line_num}")
-                    elif text[str_pos] == "\\":
-                        if text[str_pos+1] == "\n":
-                            raise UnexpectedCException(
-                                f"Unclosed string literal in {self._src} "
-                                f"at line: {line_num}")
-                        else:
-                            str_pos += 2  # ignore next char which may be a "
-                    else:
-                        str_pos += 1
+                # An escaped character may be a "
+                str_pos = STRING_BODY_REGEX.match(text, pos + 1).end()
+                if text[str_pos] != '"':
+                    # Only a newline, or a \ before one, stops it early
+                    raise UnexpectedCException(
+                        f"Unclosed string literal in {self._src} "
+                        f"at line: {line_num}")
                 pos = str_pos + 1
-                continue
 
             elif self._status == State.IN_LOG:
                 if text[pos] == ")":
@@ -620,6 +745,7 @@ class FileConverter(object):
 
             else:
                 pos += 1
+            pos = self._next_token(text, pos)
 
         # after while text[pos] != "\n"
         if self._status == State.IN_LOG:
@@ -629,23 +755,137 @@ class FileConverter(object):
             dest_f.write(text[write_flag:])
 
     @staticmethod
-    def convert(src_dir, dest_dir, file_name):
+    def convert(src_dir, dest_dir, file_name, log_database=None):
         """
         Static method to create Object and do the conversion.
 
+        A file whose source is the same as when it was last converted, and
+        whose converted file is still there, is skipped and keeps its logs.
+
         :param str src_dir: Source directory
         :param str dest_dir: Destination directory
         :param str file_name:
             The name of the file to convert within the source directory; it
             will be made with the same name in the destination directory.
+        :param log_database:
+            The open database to add the logs to, in one transaction;
+            if ``None`` the database is opened just for this file
+        :type log_database: LogSqlLiteDatabase or None
         """
+        if log_database is None:
+            with LogSqlLiteDatabase() as log_database:
+                FileConverter.convert(
+                    src_dir, dest_dir, file_name, log_database)
+            return
         source = os.path.join(src_dir, file_name)
-        if not os.path.exists(source):
-            raise UnexpectedCException(f"Unable to locate source {source}")
+        text, content_hash, content_size = _read_source(source)
         if not os.path.exists(dest_dir):
             os.makedirs(dest_dir)
         destination = os.path.join(dest_dir, file_name)
-        with LogSqlLiteDatabase() as log_database:
+        with log_database.transaction():
+            directory_id = log_database.get_directory_id(src_dir, dest_dir)
+            if os.path.exists(destination) and (
+                    log_database.get_unchanged_file_id(
+                        directory_id, file_name, content_hash, content_size)
+                    is not None):
+                return
+            file_id = log_database.get_file_id(
+                directory_id, file_name, content_hash, content_size)
+            FileConverter()(source, destination, file_id, log_database, text)
+
+    @staticmethod
+    def is_unchanged(src_dir, dest_dir, file_name, log_database):
+        """
+        Checks if :py:meth:`convert` would skip a file, as its source is
+        the same as when it was last converted and the converted file is
+        still there.
+
+        :param str src_dir: Source directory
+        :param str dest_dir: Destination directory
+        :param str file_name: The name of the file
+        :param LogSqlLiteDatabase log_database: The open database
+        :rtype: bool
+        """
+        if not os.path.exists(os.path.join(dest_dir, file_name)):
+            return False
+        # Only looked up, so directories are still added in the order
+        # the files are converted
+        directory_id = log_database.find_directory_id(src_dir, dest_dir)
+        if directory_id is None:
+            return False
+        _, content_hash, content_size = _read_source(
+            os.path.join(src_dir, file_name))
+        return log_database.get_unchanged_file_id(
+            directory_id, file_name, content_hash, content_size) is not None
+
+    @staticmethod
+    def render_in_memory(src, dest, text):
+        """
+        Converts the text of a file without using the database.
+        Each log ID is left as a mark, as by :py:meth:`render_with_marks`.
+
+        :param str src: Absolute path to source file
+        :param str dest: Absolute path to destination file
+        :param str text: The text of the source file
+        :return: The converted text, and the level, line number and
+            original message of each log in it
+        :rtype: tuple(str, list(tuple(int, int, str)))
+        """
+        recorder = _LogRecorder()
+        text = FileConverter().render(src, dest, None, recorder, text)
+        return text, recorder.logs
+
+    @staticmethod
+    def render_with_marks(src_dir, dest_dir, file_name):
+        """
+        Converts a file in memory without using the database, so that
+        files can be converted in parallel.
+        Each log ID is left as a mark, to be replaced by
+        :py:meth:`convert_rendered`.
+
+        :param str src_dir: Source directory
+        :param str dest_dir: Destination directory
+        :param str file_name: The name of the file to convert
+        :return: The converted text, the level, line number and
+            original message of each log in it, and the hash and size of
+            the source; or ``None`` if the file contains the mark character
+            so must be converted by :py:meth:`convert`
+        :rtype: tuple(str, list(tuple(int, int, str)), str, int) or None
+        """
+        text, content_hash, content_size = _read_source(
+            os.path.join(src_dir, file_name))
+        if ID_MARK in text:
+            return None
+        text, logs = FileConverter.render_in_memory(
+            os.path.join(src_dir, file_name),
+            os.path.join(dest_dir, file_name), text)
+        return text, logs, content_hash, content_size
+
+    @staticmethod
+    def convert_rendered(src_dir, dest_dir, file_name, rendered,
+                         log_database):
+        """
+        Adds the logs of a file rendered by :py:meth:`render_with_marks` to
+        the database, in the same order as :py:meth:`convert` would, and
+        writes the file with the log IDs in place.
+
+        :param str src_dir: Source directory
+        :param str dest_dir: Destination directory
+        :param str file_name: The name of the file converted
+        :param tuple rendered: What :py:meth:`render_with_marks` returned
+        :param LogSqlLiteDatabase log_database:
+            The open database to add the logs to, in one transaction
+        """
+        text, logs, content_hash, content_size = rendered
+        if not os.path.exists(dest_dir):
+            os.makedirs(dest_dir)
+        with log_database.transaction():
             directory_id = log_database.get_directory_id(src_dir, dest_dir)
-            file_id = log_database.get_file_id(directory_id, file_name)
-            FileConverter()(source, destination, file_id, log_database)
+            file_id = log_database.get_file_id(
+                directory_id, file_name, content_hash, content_size)
+            ids = [log_database.set_log_info(
+                log_level, line_num, original, file_id)
+                for (log_level, line_num, original) in logs]
+        text = ID_MARK_REGEX.sub(lambda match: str(ids[int(match.group(1))]),
+                                 text)
+        _write_if_changed(os.path.join(dest_dir, file_name), text)
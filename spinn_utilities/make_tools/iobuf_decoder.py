@@ -0,0 +1,183 @@
+# Copyright (c) 2023 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Decodes whole IOBUF files, or standard input, using the log dictionary.
+
+For example::
+
+    python -m spinn_utilities.make_tools.iobuf_decoder --stats \
+        --output-dir decoded --jobs 4 iobuf_*.txt
+"""
+
+import argparse
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+import os
+import sys
+import time
+from .replacer import CHUNK_SIZE, Replacer
+
+# Passes any bytes that are not UTF-8 through unchanged
+_ENCODING = {"encoding": "utf-8", "errors": "surrogateescape", "newline": ""}
+
+
+def decode_stream(replacer, in_f, out_f, chunk_size=CHUNK_SIZE):
+    """
+    Decodes an IOBUF line by line, holding at most `chunk_size` lines.
+
+    :param Replacer replacer: The replacer to decode with
+    :param ~io.TextIOBase in_f: Where to read the IOBUF
+    :param ~io.TextIOBase out_f: Where to write the decoded IOBUF
+    :param int chunk_size: The most lines to read ahead
+    :return: The number of lines and characters read
+    :rtype: tuple(int, int)
+    """
+    lines = 0
+    characters = 0
+
+    def counted(in_f):
+        nonlocal lines, characters
+        for line in in_f:
+            lines += 1
+            characters += len(line)
+            yield line
+
+    for line in replacer.replace_lines(counted(in_f), chunk_size):
+        out_f.write(line)
+    return lines, characters
+
+
+def decode_file(source, destination, chunk_size=CHUNK_SIZE):
+    """
+    Decodes an IOBUF file into another file.
+
+    :param str source: The IOBUF file
+    :param str destination: The file to write the decoded IOBUF to
+    :param int chunk_size: The most lines to read ahead
+    :return: The number of lines and characters read
+    :rtype: tuple(int, int)
+    """
+    with Replacer() as replacer, \
+            open(source, **_ENCODING) as in_f, \
+            open(destination, "w", **_ENCODING) as out_f:
+        return decode_stream(replacer, in_f, out_f, chunk_size)
+
+
+def _destinations(sources, output_dir):
+    """
+    Gets where to write each decoded file, with the same name as it has.
+
+    :param list(str) sources: The IOBUF files
+    :param str output_dir: The directory to write to
+    :rtype: list(str)
+    :raises ValueError: If two of the files have the same name
+    """
+    names = Counter(os.path.basename(source) for source in sources)
+    duplicates = sorted(name for name, count in names.items() if count > 1)
+    if duplicates:
+        raise ValueError(
+            f"More than one file is named {', '.join(duplicates)}, "
+            "so they would be decoded to the same file")
+    return [os.path.join(output_dir, os.path.basename(source))
+            for source in sources]
+
+
+def _decode_files(sources, destinations, jobs, chunk_size):
+    if jobs == 1 or len(sources) < 2:
+        return [decode_file(source, destination, chunk_size)
+                for source, destination in zip(sources, destinations)]
+    with ProcessPoolExecutor(jobs) as executor:
+        return list(executor.map(
+            decode_file, sources, destinations,
+            [chunk_size] * len(sources)))
+
+
+def _decode_to_stdout(sources, chunk_size):
+    counts = []
+    with Replacer() as replacer:
+        with open(sys.stdout.fileno(), "w", closefd=False,
+                  **_ENCODING) as out_f:
+            for source in sources:
+                if source == "-":
+                    in_f = open(
+                        sys.stdin.fileno(), closefd=False, **_ENCODING)
+                else:
+                    in_f = open(source, **_ENCODING)
+                with in_f:
+                    counts.append(
+                        decode_stream(replacer, in_f, out_f, chunk_size))
+    return counts
+
+
+def main(arguments=None):
+    """
+    Command line interface.
+
+    :param list(str) arguments: Command line arguments.
+    """
+    parser = argparse.ArgumentParser(
+        description="Decode IOBUF files using the log dictionary; "
+                    "set C_LOGS_DICT to use a dictionary elsewhere")
+    parser.add_argument(
+        "files", nargs="*", default=["-"],
+        help="The IOBUF files; - or none to read standard input")
+    parser.add_argument(
+        "--output-dir",
+        help="Directory to write each decoded file to, with the same name; "
+             "otherwise all are written to standard output")
+    parser.add_argument(
+        "--jobs", type=int, default=1,
+        help="Number of files to decode at once, with --output-dir; "
+             "0 to use one per CPU")
+    parser.add_argument(
+        "--chunk-size", type=int, default=CHUNK_SIZE,
+        help="The most lines to read ahead")
+    parser.add_argument(
+        "--stats", action="store_true",
+        help="Write the lines decoded per second to standard error")
+    args = parser.parse_args(arguments)
+    if args.jobs != 1 and args.output_dir is None:
+        parser.error("--jobs needs --output-dir")
+    if args.output_dir is not None and "-" in args.files:
+        parser.error("standard input can only be decoded to standard output")
+
+    destinations = None
+    if args.output_dir is not None:
+        try:
+            destinations = _destinations(args.files, args.output_dir)
+        except ValueError as ex:
+            parser.error(str(ex))
+
+    start = time.perf_counter()
+    if args.output_dir is None:
+        counts = _decode_to_stdout(args.files, args.chunk_size)
+    else:
+        os.makedirs(args.output_dir, exist_ok=True)
+        counts = _decode_files(
+            args.files, destinations, args.jobs or None, args.chunk_size)
+    seconds = time.perf_counter() - start
+
+    if args.stats:
+        lines = sum(count[0] for count in counts)
+        characters = sum(count[1] for count in counts)
+        elapsed = seconds or float("nan")
+        sys.stderr.write(
+            f"{len(counts)} files, {lines} lines, {characters} characters "
+            f"in {seconds:.3f}s: {lines / elapsed:.0f} lines/s, "
+            f"{characters / elapsed / 1e6:.2f} M characters/s\n")
+
+
+if __name__ == "__main__":
+    main()  # pragma: no cover
@@ -12,16 +12,55 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from contextlib import contextmanager
 import os
 import sqlite3
 import sys
 import time
 from spinn_utilities.abstract_context_manager import AbstractContextManager
+from spinn_utilities.exceptions import SpiNNUtilsException
 
 _DDL_FILE = os.path.join(os.path.dirname(__file__), "db.sql")
 _SECONDS_TO_MICRO_SECONDS_CONVERSION = 1000
 DB_FILE_NAME = "logs.sqlite3"
 
+#: The version of the schema made by db.sql
+SCHEMA_VERSION = 3
+
+#: The SQL to upgrade a database to each version from the one before.
+#: Databases from before versioning count as version 1.
+_MIGRATIONS = {
+    2: """
+        CREATE INDEX IF NOT EXISTS log_lookup
+            ON log(log_level, line_num, original);
+        CREATE INDEX IF NOT EXISTS file_lookup
+            ON file(directory_id, file_name);
+        CREATE INDEX IF NOT EXISTS directory_lookup
+            ON directory(src_path, dest_path);
+        CREATE TABLE IF NOT EXISTS schema_version(version INTEGER NOT NULL);
+        """,
+    3: """
+        ALTER TABLE file ADD COLUMN content_hash STRING;
+        ALTER TABLE file ADD COLUMN content_size INTEGER;
+        """,
+}
+
+
+class SchemaVersionException(SpiNNUtilsException):
+    """
+    Raised when a log dict was made by newer code, with a schema this code
+    does not know.
+    """
+
+    def __init__(self, version):
+        """
+        :param int version: The schema version of the log dict
+        """
+        super().__init__(
+            f"The c_logs_dict has schema version {version}, which is newer "
+            f"than this code supports ({SCHEMA_VERSION}). "
+            "Please upgrade SpiNNUtils.")
+
 
 def _timestamp():
     return int(time.time() * _SECONDS_TO_MICRO_SECONDS_CONVERSION)
@@ -43,7 +82,8 @@ class LogSqlLiteDatabase(AbstractContextManager):
     __slots__ = [
         # the database holding the data to store
         "_db",
-    ]
+        # whether a transaction has been started by transaction()
+        "_in_transaction"]
 
     def __init__(self, new_dict=False):
         """
@@ -56,6 +96,7 @@ class LogSqlLiteDatabase(AbstractContextManager):
         """
         # To Avoid an Attribute error on close after an exception
         self._db = None
+        self._in_transaction = False
         database_file = os.environ.get('C_LOGS_DICT', None)
         if database_file is None:
             script = sys.modules[self.__module__].__file__
@@ -72,9 +113,12 @@ class LogSqlLiteDatabase(AbstractContextManager):
 
         try:
             self._db = sqlite3.connect(database_file)
-            self.__init_db()
+            self.__init_db(os.access(database_file, os.W_OK))
             if new_dict:
                 self.__clear_db()
+        except SchemaVersionException:
+            self.close()
+            raise
         except Exception as ex:
             message = f"Error accessing c_logs_dict at {database_file}. "
             if 'C_LOGS_DICT' in os.environ:
@@ -104,19 +148,102 @@ class LogSqlLiteDatabase(AbstractContextManager):
             pass
         self._db = None
 
-    def __init_db(self):
+    @contextmanager
+    def transaction(self):
         """
-        Set up the database if required.
+        Groups all the changes made in the block into one transaction,
+        committed at the end or rolled back on an exception.
+
+        Calls to other methods in the block join this transaction rather
+        than committing their own, which is much faster when making many
+        changes such as converting a whole file.
+        Nested calls join the outermost transaction.
+        """
+        if self._in_transaction:
+            yield
+            return
+        self._in_transaction = True
+        try:
+            with self._db:
+                yield
+        finally:
+            self._in_transaction = False
+
+    def __init_db(self, writable):
+        """
+        Set up the database if required, or migrate it to the current
+        schema version.
+
+        :param bool writable: Whether the database file can be written to.
+            A database that can not be is read with the schema it has.
         """
         self._db.row_factory = sqlite3.Row
         # Don't use memoryview / buffer as hard to deal with difference
         self._db.text_factory = str
-        with open(_DDL_FILE, encoding="utf-8") as f:
-            sql = f.read()
-        self._db.executescript(sql)
+        # https://www.sqlite.org/pragma.html#pragma_synchronous
+        self._db.execute("PRAGMA main.synchronous = OFF")
+        version = self.__schema_version()
+        if version is not None and version > SCHEMA_VERSION:
+            raise SchemaVersionException(version)
+        if version == SCHEMA_VERSION or (version is not None and not writable):
+            return
+        # Another converter may be setting up or migrating the same file,
+        # so take the write lock and check the version again before
+        # changing anything.
+        self._db.execute("BEGIN IMMEDIATE")
+        try:
+            version = self.__schema_version()
+            if version is None:
+                with open(_DDL_FILE, encoding="utf-8") as f:
+                    self.__run_script(f.read())
+            elif version > SCHEMA_VERSION:
+                raise SchemaVersionException(version)
+            else:
+                for new_version in range(version + 1, SCHEMA_VERSION + 1):
+                    self.__run_script(_MIGRATIONS[new_version])
+            self._db.execute("DELETE FROM schema_version")
+            self._db.execute(
+                "INSERT INTO schema_version(version) VALUES(?)",
+                [SCHEMA_VERSION])
+            self._db.commit()
+        except Exception:
+            self._db.rollback()
+            raise
+
+    def __schema_version(self):
+        """
+        Gets the version of the schema of the database.
+
+        :return: The version, or `None` if the database is empty
+        :rtype: int or None
+        """
+        tables = {row["name"] for row in self._db.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'table'")}
+        if "schema_version" in tables:
+            for row in self._db.execute(
+                    "SELECT version FROM schema_version LIMIT 1"):
+                return row["version"]
+        if "log" in tables:
+            return 1
+        return None
+
+    def __run_script(self, sql):
+        """
+        Runs a script one statement at a time, so it joins the transaction
+        already started rather than committing it as
+        :py:meth:`sqlite3.Connection.executescript` would.
+
+        :param str sql: The script to run
+        """
+        statement = ""
+        for part in sql.split(";"):
+            statement += part + ";"
+            if sqlite3.complete_statement(statement):
+                self._db.execute(statement)
+                statement = ""
 
     def __clear_db(self):
-        with self._db:
+        with self.transaction():
             cursor = self._db.cursor()
             cursor.execute("DELETE FROM log")
             cursor.execute("UPDATE SQLITE_SEQUENCE SET SEQ=0 WHERE NAME='log'")
@@ -127,10 +254,16 @@ class LogSqlLiteDatabase(AbstractContextManager):
             cursor.execute(
                 "UPDATE SQLITE_SEQUENCE SET SEQ=0 WHERE NAME='directory'")
 
-    def get_directory_id(self, src_path, dest_path):
-        with self._db:
-            cursor = self._db.cursor()
-            # reuse the existing if it exists
+    def find_directory_id(self, src_path, dest_path):
+        """
+        Gets the ID of a directory without adding it.
+
+        :param str src_path: The source directory
+        :param str dest_path: The destination directory
+        :return: The ID, or `None` if the directory has not been added
+        :rtype: int or None
+        """
+        with self.transaction():
             for row in self._db.execute(
                     """
                     SELECT directory_id
@@ -139,8 +272,17 @@ class LogSqlLiteDatabase(AbstractContextManager):
                     LIMIT 1
                     """, [src_path, dest_path]):
                 return row["directory_id"]
+            return None
+
+    def get_directory_id(self, src_path, dest_path):
+        with self.transaction():
+            # reuse the existing if it exists
+            directory_id = self.find_directory_id(src_path, dest_path)
+            if directory_id is not None:
+                return directory_id
 
             # create a new number
+            cursor = self._db.cursor()
             cursor.execute(
                 """
                 INSERT INTO directory(src_path, dest_path)
@@ -148,27 +290,68 @@ class LogSqlLiteDatabase(AbstractContextManager):
                 """, (src_path, dest_path))
             return cursor.lastrowid
 
-    def get_file_id(self, directory_id, file_name):
-        with self._db:
-            # Make previous one as not last
-            with self._db:
-                cursor = self._db.cursor()
-                cursor.execute(
+    def get_unchanged_file_id(
+            self, directory_id, file_name, content_hash, content_size):
+        """
+        Gets the ID of the last build of a file if its source has not
+        changed since, so its logs are still current.
+
+        :param int directory_id: The ID of the directory of the file
+        :param str file_name: The name of the file
+        :param str content_hash: The hash of the source now
+        :param int content_size: The size of the source now, in bytes
+        :return: The ID of the last build, or `None` if the source changed
+        :rtype: int or None
+        """
+        with self.transaction():
+            for row in self._db.execute(
                     """
-                    UPDATE file SET last_build = 0
+                    SELECT file_id
+                    FROM file
                     WHERE directory_id = ? AND file_name = ?
-                    """, [directory_id, file_name])
-                # always create new one to distinguish new from old logs
-                cursor.execute(
-                    """
-                    INSERT INTO file(
-                        directory_id, file_name, convert_time, last_build)
-                    VALUES(?, ?, ?, 1)
-                    """, (directory_id, file_name, _timestamp()))
-                return cursor.lastrowid
+                        AND last_build = 1
+                        AND content_hash = ? AND content_size = ?
+                    LIMIT 1
+                    """, (directory_id, file_name, content_hash,
+                          content_size)):
+                return row["file_id"]
+            return None
+
+    def get_file_id(self, directory_id, file_name, content_hash=None,
+                    content_size=None):
+        """
+        Adds a new build of a file.
+
+        :param int directory_id: The ID of the directory of the file
+        :param str file_name: The name of the file
+        :param content_hash: The hash of the source, if known
+        :type content_hash: str or None
+        :param content_size: The size of the source in bytes, if known
+        :type content_size: int or None
+        :return: The ID of the new build
+        :rtype: int
+        """
+        with self.transaction():
+            cursor = self._db.cursor()
+            # Make previous one as not last
+            cursor.execute(
+                """
+                UPDATE file SET last_build = 0
+                WHERE directory_id = ? AND file_name = ?
+                """, [directory_id, file_name])
+            # always create new one to distinguish new from old logs
+            cursor.execute(
+                """
+                INSERT INTO file(
+                    directory_id, file_name, convert_time, last_build,
+                    content_hash, content_size)
+                VALUES(?, ?, ?, 1, ?, ?)
+                """, (directory_id, file_name, _timestamp(), content_hash,
+                      content_size))
+            return cursor.lastrowid
 
     def set_log_info(self, log_level, line_num, original, file_id):
-        with self._db:
+        with self.transaction():
             cursor = self._db.cursor()
             # reuse the existing number if nothing has changed
             cursor.execute(
@@ -198,7 +381,7 @@ class LogSqlLiteDatabase(AbstractContextManager):
                     return row["log_id"]
 
     def get_log_info(self, log_id):
-        with self._db:
+        with self.transaction():
             for row in self._db.execute(
                     """
                     SELECT log_level, file_name, line_num , original
@@ -209,8 +392,37 @@ class LogSqlLiteDatabase(AbstractContextManager):
                 return (row["log_level"], row["file_name"], row["line_num"],
                         row["original"])
 
+    def get_all_log_info(self):
+        """
+        Gets the information on every log of the current build, as
+        :py:meth:`get_log_info` would for each.
+
+        :return: The level, file name, line number and original message
+            of each log, by log ID
+        :rtype: dict(int, tuple(int, str, int, str))
+        """
+        with self.transaction():
+            return {
+                row["log_id"]: (row["log_level"], row["file_name"],
+                                row["line_num"], row["original"])
+                for row in self._db.execute(
+                    """
+                    SELECT log_id, log_level, file_name, line_num, original
+                    FROM current_file_view
+                    """)}
+
+    def get_data_version(self):
+        """
+        Gets a value that changes whenever the database is changed, by this
+        connection or any other.
+
+        :rtype: tuple(int, int)
+        """
+        for row in self._db.execute("PRAGMA data_version"):
+            return (row[0], self._db.total_changes)
+
     def check_original(self, original):
-        with self._db:
+        with self.transaction():
             for row in self._db.execute(
                     """
                     SELECT COUNT(log_id) as "counts"
@@ -221,7 +433,7 @@ class LogSqlLiteDatabase(AbstractContextManager):
                     raise ValueError(f"{original} not found in database")
 
     def get_max_log_id(self):
-        with self._db:
+        with self.transaction():
             for row in self._db.execute(
                     """
                     SELECT MAX(log_id) AS "max_id"
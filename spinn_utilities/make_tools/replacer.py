@@ -12,9 +12,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from itertools import chain, islice, repeat
 import logging
+import re
 import struct
 import sys
+import numpy
 from spinn_utilities.log import FormatAdapter
 from .file_converter import FORMAT_EXP
 from .file_converter import TOKEN
@@ -27,22 +30,235 @@ LEVELS = {10: "[DEBUG]",
           30: "[WARN]",
           40: "[ERROR]"}
 
+#: The most lines :py:meth:`Replacer.replace_lines` reads ahead by default
+CHUNK_SIZE = 1000
+
+
+_INT_FMT = struct.Struct("!I")
+_FLT_FMT = struct.Struct("!f")
+_DBL_FMT = struct.Struct("!d")
+
+# The kinds of slot in a template
+_PLAIN = 0
+_FLOAT = 1
+_DOUBLE = 2
+
+
+def _hex_to_float(hex_str):
+    return _FLT_FMT.unpack(_INT_FMT.pack(int(hex_str, 16)))[0]
+
+
+def _hexes_to_double(upper, lower):
+    return _DBL_FMT.unpack(
+        _INT_FMT.pack(int(upper, 16)) + _INT_FMT.pack(int(lower, 16)))[0]
+
+
+def _hexes_to_bits(hexes):
+    """
+    Reads many 32-bit words, failing where :py:func:`_hex_to_float` would
+    fail on any of them.
+
+    :param list(str) hexes: The words in hexadecimal
+    :rtype: ~numpy.ndarray
+    """
+    bits = list(map(int, hexes, repeat(16)))
+    if bits and (min(bits) < 0 or max(bits) > 0xFFFFFFFF):
+        raise ValueError("Not a 32-bit word")
+    return numpy.array(bits, dtype=numpy.uint32)
+
+
+def _to_text(values):
+    """
+    Converts many floats to text at once, converting each distinct value
+    only once, as logs tend to repeat values.
+
+    :param ~numpy.ndarray values: The values, as float64
+    :rtype: list(str)
+    """
+    # Compare the bits, so that NaNs and -0.0 are kept apart
+    distinct, inverse = numpy.unique(
+        values.view(numpy.uint64), return_inverse=True)
+    texts = numpy.array(
+        list(map(str, distinct.view(numpy.float64).tolist())), dtype=object)
+    return texts[inverse.ravel()].tolist()
+
+
+def _hexes_to_floats(hexes):
+    """
+    Converts many 32-bit words to the text of the floats they hold, at once.
+
+    :param list(str) hexes: The words in hexadecimal
+    :rtype: list(str)
+    """
+    # Widening a signalling NaN is "invalid" but gives the same NaN
+    with numpy.errstate(invalid="ignore"):
+        return _to_text(_hexes_to_bits(hexes).view(numpy.float32).astype(
+            numpy.float64))
+
+
+def _hexes_to_doubles(uppers, lowers):
+    """
+    Converts many pairs of 32-bit words to the text of the doubles they
+    hold, at once.
+
+    :param list(str) uppers: The upper words in hexadecimal
+    :param list(str) lowers: The lower words in hexadecimal
+    :rtype: list(str)
+    """
+    bits = _hexes_to_bits(uppers).astype(numpy.uint64) << numpy.uint64(32)
+    bits |= _hexes_to_bits(lowers)
+    return _to_text(bits.view(numpy.float64))
+
+
+class _Template(object):
+    """
+    An original log message compiled once into the literal text between
+    its formats, and where to get the value for each format.
+
+    .. note::
+        Values are put into the literal text and are not searched again.
+        Before templates, each format replaced the first copy of its text
+        in the message so far, so a value that itself looked like a format
+        could be replaced by a later value. For example ``"%s and %d"``
+        with the values ``"%d"`` and ``"5"`` now gives ``"%d and 5"``
+        where it used to give ``"5 and %d"``.
+    """
+
+    __slots__ = [
+        # The message with escapes decoded, used when there are no values
+        "_text",
+        # The literal text before the first value
+        "_first",
+        # The literal text after each value
+        "_after",
+        # For each value in the text, its index in the plain values, then
+        # the float values, then the double values
+        "_order",
+        # The index of the part holding each plain value
+        "_plain",
+        # The index of the part holding each float value
+        "_floats",
+        # The index of the first of the parts holding each double value
+        "_doubles",
+        # The number of parts needed for all the values
+        "_n_parts"]
+
+    def __init__(self, original):
+        """
+        :param str original: The original log message
+        """
+        self._text = original.encode("latin-1").decode("unicode_escape")
+        # Each format replaces the first copy of its text left in the
+        # message; a mark, in place of the value, records where that is.
+        mark = next(chr(code) for code in range(0xE000, 0xF900)
+                    if chr(code) not in self._text)
+        marked = self._text
+        slots = []
+        # Start at 0 so first i+1 puts you at 1 as part 0 is the short
+        i = 0
+        for match in FORMAT_EXP.findall(original):
+            # Remove any blanks due to double spacing
+            if match == "":
+                continue
+            i += 1
+            marked = marked.replace(match, f"{mark}{len(slots)}{mark}", 1)
+            if match.endswith("f"):
+                slots.append((_FLOAT, i))
+            elif match.endswith("F"):
+                slots.append((_DOUBLE, i))
+                i += 1
+            else:
+                slots.append((_PLAIN, i))
+        self._n_parts = i + 1
+        self._plain = [i for kind, i in slots if kind == _PLAIN]
+        self._floats = [i for kind, i in slots if kind == _FLOAT]
+        self._doubles = [i for kind, i in slots if kind == _DOUBLE]
+        by_kind = sorted(range(len(slots)), key=lambda slot: slots[slot][0])
+        position = {slot: index for index, slot in enumerate(by_kind)}
+        pieces = re.split(f"{mark}(\\d+){mark}", marked)
+        self._first = pieces[0]
+        self._after = pieces[2::2]
+        self._order = [position[int(slot)] for slot in pieces[1::2]]
+
+    def collect(self, parts, floats, uppers, lowers):
+        """
+        Adds the words of each float and double value of a short message
+        to lists, so all of them can be converted at once.
+
+        :param list(str) parts: The parts of the short message
+        :param list(str) floats: Where to add the word of each float
+        :param list(str) uppers: Where to add the upper word of each double
+        :param list(str) lowers: Where to add the lower word of each double
+        :raises IndexError:
+            If there are too few parts for the formats, having added nothing
+        """
+        if len(parts) == 1:
+            return
+        if len(parts) < self._n_parts:
+            raise IndexError("Too few parts")
+        floats.extend([parts[i] for i in self._floats])
+        uppers.extend([parts[i] for i in self._doubles])
+        lowers.extend([parts[i + 1] for i in self._doubles])
+
+    def format(self, parts, floats=None, doubles=None):
+        """
+        Puts the values of a short message into the template.
+
+        :param list(str) parts: The parts of the short message
+        :param floats: The text of the float values converted from the
+            words from :py:meth:`collect`, or `None` to convert them here
+        :type floats: iterator(str) or None
+        :param doubles: The text of the double values converted from the
+            words from :py:meth:`collect`, or `None` to convert them here
+        :type doubles: iterator(str) or None
+        :return: The expanded message
+        :rtype: str
+        :raises Exception: If the parts do not fit the formats
+        """
+        if len(parts) == 1:
+            return self._text
+        values = [parts[i] for i in self._plain]
+        if floats is None:
+            values.extend([
+                str(_hex_to_float(parts[i])) for i in self._floats])
+        else:
+            values.extend(islice(floats, len(self._floats)))
+        if doubles is None:
+            values.extend([
+                str(_hexes_to_double(parts[i], parts[i + 1]))
+                for i in self._doubles])
+        else:
+            values.extend(islice(doubles, len(self._doubles)))
+        return self._first + "".join(chain.from_iterable(
+            zip(map(values.__getitem__, self._order), self._after)))
+
 
 class Replacer(LogSqlLiteDatabase):
     """
     Performs replacements.
-    """
 
-    def __enter__(self):
-        return self
+    The log dictionary is read into memory on first use. It is read again
+    if the database has changed when an unknown log ID is met, or
+    when :py:meth:`refresh` is called.
+    """
 
-    def __exit__(self, exc_type, exc_value, exc_traceback):
-        # nothing yet
-        pass
+    __slots__ = [
+        # The information on each log of the current build, by log ID
+        "_log_infos",
+        # The version of the database the log information was read from
+        "_data_version",
+        # The compiled template of each original message used so far
+        "_templates"]
 
-    _INT_FMT = struct.Struct("!I")
-    _FLT_FMT = struct.Struct("!f")
-    _DBL_FMT = struct.Struct("!d")
+    def __init__(self, new_dict=False):
+        """
+        :param bool new_dict: Flag to say if this is a new dict or not.
+            See :py:class:`LogSqlLiteDatabase`.
+        """
+        self._log_infos = None
+        self._data_version = None
+        self._templates = {}
+        super().__init__(new_dict)
 
     def _replace(self, short):
         """
@@ -52,36 +268,113 @@ class Replacer(LogSqlLiteDatabase):
         :return: The expanded message.
         :rtype: str
         """
+        found = self._find(short)
+        if found is None:
+            return None
+        (log_level, file_name, line_num, template, parts) = found
+        try:
+            replaced = template.format(parts)
+        except Exception:  # pylint: disable=broad-except
+            return None
+        return (log_level, file_name, line_num, replaced)
+
+    def _find(self, short):
+        """
+        Finds the log and template of a short message.
+
+        :param str short: The short message
+        :return: The log level, file name, line number and template of the
+            log, and the parts of the message; or `None` if not a known log
+        :rtype: tuple(int, str, int, _Template, list(str)) or None
+        """
         parts = short.split(TOKEN)
         if not parts[0].isdigit():
             return None
-        data = self.get_log_info(parts[0])
+        data = self._get_log_info(parts[0])
         if data is None:
             return None
         (log_level, file_name, line_num, original) = data
 
-        replaced = original.encode("latin-1").decode("unicode_escape")
-        if len(parts) > 1:
-            matches = FORMAT_EXP.findall(original)
-            # Remove any blanks due to double spacing
-            matches = [x for x in matches if x != ""]
-            # Start at 0 so first i+1 puts you at 1 as part 0 is the short
-            i = 0
-            try:
-                for match in matches:
-                    i += 1
-                    if match.endswith("f"):
-                        replacement = str(self._hex_to_float(parts[i]))
-                    elif match.endswith("F"):
-                        replacement = str(self._hexes_to_double(
-                            parts[i], parts[i+1]))
-                        i += 1
-                    else:
-                        replacement = parts[i]
-                    replaced = replaced.replace(match, replacement, 1)
-            except Exception:  # pylint: disable=broad-except
-                return None
-        return (log_level, file_name, line_num, replaced)
+        template = self._templates.get(original)
+        if template is None:
+            template = _Template(original)
+            self._templates[original] = template
+        return (log_level, file_name, line_num, template, parts)
+
+    def _replace_all(self, shorts):
+        """
+        Applies the replacements to many short messages, converting all
+        their float and double values at once.
+
+        :param list(str) shorts: The short messages
+        :return: The expanded messages, as :py:meth:`replace` gives
+        :rtype: list(str)
+        """
+        floats = []
+        uppers = []
+        lowers = []
+        found_all = []
+        for short in shorts:
+            found = self._find(short)
+            if found is not None:
+                try:
+                    found[3].collect(found[4], floats, uppers, lowers)
+                except IndexError:
+                    found = None
+            found_all.append(found)
+        try:
+            floats = iter(_hexes_to_floats(floats))
+            doubles = iter(_hexes_to_doubles(uppers, lowers))
+        except ValueError:
+            # Some value is not a word; leave finding which to replace()
+            return [self.replace(short) for short in shorts]
+        replaced_all = []
+        for short, found in zip(shorts, found_all):
+            if found is None:
+                replaced_all.append(short)
+            else:
+                (log_level, file_name, line_num, template, parts) = found
+                replaced = template.format(parts, floats, doubles)
+                replaced_all.append(
+                    f"{LEVELS[log_level]} ({file_name}: {line_num}): "
+                    f"{replaced}")
+        return replaced_all
+
+    def _get_log_info(self, log_id):
+        """
+        Gets the information on a log from the dictionary in memory.
+
+        :param str log_id: The ID of the log
+        :return: The level, file name, line number and original message,
+            or `None` if there is no such log
+        :rtype: tuple(int, str, int, str) or None
+        """
+        try:
+            log_id = int(log_id)
+        except ValueError:
+            return None
+        if self._log_infos is None:
+            self.refresh()
+        data = self._log_infos.get(log_id)
+        if data is None and self.refresh():
+            data = self._log_infos.get(log_id)
+        return data
+
+    def refresh(self):
+        """
+        Reads the log dictionary into memory again if the database has
+        changed since it was last read.
+
+        :return: Whether the dictionary was read again
+        :rtype: bool
+        """
+        data_version = self.get_data_version()
+        if self._log_infos is not None and data_version == self._data_version:
+            return False
+        self._log_infos = self.get_all_log_info()
+        self._data_version = data_version
+        self._templates.clear()
+        return True
 
     def replace(self, short):
         data = self._replace(short)
@@ -90,14 +383,36 @@ class Replacer(LogSqlLiteDatabase):
         (log_level, file_name, line_num, replaced) = data
         return f"{LEVELS[log_level]} ({file_name}: {line_num}): {replaced}"
 
+    def replace_lines(self, lines, chunk_size=CHUNK_SIZE):
+        """
+        Expands each line of an IOBUF, as :py:meth:`replace` does, keeping
+        the line ends.
+
+        The lines are read a chunk at a time, so at most `chunk_size` are
+        held at once, and the dictionary is checked for changes before each
+        chunk.
+
+        :param iterable(str) lines: The lines, such as an open file
+        :param int chunk_size: The most lines to read ahead
+        :return: The expanded lines
+        :rtype: iterable(str)
+        """
+        lines = iter(lines)
+        while True:
+            chunk = list(islice(lines, chunk_size))
+            if not chunk:
+                return
+            self.refresh()
+            shorts = [text.rstrip("\r\n") for text in chunk]
+            for text, short, replaced in zip(
+                    chunk, shorts, self._replace_all(shorts)):
+                yield replaced + text[len(short):]
+
     def _hex_to_float(self, hex_str):
-        return self._FLT_FMT.unpack(
-            self._INT_FMT.pack(int(hex_str, 16)))[0]
+        return _hex_to_float(hex_str)
 
     def _hexes_to_double(self, upper, lower):
-        return self._DBL_FMT.unpack(
-            self._INT_FMT.pack(int(upper, 16)) +
-            self._INT_FMT.pack(int(lower, 16)))[0]
+        return _hexes_to_double(upper, lower)
 
 
 if __name__ == '__main__':
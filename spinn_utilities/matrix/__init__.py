@@ -14,8 +14,12 @@
 
 from .abstract_matrix import AbstractMatrix
 from .demo_matrix import DemoMatrix
+from .dense_matrix import DenseMatrix
 from .double_dict import DoubleDict
+from .sparse_matrix import SparseMatrix
 from .x_view import XView
 from .y_view import YView
 
-__all__ = ["AbstractMatrix", "DemoMatrix", "DoubleDict", "XView", "YView"]
+__all__ = [
+    "AbstractMatrix", "DemoMatrix", "DenseMatrix", "DoubleDict",
+    "SparseMatrix", "XView", "YView"]
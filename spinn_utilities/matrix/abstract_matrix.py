@@ -12,9 +12,28 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import numpy
 from spinn_utilities.abstract_base import AbstractBase, abstractmethod
 
 
+def _keys_and_values(keys, values):
+    """
+    Gets the keys and values of a row or column given either as a mapping
+    or as keys and values in matching order.
+
+    :raises ValueError: If the keys and values are different lengths
+    """
+    if values is None:
+        values = [keys[key] for key in keys]
+        keys = list(keys)
+    elif isinstance(keys, numpy.ndarray):
+        keys = keys.tolist()
+    if len(keys) != len(values):
+        raise ValueError(
+            f"There are {len(keys)} keys but {len(values)} values")
+    return keys, values
+
+
 class AbstractMatrix(object, metaclass=AbstractBase):
     """
     A rectangular 2D collection of data.
@@ -32,3 +51,67 @@ class AbstractMatrix(object, metaclass=AbstractBase):
         """
         Set the value at a particular X,Y coordinate.
         """
+
+    def get_row(self, x):
+        """
+        Get the Y coordinates and values held for one X coordinate.
+
+        Implementations that can list the values they hold should override
+        this to serve the whole row in one call.
+
+        :param x: The X coordinate
+        :return: The Y coordinates, and the values in the same order
+        :rtype: tuple(list, list or ~numpy.ndarray)
+        :raises NotImplementedError: If the matrix can not list its values
+        """
+        raise NotImplementedError(
+            f"{type(self).__name__} can not list the values in a row")
+
+    def get_column(self, y):
+        """
+        Get the X coordinates and values held for one Y coordinate.
+
+        Implementations that can list the values they hold should override
+        this to serve the whole column in one call.
+
+        :param y: The Y coordinate
+        :return: The X coordinates, and the values in the same order
+        :rtype: tuple(list, list or ~numpy.ndarray)
+        :raises NotImplementedError: If the matrix can not list its values
+        """
+        raise NotImplementedError(
+            f"{type(self).__name__} can not list the values in a column")
+
+    def set_row(self, x, ys, values=None):
+        """
+        Set the values at several Y coordinates for one X coordinate.
+
+        Implementations should override this if they can set many values
+        more cheaply than by calling :py:meth:`set_data` for each.
+
+        :param x: The X coordinate
+        :param ys: The Y coordinates, or a mapping from Y coordinate to
+            value if ``values`` is not given
+        :param values: The values, in the same order as ``ys``
+        :raises ValueError: If ``ys`` and ``values`` are different lengths
+        """
+        ys, values = _keys_and_values(ys, values)
+        for y, value in zip(ys, values):
+            self.set_data(x, y, value)
+
+    def set_column(self, y, xs, values=None):
+        """
+        Set the values at several X coordinates for one Y coordinate.
+
+        Implementations should override this if they can set many values
+        more cheaply than by calling :py:meth:`set_data` for each.
+
+        :param y: The Y coordinate
+        :param xs: The X coordinates, or a mapping from X coordinate to
+            value if ``values`` is not given
+        :param values: The values, in the same order as ``xs``
+        :raises ValueError: If ``xs`` and ``values`` are different lengths
+        """
+        xs, values = _keys_and_values(xs, values)
+        for x, value in zip(xs, values):
+            self.set_data(x, y, value)
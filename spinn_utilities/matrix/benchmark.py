@@ -0,0 +1,182 @@
+# Copyright (c) 2023 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Benchmarks comparing the memory and speed of the matrix implementations.
+
+For example::
+
+    python -m spinn_utilities.matrix.benchmark --sizes 100 1000 \
+        --densities 0.001 0.01 --output matrix.json
+"""
+
+import argparse
+import random
+import statistics
+import sys
+import tracemalloc
+from spinn_utilities.benchmark_utils import (
+    describe_environment, time_operation, write_results)
+from .demo_matrix import DemoMatrix
+from .dense_matrix import DenseMatrix
+from .sparse_matrix import SparseMatrix
+
+#: The numbers of X and of Y keys benchmarked by default
+SIZES = (100, 1000, 3000)
+
+#: The fractions of the cells set benchmarked by default
+DENSITIES = (0.001, 0.01, 0.1)
+
+#: The number of rows and columns read by the read benchmarks
+READS = 10
+
+
+def _demo_column(matrix, keys, y):
+    values = []
+    for x in keys:
+        try:
+            values.append(matrix.get_data(x, y))
+        except KeyError:
+            pass
+    return values
+
+
+#: How to make each matrix from its keys, and read a row and a column
+MATRICES = {
+    "demo": (
+        lambda keys: DemoMatrix(),
+        lambda matrix, keys, x: list(matrix.data[x].items()),
+        _demo_column),
+    "dense": (
+        lambda keys: DenseMatrix(keys, keys),
+        lambda matrix, keys, x: matrix.row_array(x),
+        lambda matrix, keys, y: matrix.column_array(y)),
+    "sparse": (
+        lambda keys: SparseMatrix(),
+        lambda matrix, keys, x: list(matrix.iter_row(x)),
+        lambda matrix, keys, y: list(matrix.iter_column(y))),
+}
+
+
+def _cells(size, density, seed):
+    rng = random.Random(seed)
+    count = max(1, int(size * size * density))
+    cells = rng.sample(range(size * size), count)
+    return [(cell // size, cell % size, rng.randrange(1000)) for cell in cells]
+
+
+def _benchmark(name, size, density, repeat, seed):
+    make, read_row, read_column = MATRICES[name]
+    keys = range(size)
+    cells = _cells(size, density, seed)
+    rng = random.Random(seed)
+    lines = rng.sample(keys, min(READS, size))
+
+    def build():
+        matrix = make(keys)
+        for (x, y, value) in cells:
+            # Each cell gets a new float, as it would in real use
+            matrix.set_data(x, y, value * 0.5)
+        # A first read makes sure any build work has been done
+        matrix.get_data(cells[0][0], cells[0][1])
+        return matrix
+
+    # Memory is traced in a build of its own as tracing slows building
+    tracemalloc.start()
+    matrix = build()
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    build_times = time_operation(lambda: build, repeat)
+
+    def read(operation):
+        for line in lines:
+            operation(matrix, keys, line)
+
+    def timed(operation):
+        times = time_operation(lambda: lambda: read(operation), repeat)
+        return min(times), statistics.median(times)
+
+    row, row_median = timed(read_row)
+    column, column_median = timed(read_column)
+    return {
+        "matrix": name, "size": size, "density": density,
+        "cells": len(cells), "memory": memory,
+        "build": min(build_times), "build_median": statistics.median(
+            build_times),
+        "row": row, "row_median": row_median,
+        "column": column, "column_median": column_median}
+
+
+def run_benchmarks(
+        sizes=SIZES, densities=DENSITIES, matrices=tuple(MATRICES),
+        repeat=3, seed=0, log=None):
+    """
+    Runs the benchmarks.
+
+    :param iterable(int) sizes: The numbers of X and of Y keys
+    :param iterable(float) densities: The fractions of the cells to set
+    :param iterable(str) matrices: The keys of :py:data:`MATRICES` to run
+    :param int repeat: How many times to time each benchmark
+    :param int seed: Seed for choosing the cells and values
+    :param log: Where to report progress, if anywhere
+    :type log: ~io.TextIOBase or None
+    :return: The results, ready to be written as JSON
+    :rtype: dict
+    """
+    results = []
+    for size in sizes:
+        for density in densities:
+            for name in matrices:
+                result = _benchmark(name, size, density, repeat, seed)
+                results.append(result)
+                if log is not None:
+                    log.write(
+                        f"{name:6} {size:>6} {density:<6} "
+                        f"{result['memory']:>12}B build {result['build']:.4f}s"
+                        f" row {result['row']:.6f}s "
+                        f"column {result['column']:.6f}s\n")
+    return describe_environment(repeat=repeat, seed=seed, results=results)
+
+
+def main(arguments=None):
+    """
+    Command line interface.
+
+    :param list(str) arguments: Command line arguments.
+    """
+    parser = argparse.ArgumentParser(
+        description="Benchmark the matrix implementations")
+    parser.add_argument(
+        "--sizes", nargs="+", type=int, default=SIZES,
+        help="The numbers of X and of Y keys")
+    parser.add_argument(
+        "--densities", nargs="+", type=float, default=DENSITIES,
+        help="The fractions of the cells to set")
+    parser.add_argument(
+        "--matrices", nargs="+", choices=tuple(MATRICES),
+        default=tuple(MATRICES))
+    parser.add_argument(
+        "--repeat", type=int, default=3, help="Times to run each benchmark")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="File to write the results to")
+    args = parser.parse_args(arguments)
+
+    results = run_benchmarks(
+        args.sizes, args.densities, args.matrices, args.repeat, args.seed,
+        sys.stderr)
+    write_results(results, args.output)
+
+
+if __name__ == "__main__":
+    main()  # pragma: no cover
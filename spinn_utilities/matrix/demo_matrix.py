@@ -14,7 +14,7 @@
 
 from collections import defaultdict
 from spinn_utilities.overrides import overrides
-from .abstract_matrix import AbstractMatrix
+from .abstract_matrix import AbstractMatrix, _keys_and_values
 
 
 class DemoMatrix(AbstractMatrix):
@@ -31,3 +31,18 @@ class DemoMatrix(AbstractMatrix):
     @overrides(AbstractMatrix.set_data)
     def set_data(self, x, y, value):
         self.data[x][y] = value
+
+    @overrides(AbstractMatrix.set_row)
+    def set_row(self, x, ys, values=None):
+        ys, values = _keys_and_values(ys, values)
+        self.data[x].update(zip(ys, values))
+
+    @overrides(AbstractMatrix.get_row)
+    def get_row(self, x):
+        row = self.data.get(x, {})
+        return list(row.keys()), list(row.values())
+
+    @overrides(AbstractMatrix.get_column)
+    def get_column(self, y):
+        xs = [x for x, row in self.data.items() if y in row]
+        return xs, [self.data[x][y] for x in xs]
@@ -0,0 +1,141 @@
+# Copyright (c) 2023 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy
+from spinn_utilities.overrides import overrides
+from .abstract_matrix import AbstractMatrix, _keys_and_values
+
+
+def _index(keys, name):
+    index = {key: i for i, key in enumerate(keys)}
+    if len(index) != len(keys):
+        raise ValueError(f"The {name} keys must be unique")
+    return index
+
+
+class DenseMatrix(AbstractMatrix):
+    """
+    A matrix with a fixed set of X and Y keys, held as a 2D NumPy array.
+
+    Each key is mapped to an index into the array, so reading or writing a
+    cell does not box it in nested dictionaries.
+    Cells that have not been set hold the fill value.
+    """
+    __slots__ = [
+        "_data", "_x_index", "_x_keys", "_y_index", "_y_keys"]
+
+    def __init__(self, x_keys, y_keys, dtype=numpy.float64, fill_value=0):
+        """
+        :param iterable x_keys: The X keys, in the order of the array rows
+        :param iterable y_keys:
+            The Y keys, in the order of the array columns
+        :param dtype: The type of the values held
+        :type dtype: ~numpy.dtype or type
+        :param fill_value: The value of cells that have not been set
+        :raises ValueError: If a key is repeated
+        """
+        self._x_keys = tuple(x_keys)
+        self._y_keys = tuple(y_keys)
+        self._x_index = _index(self._x_keys, "X")
+        self._y_index = _index(self._y_keys, "Y")
+        self._data = numpy.full(
+            (len(self._x_keys), len(self._y_keys)), fill_value, dtype=dtype)
+
+    @property
+    def x_keys(self):
+        """
+        The X keys in the order of the rows of the array.
+
+        :rtype: tuple
+        """
+        return self._x_keys
+
+    @property
+    def y_keys(self):
+        """
+        The Y keys in the order of the columns of the array.
+
+        :rtype: tuple
+        """
+        return self._y_keys
+
+    @property
+    def array(self):
+        """
+        The array holding the data, indexed by X and then Y.
+
+        .. note::
+            This is not a copy so writes to it change the matrix.
+
+        :rtype: ~numpy.ndarray
+        """
+        return self._data
+
+    @overrides(AbstractMatrix.get_data)
+    def get_data(self, x, y):
+        return self._data.item(self._x_index[x], self._y_index[y])
+
+    @overrides(AbstractMatrix.set_data)
+    def set_data(self, x, y, value):
+        self._data[self._x_index[x], self._y_index[y]] = value
+
+    @overrides(AbstractMatrix.set_row)
+    def set_row(self, x, ys, values=None):
+        ys, values = _keys_and_values(ys, values)
+        self._data[self._x_index[x], [self._y_index[y] for y in ys]] = values
+
+    @overrides(AbstractMatrix.set_column)
+    def set_column(self, y, xs, values=None):
+        xs, values = _keys_and_values(xs, values)
+        self._data[[self._x_index[x] for x in xs], self._y_index[y]] = values
+
+    @overrides(AbstractMatrix.get_row)
+    def get_row(self, x):
+        """
+        .. note::
+            The values are a view, as from :py:meth:`row_array`.
+        """
+        return list(self._y_keys), self.row_array(x)
+
+    @overrides(AbstractMatrix.get_column)
+    def get_column(self, y):
+        """
+        .. note::
+            The values are a view, as from :py:meth:`column_array`.
+        """
+        return list(self._x_keys), self.column_array(y)
+
+    def row_array(self, x):
+        """
+        The values for one X key, in the order of :py:attr:`y_keys`.
+
+        .. note::
+            This is a view, not a copy, so writes to it change the matrix.
+
+        :param x: An X key
+        :rtype: ~numpy.ndarray
+        """
+        return self._data[self._x_index[x]]
+
+    def column_array(self, y):
+        """
+        The values for one Y key, in the order of :py:attr:`x_keys`.
+
+        .. note::
+            This is a view, not a copy, so writes to it change the matrix.
+
+        :param y: A Y key
+        :rtype: ~numpy.ndarray
+        """
+        return self._data[:, self._y_index[y]]
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import numpy
 from .x_view import XView
 from .y_view import YView
 
@@ -32,24 +33,42 @@ class DoubleDict(object):
             return YView(y=key, matrix=self._matrix)
         raise KeyError(f"Key {key} has an unexpected type")
 
+    @staticmethod
+    def _check_keys(keys, key_type):
+        if isinstance(keys, numpy.ndarray) and keys.dtype.kind != "O":
+            # Every key in the array has the same type, so check one
+            correct = len(keys) == 0 or isinstance(
+                keys[:1].tolist()[0], key_type)
+        else:
+            correct = all(isinstance(key, key_type) for key in keys)
+        if not correct:
+            raise ValueError(
+                f"All keys in the value must be of type {key_type}")
+
     def __setitem__(self, key, value):
-        try:
-            if isinstance(key, self._xtype):
-                correct = all(isinstance(y, self._ytype) for y in value.keys())
-                if not correct:
-                    raise ValueError(
-                        f"All keys in the value must be of type {self._ytype}")
-                for y in value.keys():
-                    self._matrix.set_data(x=key, y=y, value=value[y])
-            elif isinstance(key, self._ytype):
-                correct = all(isinstance(x, self._xtype) for x in value.keys())
-                if not correct:
-                    raise ValueError(
-                        f"All keys in the value must be of type {self._xtype}")
-                for x in value.keys():
-                    self._matrix.set_data(x=x, y=key, value=value[x])
-            else:
-                raise KeyError(f"Key {key} has an unexpected type")
-        except AttributeError as e:
-            raise ValueError("Value must of type dict. Or at least "
-                             "implement keys() and __getitem__") from e
+        """
+        Sets a whole row or column.
+
+        :param key: An X or Y key
+        :param value: A dict from the other keys to the values, or a tuple
+            of the other keys and the values in the same order
+        """
+        if isinstance(key, self._xtype):
+            key_type, set_line = self._ytype, self._matrix.set_row
+        elif isinstance(key, self._ytype):
+            key_type, set_line = self._xtype, self._matrix.set_column
+        else:
+            raise KeyError(f"Key {key} has an unexpected type")
+        if isinstance(value, tuple) and len(value) == 2:
+            keys, values = value
+        else:
+            try:
+                keys = list(value.keys())
+                values = [value[other] for other in keys]
+            except AttributeError as e:
+                raise ValueError(
+                    "Value must of type dict. Or at least implement keys() "
+                    "and __getitem__. Or be a tuple of keys and values") \
+                    from e
+        self._check_keys(keys, key_type)
+        set_line(key, keys, values)
@@ -0,0 +1,280 @@
+# Copyright (c) 2023 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy
+from spinn_utilities.overrides import overrides
+from .abstract_matrix import AbstractMatrix, _keys_and_values
+
+#: The type used to hold indexes into the keys and cells
+_INDEX = numpy.int32
+
+
+def _key_indexes(index, keys, new_keys):
+    """
+    Gets the index of each key, adding any keys that are new.
+    """
+    indexes = []
+    for key in new_keys:
+        position = index.get(key)
+        if position is None:
+            position = index[key] = len(keys)
+            keys.append(key)
+        indexes.append(position)
+    return indexes
+
+
+class SparseMatrix(AbstractMatrix):
+    """
+    A matrix that only holds the cells that have been set, for tables
+    where most cells are empty.
+    Reading a cell that has not been set gives the fill value.
+
+    New cells are collected in coordinate (COO) form, so setting many cells
+    is cheap. The next read sorts them in one pass into compressed sparse
+    row (CSR) form, along with the order of the cells by column (CSC), so
+    that a whole row or column is read in time proportional to the number
+    of cells held in it. Setting a cell that is already held updates it
+    in place, unless other cells are waiting to be sorted in.
+    """
+    __slots__ = [
+        "_column_order", "_column_starts", "_columns", "_dtype",
+        "_fill_value", "_new_columns", "_new_rows", "_new_values",
+        "_row_starts", "_values", "_x_index", "_x_keys",
+        "_y_index", "_y_keys"]
+
+    def __init__(self, dtype=numpy.float64, fill_value=0):
+        """
+        :param dtype: The type of the values held
+        :type dtype: ~numpy.dtype or type
+        :param fill_value: The value of cells that have not been set
+        """
+        self._dtype = numpy.dtype(dtype)
+        self._fill_value = fill_value
+        self._x_index = dict()
+        self._x_keys = []
+        self._y_index = dict()
+        self._y_keys = []
+        # Cells set since the last freeze, as indexes into the keys
+        self._new_rows = []
+        self._new_columns = []
+        self._new_values = []
+        # Frozen cells sorted by row and then column
+        self._columns = numpy.zeros(0, dtype=_INDEX)
+        self._values = numpy.zeros(0, dtype=self._dtype)
+        self._row_starts = numpy.zeros(1, dtype=numpy.intp)
+        # Indexes of the frozen cells sorted by column and then row
+        self._column_order = numpy.zeros(0, dtype=_INDEX)
+        self._column_starts = numpy.zeros(1, dtype=numpy.intp)
+
+    @property
+    def x_keys(self):
+        """
+        The X keys of the cells set, in the order first used.
+
+        :rtype: tuple
+        """
+        return tuple(self._x_keys)
+
+    @property
+    def y_keys(self):
+        """
+        The Y keys of the cells set, in the order first used.
+
+        :rtype: tuple
+        """
+        return tuple(self._y_keys)
+
+    def __len__(self):
+        """
+        The number of cells held.
+        """
+        self.freeze()
+        return len(self._values)
+
+    def _find(self, x_index, y_index):
+        """
+        Finds a frozen cell.
+
+        :return: The index of the cell in the frozen arrays or ``None``
+        :rtype: int or None
+        """
+        if x_index + 1 >= len(self._row_starts):
+            return None
+        start = self._row_starts[x_index]
+        stop = self._row_starts[x_index + 1]
+        position = start + int(numpy.searchsorted(
+            self._columns[start:stop], y_index))
+        if position < stop and self._columns[position] == y_index:
+            return position
+        return None
+
+    def _to_array(self, values):
+        if self._dtype.kind != "O":
+            return numpy.array(values, dtype=self._dtype)
+        # Avoid NumPy turning values that are sequences into more dimensions
+        array = numpy.empty(len(values), dtype=object)
+        for index, value in enumerate(values):
+            array[index] = value
+        return array
+
+    def freeze(self):
+        """
+        Sorts any cells set since the last call into the compressed form.
+
+        This is done automatically before any read, so there is only a need
+        to call it to control when the time is spent.
+        """
+        if not self._new_rows:
+            return
+        rows = numpy.concatenate((
+            self._frozen_rows(), numpy.array(self._new_rows, dtype=_INDEX)))
+        columns = numpy.concatenate((
+            self._columns, numpy.array(self._new_columns, dtype=_INDEX)))
+        values = numpy.concatenate((
+            self._values, self._to_array(self._new_values)))
+        self._new_rows = []
+        self._new_columns = []
+        self._new_values = []
+
+        # The sort is stable, so the last value set for a cell is kept
+        order = numpy.lexsort((columns, rows))
+        rows = rows[order]
+        columns = columns[order]
+        values = values[order]
+        keep = numpy.ones(len(rows), dtype=bool)
+        keep[:-1] = (rows[1:] != rows[:-1]) | (columns[1:] != columns[:-1])
+        rows = rows[keep]
+        self._columns = columns[keep]
+        self._values = values[keep]
+
+        self._row_starts = numpy.searchsorted(
+            rows, numpy.arange(len(self._x_keys) + 1))
+        self._column_order = numpy.lexsort(
+            (rows, self._columns)).astype(_INDEX)
+        self._column_starts = numpy.searchsorted(
+            self._columns[self._column_order],
+            numpy.arange(len(self._y_keys) + 1))
+
+    def _frozen_rows(self, positions=None):
+        """
+        Gets the row of frozen cells from the row starts.
+
+        :param positions: The indexes of the cells, or ``None`` for all
+        :type positions: ~numpy.ndarray or None
+        :rtype: ~numpy.ndarray
+        """
+        if positions is None:
+            return numpy.repeat(
+                numpy.arange(len(self._row_starts) - 1, dtype=_INDEX),
+                numpy.diff(self._row_starts))
+        return numpy.searchsorted(
+            self._row_starts, positions, side="right") - 1
+
+    @overrides(AbstractMatrix.get_data)
+    def get_data(self, x, y):
+        self.freeze()
+        x_index = self._x_index.get(x)
+        y_index = self._y_index.get(y)
+        if x_index is None or y_index is None:
+            return self._fill_value
+        position = self._find(x_index, y_index)
+        if position is None:
+            return self._fill_value
+        return self._values.item(position)
+
+    @overrides(AbstractMatrix.set_data)
+    def set_data(self, x, y, value):
+        x_index = self._x_index.get(x)
+        if x_index is None:
+            x_index = self._x_index[x] = len(self._x_keys)
+            self._x_keys.append(x)
+        y_index = self._y_index.get(y)
+        if y_index is None:
+            y_index = self._y_index[y] = len(self._y_keys)
+            self._y_keys.append(y)
+        # With cells waiting to be added, an update in place could be
+        # overwritten by an older value when they are frozen
+        position = None
+        if len(self._values) and not self._new_rows:
+            position = self._find(x_index, y_index)
+        if position is None:
+            self._new_rows.append(x_index)
+            self._new_columns.append(y_index)
+            self._new_values.append(value)
+        else:
+            self._values[position] = value
+
+    @overrides(AbstractMatrix.set_row)
+    def set_row(self, x, ys, values=None):
+        # Added as new cells; the freeze keeps the last value for each cell
+        ys, values = _keys_and_values(ys, values)
+        self._new_rows.extend(
+            _key_indexes(self._x_index, self._x_keys, [x]) * len(ys))
+        self._new_columns.extend(
+            _key_indexes(self._y_index, self._y_keys, ys))
+        self._new_values.extend(values)
+
+    @overrides(AbstractMatrix.set_column)
+    def set_column(self, y, xs, values=None):
+        xs, values = _keys_and_values(xs, values)
+        self._new_rows.extend(_key_indexes(self._x_index, self._x_keys, xs))
+        self._new_columns.extend(
+            _key_indexes(self._y_index, self._y_keys, [y]) * len(xs))
+        self._new_values.extend(values)
+
+    @overrides(AbstractMatrix.get_row)
+    def get_row(self, x):
+        self.freeze()
+        x_index = self._x_index.get(x)
+        if x_index is None or x_index + 1 >= len(self._row_starts):
+            return [], self._values[:0]
+        start = self._row_starts[x_index]
+        stop = self._row_starts[x_index + 1]
+        keys = self._y_keys
+        return ([keys[column] for column in self._columns[
+            start:stop].tolist()], self._values[start:stop])
+
+    @overrides(AbstractMatrix.get_column)
+    def get_column(self, y):
+        self.freeze()
+        y_index = self._y_index.get(y)
+        if y_index is None or y_index + 1 >= len(self._column_starts):
+            return [], self._values[:0]
+        positions = self._column_order[
+            self._column_starts[y_index]:self._column_starts[y_index + 1]]
+        keys = self._x_keys
+        return ([keys[row] for row in self._frozen_rows(positions).tolist()],
+                self._values[positions])
+
+    def iter_row(self, x):
+        """
+        Iterates over the cells held for one X key.
+
+        :param x: An X key
+        :return: yields the Y key and value of each cell
+        :rtype: iterable(tuple(object, object))
+        """
+        keys, values = self.get_row(x)
+        return zip(keys, values.tolist())
+
+    def iter_column(self, y):
+        """
+        Iterates over the cells held for one Y key.
+
+        :param y: A Y key
+        :return: yields the X key and value of each cell
+        :rtype: iterable(tuple(object, object))
+        """
+        keys, values = self.get_column(y)
+        return zip(keys, values.tolist())
@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import numpy
+
 
 class XView(object):
     """
@@ -29,3 +31,68 @@ class XView(object):
 
     def __setitem__(self, key, value):
         self._matrix.set_data(x=self._x, y=key, value=value)
+
+    def _line(self):
+        return self._matrix.get_row(self._x)
+
+    def __iter__(self):
+        """
+        Iterates over the Y keys held.
+        """
+        return iter(self._line()[0])
+
+    def __len__(self):
+        """
+        The number of values held.
+        """
+        return len(self._line()[0])
+
+    def keys(self):
+        """
+        The Y keys held.
+
+        :rtype: list
+        """
+        return list(self._line()[0])
+
+    def values(self):
+        """
+        The values held, in the same order as :py:meth:`keys`.
+
+        :rtype: list
+        """
+        values = self._line()[1]
+        if isinstance(values, numpy.ndarray):
+            return values.tolist()
+        return list(values)
+
+    def items(self):
+        """
+        The Y keys and values held.
+
+        :rtype: list(tuple(object, object))
+        """
+        keys, values = self._line()
+        if isinstance(values, numpy.ndarray):
+            values = values.tolist()
+        return list(zip(keys, values))
+
+    def to_numpy(self):
+        """
+        The values held as an array, in the same order as :py:meth:`keys`.
+
+        .. note::
+            If the matrix holds its values in an array this may be a view
+            of it rather than a copy.
+
+        :rtype: ~numpy.ndarray
+        """
+        return numpy.asarray(self._line()[1])
+
+    def to_dict(self):
+        """
+        The values held as a dict from Y key to value.
+
+        :rtype: dict
+        """
+        return dict(self.items())
@@ -19,15 +19,22 @@ population views and assemblies.
 """
 
 from .abstract_dict import AbstractDict
-from .abstract_list import AbstractList, DualList, SingleList
+from .abstract_list import (
+    AbstractList, ArrayDualList, DualList, SingleList)
 from .abstract_sized import AbstractSized
 from .abstract_view import AbstractView
+from .locked_range_dictionary import LockedRangeDictionary
+from .locked_ranged_list import LockedRangedList
+from .memmap_ranged_list import MemmapRangedList
 from .multiple_values_exception import MultipleValuesException
 from .range_dictionary import RangeDictionary
 from .ranged_list import RangedList
 from .ranged_list_of_lists import RangedListOfList
+from .shared_range_dictionary import SharedRangeDictionary
 
 __all__ = [
-    "AbstractDict", "AbstractList", "DualList", "SingleList", "AbstractSized",
-    "AbstractView", "MultipleValuesException", "RangeDictionary",
-    "RangedList", "RangedListOfList"]
+    "AbstractDict", "AbstractList", "ArrayDualList", "DualList", "SingleList",
+    "AbstractSized", "AbstractView", "LockedRangeDictionary",
+    "LockedRangedList", "MemmapRangedList", "MultipleValuesException",
+    "RangeDictionary", "RangedList", "RangedListOfList",
+    "SharedRangeDictionary"]
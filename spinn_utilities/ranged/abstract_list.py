@@ -13,12 +13,190 @@
 # limitations under the License.
 
 import numbers
+import operator
 import numpy
 from spinn_utilities.abstract_base import AbstractBase, abstractmethod
 from spinn_utilities.overrides import overrides
 from .abstract_sized import AbstractSized
 from .multiple_values_exception import MultipleValuesException
 
+#: Types which can safely be compared with ``==`` rather than
+#: :py:func:`numpy.array_equal`
+_SCALAR_TYPES = frozenset((
+    int, float, bool, str, type(None), numpy.float64, numpy.float32,
+    numpy.int64, numpy.int32, numpy.bool_))
+
+
+def values_equal(value, other):
+    """
+    The default test of whether two values held in a list are the same.
+
+    Plain scalars are compared with ``==`` which is several times faster
+    than :py:func:`numpy.array_equal`; anything else, including NumPy
+    arrays and other sequences, is compared with
+    :py:func:`numpy.array_equal`.
+
+    :param object value:
+    :param object other:
+    :rtype: bool
+    """
+    if type(value) in _SCALAR_TYPES and type(other) in _SCALAR_TYPES:
+        return value == other
+    return numpy.array_equal(value, other)
+
+
+#: Number of values compared at a time when comparing arrays
+_COMPARE_CHUNK = 65536
+
+
+class _RightOperand(object):
+    """
+    A function applying a binary operator with a fixed right operand.
+    Used rather than a lambda so that the lists using it can be pickled.
+    """
+    __slots__ = ("_operation", "_right")
+
+    def __init__(self, operation, right):
+        self._operation = operation
+        self._right = right
+
+    def __call__(self, value):
+        return self._operation(value, self._right)
+
+
+def _arrays_equal(array, other):
+    """
+    Compares two arrays a chunk at a time, stopping at the first chunk
+    with a difference.
+    """
+    if array.shape != other.shape:
+        return False
+    for start in range(0, len(array), _COMPARE_CHUNK):
+        stop = start + _COMPARE_CHUNK
+        if not numpy.array_equal(array[start:stop], other[start:stop]):
+            return False
+    return True
+
+
+def _array_equals_ranges(array, ranges, equals):
+    """
+    Compares an array of values with ranges covering the same IDs,
+    stopping at the first difference.
+    """
+    for (start, stop, value) in ranges:
+        if array.ndim == 1 and numpy.ndim(value) == 0:
+            for chunk_start in range(start, stop, _COMPARE_CHUNK):
+                chunk = array[chunk_start:min(chunk_start + _COMPARE_CHUNK,
+                                              stop)]
+                if not numpy.all(chunk == value):
+                    return False
+        elif not all(equals(item, value) for item in array[start:stop]):
+            return False
+    return True
+
+
+def _ranges_equal(ranges, other_ranges, equals):
+    """
+    Compares two sets of ranges covering the same IDs by walking them
+    together, stopping at the first difference.
+    The ranges need not start and stop in the same places.
+    """
+    try:
+        (_, stop, value) = next(ranges)
+        (_, other_stop, other_value) = next(other_ranges)
+        while True:
+            if not equals(value, other_value):
+                return False
+            if stop < other_stop:
+                (_, stop, value) = next(ranges)
+            elif stop > other_stop:
+                (_, other_stop, other_value) = next(other_ranges)
+            else:
+                (_, stop, value) = next(ranges)
+                (_, other_stop, other_value) = next(other_ranges)
+    except StopIteration:
+        return True
+
+
+def array_changes(array):
+    """
+    Finds where the values of an array change.
+
+    Values along the first axis are compared, so for an array of more than
+    one dimension each row is compared with the one before it.
+
+    :param ~numpy.ndarray array:
+    :return: The indexes of the values that differ from the one before
+    :rtype: ~numpy.ndarray
+    """
+    if len(array) < 2:
+        return numpy.zeros(0, dtype=numpy.intp)
+    different = array[1:] != array[:-1]
+    if different.ndim > 1:
+        different = different.reshape(len(different), -1).any(axis=1)
+    return numpy.flatnonzero(different) + 1
+
+
+def read_only(array):
+    """
+    Gets a view of the array that can not be written to.
+
+    :param ~numpy.ndarray array:
+    :rtype: ~numpy.ndarray
+    """
+    view = array.view()
+    view.flags.writeable = False
+    return view
+
+
+def range_values_array(values):
+    """
+    Makes an array of the values of some ranges. Numbers go into an array
+    of the matching numerical type, anything else into an object array.
+
+    :param list values:
+    :rtype: ~numpy.ndarray
+    """
+    if all(isinstance(value, (numbers.Number, numpy.bool_))
+           for value in values):
+        try:
+            array = numpy.array(values)
+            if array.ndim == 1 and array.dtype.kind in "biufc":
+                return array
+        except (OverflowError, ValueError):
+            pass
+    array = numpy.empty(len(values), dtype=object)
+    for index, value in enumerate(values):
+        array[index] = value
+    return array
+
+
+def _scalar_if_0d(other):
+    """
+    Treats a 0-d NumPy array as the scalar it holds, so that it can be used
+    as an operand like any other number.
+
+    :param object other:
+    :rtype: object
+    """
+    if isinstance(other, numpy.ndarray) and other.ndim == 0:
+        return other[()]
+    return other
+
+
+def held_values_array(a_list):
+    """
+    Gets the values of a list as an array, if it holds them that way.
+
+    :param AbstractList a_list:
+    :return: The values, or ``None`` if not held in an array
+    :rtype: ~numpy.ndarray or None
+    """
+    try:
+        return a_list.values_array()
+    except TypeError:
+        return None
+
 
 class AbstractList(AbstractSized, metaclass=AbstractBase):
     """
@@ -57,10 +235,18 @@ class AbstractList(AbstractSized, metaclass=AbstractBase):
         element-wise true division or true division by a single scalar
     `//`
         element-wise floor division or floor division by a single scalar
+
+    The other operand may also be a NumPy array with one value per element,
+    in which case the operation is applied to slices of the array at once.
     """
     __slots__ = [
         "_key"]
 
+    #: The test used to decide if two values in the list are the same.
+    #: Subclasses may replace this to plug in a different equality strategy;
+    #: it must accept any two values that could be held in the list.
+    values_equal = staticmethod(values_equal)
+
     def __init__(self, size, key=None):
         """
         :param int size: Fixed length of the list
@@ -93,12 +279,59 @@ class AbstractList(AbstractSized, metaclass=AbstractBase):
         """
         return self._size
 
+    def values_array(self):
+        """
+        Gets the values of the list as a NumPy array with one value per ID,
+        if the list already holds them that way, so they can be worked on
+        in bulk.
+
+        .. note::
+            The array is not a copy so must not be written to.
+
+        :rtype: ~numpy.ndarray
+        :raises TypeError: If the values are not held in an array
+        """
+        raise TypeError(
+            f"The values for key {self._key} are not held in an array")
+
     def __eq__(self, other):
         if isinstance(other, AbstractList):
-            if self.range_based and other.range_based:
-                return numpy.array_equal(list(self.iter_ranges()),
-                                         list(other.iter_ranges()))
-        return numpy.array_equal(list(self), list(other))
+            return self._list_equals(other)
+        try:
+            if len(other) != self._size:
+                return False
+        except TypeError:
+            return numpy.array_equal(list(self), list(other))
+        array = held_values_array(self)
+        if array is not None and isinstance(other, numpy.ndarray):
+            return _arrays_equal(array, other)
+        return all(map(self.values_equal, self, other))
+
+    def _list_equals(self, other):
+        """
+        Compares with another list using the cheapest way that both lists
+        support, stopping at the first difference found.
+
+        :param AbstractList other:
+        :rtype: bool
+        """
+        if len(other) != self._size:
+            return False
+        array = held_values_array(self)
+        other_array = held_values_array(other)
+        if array is not None:
+            if other_array is not None:
+                return _arrays_equal(array, other_array)
+            if other.range_based():
+                return _array_equals_ranges(
+                    array, other.iter_ranges(), self.values_equal)
+        elif other_array is not None and self.range_based():
+            return _array_equals_ranges(
+                other_array, self.iter_ranges(), self.values_equal)
+        if self.range_based() and other.range_based():
+            return _ranges_equal(
+                self.iter_ranges(), other.iter_ranges(), self.values_equal)
+        return all(map(self.values_equal, self, other))
 
     def __ne__(self, other):
         if not isinstance(other, AbstractList):
@@ -149,6 +382,23 @@ class AbstractList(AbstractSized, metaclass=AbstractBase):
         :return: The value of that element
         """
 
+    def get_value_by_id_with_cursor(self, the_id, cursor=0):
+        """
+        Returns the value for one item in the list, starting the search
+        from a cursor returned by an earlier call.
+
+        This makes reading the IDs in increasing order cheap for lists that
+        have to search for the range holding an ID.
+        The cursor is only a hint, so it is safe to use even if the list
+        has been updated since it was returned.
+
+        :param int the_id: One of the IDs of an element in the list
+        :param int cursor: A cursor returned by an earlier call, or 0
+        :return: The value of that element and the cursor for the next call
+        :rtype: tuple(object, int)
+        """
+        return self.get_value_by_id(the_id), cursor
+
     @abstractmethod
     def get_single_value_by_slice(self, slice_start, slice_stop):
         """
@@ -236,18 +486,23 @@ class AbstractList(AbstractSized, metaclass=AbstractBase):
         :param ids: IDs
         :return: yields the elements pointed to by IDs
         """
+        if not self.range_based():
+            for id_value in ids:
+                yield self.get_value_by_id(id_value)
+            return
+
         ranges = self.iter_ranges()
-        (_, stop, value) = next(ranges)
+        (start, stop, value) = next(ranges)
         for id_value in ids:
 
             # If range is too far ahead, reset to start
-            if id_value < stop:
+            if id_value < start:
                 ranges = self.iter_ranges()
-                (_, stop, value) = next(ranges)
+                (start, stop, value) = next(ranges)
 
             # Move on until the ID is in range
             while id_value >= stop:
-                (_, stop, value) = next(ranges)
+                (start, stop, value) = next(ranges)
 
             yield value
 
@@ -349,7 +604,7 @@ class AbstractList(AbstractSized, metaclass=AbstractBase):
         return list(self.iter_by_selector(selector))
 
     def __contains__(self, item):
-        return any(numpy.array_equal(value, item)
+        return any(self.values_equal(value, item)
                    for (_, _, value) in self.iter_ranges())
 
     def count(self, x):
@@ -363,7 +618,7 @@ class AbstractList(AbstractSized, metaclass=AbstractBase):
         return sum(
             stop - start
             for (start, stop, value) in self.iter_ranges()
-            if numpy.array_equal(value, x))
+            if self.values_equal(value, x))
 
     def index(self, x):
         """
@@ -375,7 +630,7 @@ class AbstractList(AbstractSized, metaclass=AbstractBase):
         :raise ValueError: If the value is not found
         """
         for (start, _, value) in self.iter_ranges():
-            if numpy.array_equal(value, x):
+            if self.values_equal(value, x):
                 return start
         raise ValueError(f"{x} is not in list")
 
@@ -447,7 +702,7 @@ class AbstractList(AbstractSized, metaclass=AbstractBase):
             while id_value >= ranges[range_pointer][1]:
                 range_pointer += 1
             if result is not None:
-                if (result[1] == id_value and numpy.array_equal(
+                if (result[1] == id_value and self.values_equal(
                         result[2], ranges[range_pointer][2])):
                     result = (result[0], id_value + 1, result[2])
                     continue
@@ -455,6 +710,35 @@ class AbstractList(AbstractSized, metaclass=AbstractBase):
             result = (id_value, id_value + 1, ranges[range_pointer][2])
         yield result
 
+    def range_arrays(self):
+        """
+        Gets the ranges of the list as read-only NumPy arrays, so that they
+        can be worked on in bulk, for example with :py:func:`numpy.repeat`
+        or :py:func:`numpy.searchsorted`.
+
+        If the list holds one value per ID in an array, there is one range
+        per ID and the values are a view of that array rather than a copy.
+        In that case neighbouring ranges may have the same value.
+
+        .. note::
+            A view will reflect later updates, but a copy will not.
+
+        :return: The start, stop and value of each range
+        :rtype: tuple(~numpy.ndarray, ~numpy.ndarray, ~numpy.ndarray)
+        """
+        array = held_values_array(self)
+        if array is not None:
+            starts = numpy.arange(self._size, dtype=numpy.intp)
+            return (read_only(starts), read_only(starts + 1),
+                    read_only(array))
+        ranges = list(self.iter_ranges())
+        starts = numpy.array(
+            [start for (start, _, _) in ranges], dtype=numpy.intp)
+        stops = numpy.array(
+            [stop for (_, stop, _) in ranges], dtype=numpy.intp)
+        values = range_values_array([value for (_, _, value) in ranges])
+        return (read_only(starts), read_only(stops), read_only(values))
+
     @abstractmethod
     def get_default(self):
         """
@@ -471,19 +755,25 @@ class AbstractList(AbstractSized, metaclass=AbstractBase):
         The values of the new list are created on the fly so any changes to
         the original lists are reflected.
 
-        :param other: another list
-        :type other: AbstractList
+        :param other: another list, a NumPy array with one value per
+            element, or a number
+        :type other: AbstractList or ~numpy.ndarray or ~numbers.Number
         :return: new list
         :rtype: AbstractList
         :raises TypeError:
         """
+        other = _scalar_if_0d(other)
         if isinstance(other, AbstractList):
             return DualList(
-                left=self, right=other, operation=lambda x, y: x + y)
+                left=self, right=other, operation=operator.add)
+        if isinstance(other, numpy.ndarray):
+            return ArrayDualList(
+                a_list=self, array=other, operation=operator.add)
         if isinstance(other, numbers.Number):
-            return SingleList(a_list=self, operation=lambda x: x + other)
+            return SingleList(
+                a_list=self, operation=_RightOperand(operator.add, other))
         raise TypeError("__add__ operation only supported for other "
-                        "RangedLists and numerical Values")
+                        "RangedLists, NumPy arrays and numerical Values")
 
     def __sub__(self, other):
         """
@@ -492,19 +782,25 @@ class AbstractList(AbstractSized, metaclass=AbstractBase):
         The values of the new list are created on the fly so any changes to
         the original lists are reflected.
 
-        :param other: another list
-        :type other: AbstractList
+        :param other: another list, a NumPy array with one value per
+            element, or a number
+        :type other: AbstractList or ~numpy.ndarray or ~numbers.Number
         :return: new list
         :rtype: AbstractList
         :raises TypeError:
         """
+        other = _scalar_if_0d(other)
         if isinstance(other, AbstractList):
             return DualList(
-                left=self, right=other, operation=lambda x, y: x - y)
+                left=self, right=other, operation=operator.sub)
+        if isinstance(other, numpy.ndarray):
+            return ArrayDualList(
+                a_list=self, array=other, operation=operator.sub)
         if isinstance(other, numbers.Number):
-            return SingleList(a_list=self, operation=lambda x: x - other)
+            return SingleList(
+                a_list=self, operation=_RightOperand(operator.sub, other))
         raise TypeError("__sub__ operation only supported for other "
-                        "RangedLists and numerical Values")
+                        "RangedLists, NumPy arrays and numerical Values")
 
     def __mul__(self, other):
         """
@@ -513,19 +809,25 @@ class AbstractList(AbstractSized, metaclass=AbstractBase):
         The values of the new list are created on the fly so any changes to
         the original lists are reflected.
 
-        :param other: another list
-        :type other: AbstractList
+        :param other: another list, a NumPy array with one value per
+            element, or a number
+        :type other: AbstractList or ~numpy.ndarray or ~numbers.Number
         :return: new list
         :rtype: AbstractList
         :raises TypeError:
         """
+        other = _scalar_if_0d(other)
         if isinstance(other, AbstractList):
             return DualList(
-                left=self, right=other, operation=lambda x, y: x * y)
+                left=self, right=other, operation=operator.mul)
+        if isinstance(other, numpy.ndarray):
+            return ArrayDualList(
+                a_list=self, array=other, operation=operator.mul)
         if isinstance(other, numbers.Number):
-            return SingleList(a_list=self, operation=lambda x: x * other)
+            return SingleList(
+                a_list=self, operation=_RightOperand(operator.mul, other))
         raise TypeError("__mul__ operation only supported for other "
-                        "RangedLists and numerical Values")
+                        "RangedLists, NumPy arrays and numerical Values")
 
     def __truediv__(self, other):
         """
@@ -535,42 +837,58 @@ class AbstractList(AbstractSized, metaclass=AbstractBase):
         The values of the new list are created on the fly so any changes to
         the original lists are reflected.
 
-        :param other: another list
-        :type other: AbstractList
+        :param other: another list, a NumPy array with one value per
+            element, or a number
+        :type other: AbstractList or ~numpy.ndarray or ~numbers.Number
         :return: new list
         :rtype: AbstractList
         :raises TypeError:
         """
+        other = _scalar_if_0d(other)
         if isinstance(other, AbstractList):
             return DualList(
-                left=self, right=other, operation=lambda x, y: x / y)
+                left=self, right=other, operation=operator.truediv)
+        if isinstance(other, numpy.ndarray):
+            if numpy.isin(0, other):
+                raise ZeroDivisionError()
+            return ArrayDualList(
+                a_list=self, array=other, operation=operator.truediv)
         if isinstance(other, numbers.Number):
             if numpy.isin(0, other):
                 raise ZeroDivisionError()
-            return SingleList(a_list=self, operation=lambda x: x / other)
+            return SingleList(
+                a_list=self, operation=_RightOperand(operator.truediv, other))
         raise TypeError("__truediv__ operation only supported for other "
-                        "RangedLists and numerical Values")
+                        "RangedLists, NumPy arrays and numerical Values")
 
     def __floordiv__(self, other):
         """
         Support for ``new_list = list1 // list2``.
         Applies the floor division operator over this and other.
 
-        :param other: another list
-        :type other: AbstractList
+        :param other: another list, a NumPy array with one value per
+            element, or a number
+        :type other: AbstractList or ~numpy.ndarray or ~numbers.Number
         :return: new list
         :rtype: AbstractList
         :raises TypeError:
         """
+        other = _scalar_if_0d(other)
         if isinstance(other, AbstractList):
             return DualList(
-                left=self, right=other, operation=lambda x, y: x // y)
+                left=self, right=other, operation=operator.floordiv)
+        if isinstance(other, numpy.ndarray):
+            if numpy.isin(0, other):
+                raise ZeroDivisionError()
+            return ArrayDualList(
+                a_list=self, array=other, operation=operator.floordiv)
         if isinstance(other, numbers.Number):
             if numpy.isin(0, other):
                 raise ZeroDivisionError()
-            return SingleList(a_list=self, operation=lambda x: x // other)
+            return SingleList(
+                a_list=self, operation=_RightOperand(operator.floordiv, other))
         raise TypeError("__floordiv__ operation only supported for other "
-                        "RangedLists and numerical Values")
+                        "RangedLists, NumPy arrays and numerical Values")
 
     def apply_operation(self, operation):
         """
@@ -581,6 +899,8 @@ class AbstractList(AbstractSized, metaclass=AbstractBase):
         :param operation:
             A function that can be applied over the individual values to
             create new ones.
+            To be able to pickle the new list this must be picklable, so
+            not a lambda.
         :return: new list
         :rtype: AbstractList
         """
@@ -766,3 +1086,119 @@ class DualList(AbstractList, metaclass=AbstractBase):
     def get_default(self):
         return self._operation(
             self._left.get_default(), self._right.get_default())
+
+
+class ArrayDualList(AbstractList, metaclass=AbstractBase):
+    """
+    A list which combines another list with a NumPy array holding one
+    value per element, using an operation that supports NumPy broadcasting.
+
+    Where the array is piecewise constant the ranges of the other list are
+    kept, and the operation is applied once per range.
+    Otherwise the operation is applied to a whole slice of the array for
+    each range of the other list.
+    """
+    __slots__ = [
+        "_a_list", "_array", "_operation",
+        # Whether the array has few enough changes of value to use ranges
+        "_few_changes"]
+
+    def __init__(self, a_list, array, operation, key=None):
+        """
+        :param AbstractList a_list: The list to combine
+        :param ~numpy.ndarray array:
+            The array to combine, indexed by element along its first axis
+        :param callable operation:
+            The operation to perform as a function that takes two values and
+            returns the result of the operation.
+            It must also accept a value and an array of values, returning an
+            array of results
+        :param key:
+            The dict key this list covers.
+            This is used only for better Exception messages
+        :raises ValueError:
+            If the array does not have one value per element of the list
+        """
+        if numpy.ndim(array) == 0 or len(array) != len(a_list):
+            raise ValueError(
+                "The array must have one value per element of the list")
+        super().__init__(size=len(a_list), key=key)
+        self._a_list = a_list
+        self._array = array
+        self._operation = operation
+        # Only worth using ranges if the array has runs of repeated values
+        self._few_changes = len(array_changes(array)) * 2 < self._size
+
+    @overrides(AbstractList.range_based)
+    def range_based(self):
+        return self._a_list.range_based() and self._few_changes
+
+    @overrides(AbstractList.get_value_by_id)
+    def get_value_by_id(self, the_id):
+        return self._operation(
+            self._a_list.get_value_by_id(the_id), self._array[the_id])
+
+    def _single_array_value(self, values):
+        different = array_changes(values)
+        if len(different):
+            raise MultipleValuesException(
+                self._key, values[0], values[different[0]])
+        return values[0]
+
+    @overrides(AbstractList.get_single_value_by_slice)
+    def get_single_value_by_slice(self, slice_start, slice_stop):
+        slice_start, slice_stop = self._check_slice_in_range(
+            slice_start, slice_stop)
+        return self._operation(
+            self._a_list.get_single_value_by_slice(slice_start, slice_stop),
+            self._single_array_value(self._array[slice_start:slice_stop]))
+
+    @overrides(AbstractList.get_single_value_by_ids)
+    def get_single_value_by_ids(self, ids):
+        return self._operation(
+            self._a_list.get_single_value_by_ids(ids),
+            self._single_array_value(self._array[list(ids)]))
+
+    def __iter__(self):
+        return self.iter_by_slice(0, self._size)
+
+    @overrides(AbstractList.iter_by_slice)
+    def iter_by_slice(self, slice_start, slice_stop):
+        slice_start, slice_stop = self._check_slice_in_range(
+            slice_start, slice_stop)
+        for (start, stop, value) in self._a_list.iter_ranges_by_slice(
+                slice_start, slice_stop):
+            if numpy.ndim(value):
+                # Broadcasting would mix up the value with the array
+                for array_value in self._array[start:stop]:
+                    yield self._operation(value, array_value)
+            else:
+                yield from self._operation(value, self._array[start:stop])
+
+    @overrides(AbstractList.iter_ranges)
+    def iter_ranges(self):
+        return self.iter_ranges_by_slice(0, self._size)
+
+    @overrides(AbstractList.iter_ranges_by_slice)
+    def iter_ranges_by_slice(self, slice_start, slice_stop):
+        slice_start, slice_stop = self._check_slice_in_range(
+            slice_start, slice_stop)
+        for (start, stop, value) in self._a_list.iter_ranges_by_slice(
+                slice_start, slice_stop):
+            previous = start
+            for change in array_changes(self._array[start:stop]):
+                change = start + int(change)
+                yield (previous, change,
+                       self._operation(value, self._array[previous]))
+                previous = change
+            yield (previous, stop,
+                   self._operation(value, self._array[previous]))
+
+    @overrides(AbstractList.get_default)
+    def get_default(self):
+        """
+        The array has no default so neither does this list.
+
+        :return: None
+        """
+        return None
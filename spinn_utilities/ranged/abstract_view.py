@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from itertools import repeat
 from spinn_utilities.overrides import overrides
 from .abstract_dict import AbstractDict
 
@@ -26,13 +27,72 @@ class AbstractView(AbstractDict):
         become more permissive in future versions.
     """
     __slots__ = (
-        "_range_dict")
+        "_cursors", "_range_dict")
 
     def __init__(self, range_dict):
         """
         Use :py:meth:`RangeDictionary.view_factory` to create views
         """
         self._range_dict = range_dict
+        self._cursors = dict()
+
+    def _get_value_by_id(self, key, the_id):
+        """
+        Gets the value of one key for one ID, starting the search from
+        where the last ID was found for that key.
+
+        :param str key: Existing dict key
+        :param int the_id: The actual ID
+        :return: The value
+        """
+        value, self._cursors[key] = self._range_dict.get_list(
+            key).get_value_by_id_with_cursor(
+                the_id, self._cursors.get(key, 0))
+        return value
+
+    def _update_safe_iter_values(self, key, ids):
+        """
+        Update-safe iteration of the values of some IDs, keeping a
+        cursor for each key between IDs.
+
+        :param key: The key or keys to get the value of. Use `None` for all
+        :type key: str or iterable(str) or None
+        :param iterable(int) ids: The actual IDs
+        """
+        if isinstance(key, str):
+            for the_id in ids:
+                yield self._get_value_by_id(key, the_id)
+            return
+        if key is None:
+            key = self.keys()
+        for the_id in ids:
+            yield {a_key: self._get_value_by_id(a_key, the_id)
+                   for a_key in key}
+
+    def get_values(self, keys=None):
+        """
+        Gets the value of every ID in the view for several keys at once.
+
+        The ranges of each key are read once, rather than looking up each
+        ID separately, so this is much faster than reading the values one
+        ID at a time.
+
+        :param keys: The keys to get the values of. Use `None` for all
+        :type keys: str or iterable(str) or None
+        :return: The values of each key, in the same order as :py:meth:`ids`
+        :rtype: dict(str, list)
+        """
+        if isinstance(keys, str):
+            keys = [keys]
+        elif keys is None:
+            keys = self.keys()
+        results = dict()
+        for key in keys:
+            values = []
+            for (start, stop, value) in self.iter_ranges(key):
+                values.extend(repeat(value, stop - start))
+            results[key] = values
+        return results
 
     def __getitem__(self, key):
         """
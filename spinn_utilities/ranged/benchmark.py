@@ -0,0 +1,393 @@
+# Copyright (c) 2023 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Benchmarks for the ranged package, so that changes in its speed can be
+measured.
+
+Each benchmark is run for each combination of list size and
+fragmentation, and the results written as JSON along with the commit they
+were run on.
+For example::
+
+    python -m spinn_utilities.ranged.benchmark --sizes 1e3 1e5 \
+        --output before.json
+    python -m spinn_utilities.ranged.benchmark --sizes 1e3 1e5 \
+        --output after.json
+    python -m spinn_utilities.ranged.benchmark --compare before.json \
+        after.json
+"""
+
+import argparse
+from collections import deque
+import functools
+import itertools
+import json
+import random
+import statistics
+import sys
+import numpy
+from spinn_utilities.benchmark_utils import (
+    describe_environment, time_operation, write_results)
+from .multiple_values_exception import MultipleValuesException
+from .range_dictionary import RangeDictionary
+from .ranged_list import RangedList
+
+#: The sizes of list benchmarked by default
+SIZES = (1000, 10000, 100000, 1000000, 10000000)
+
+#: The average length of the ranges at each level of fragmentation;
+#: ``None`` is a single range over the whole list
+FRAGMENTATION = {
+    "none": None,
+    "low": 1000,
+    "high": 10,
+    "full": 1}
+
+#: The number of IDs or slices used by benchmarks of single operations
+OPERATIONS = 1000
+
+
+def _make_list(size, fragmentation, key="a", offset=0):
+    """
+    Makes a list of floats where the ranges alternate between two values.
+
+    :param int size:
+    :param str fragmentation: A key of :py:data:`FRAGMENTATION`
+    :param str key:
+    :param int offset: How far to move the range boundaries along
+    :rtype: RangedList
+    """
+    run_length = FRAGMENTATION[fragmentation]
+    if run_length is None:
+        return RangedList(size, 0.0, key)
+    if run_length == 1:
+        return RangedList(size, list(itertools.islice(
+            itertools.cycle((0.0, 1.0)), offset, offset + size)), key)
+    values = itertools.chain.from_iterable(
+        itertools.repeat(value, run_length)
+        for value in itertools.cycle((0.0, 1.0)))
+    return RangedList(
+        size, itertools.islice(values, offset, offset + size), key)
+
+
+class _Fixture(object):
+    """
+    The data shared by the benchmarks of one size and fragmentation.
+    Everything is made only when first needed.
+    """
+    __slots__ = [
+        "_cache", "fragmentation", "_random", "size"]
+
+    def __init__(self, size, fragmentation, seed):
+        self.size = size
+        self.fragmentation = fragmentation
+        self._random = random.Random(seed)
+        self._cache = dict()
+
+    def _get(self, name, factory):
+        if name not in self._cache:
+            self._cache[name] = factory()
+        return self._cache[name]
+
+    @property
+    def a_list(self):
+        return self._get("list", lambda: _make_list(
+            self.size, self.fragmentation))
+
+    @property
+    def other_list(self):
+        return self._get("other", lambda: _make_list(
+            self.size, self.fragmentation, "b", self.size // 3))
+
+    @property
+    def range_dict(self):
+        def make():
+            range_dict = RangeDictionary(self.size)
+            for offset, key in enumerate("abc"):
+                range_dict[key] = _make_list(
+                    self.size, self.fragmentation, key, offset * 7)
+            return range_dict
+        return self._get("dict", make)
+
+    @property
+    def ids(self):
+        return self._get("ids", lambda: [
+            self._random.randrange(self.size) for _ in range(OPERATIONS)])
+
+    @property
+    def slices(self):
+        def make():
+            slices = []
+            for _ in range(OPERATIONS):
+                start = self._random.randrange(self.size)
+                stop = min(self.size, start + self._random.randint(1, 100))
+                slices.append((start, stop))
+            return slices
+        return self._get("slices", make)
+
+
+def _consume(iterator):
+    deque(iterator, maxlen=0)
+
+
+def _window(fixture, length):
+    start = fixture.size // 4
+    return fixture.range_dict[start:start + min(length, fixture.size // 2)]
+
+
+# Each benchmark makes everything it needs from the fixture and returns
+# the function to time, so only the operation itself is timed
+
+def _bench_construct(fixture):
+    return functools.partial(
+        _make_list, fixture.size, fixture.fragmentation)
+
+
+def _bench_get_by_id(fixture):
+    a_list, ids = fixture.a_list, fixture.ids
+
+    def run():
+        for the_id in ids:
+            a_list.get_value_by_id(the_id)
+    return run
+
+
+def _bench_get_by_slice(fixture):
+    a_list, slices = fixture.a_list, fixture.slices
+
+    def run():
+        for (start, stop) in slices:
+            try:
+                a_list.get_single_value_by_slice(start, stop)
+            except MultipleValuesException:
+                pass
+    return run
+
+
+def _bench_get_by_ids(fixture):
+    a_list, ids = fixture.a_list, fixture.ids
+    return lambda: _consume(a_list.iter_by_ids(ids))
+
+
+def _bench_set_by_id(fixture):
+    a_list, ids = fixture.a_list.copy(), fixture.ids
+
+    def run():
+        for the_id in ids:
+            a_list.set_value_by_id(the_id, 2.0)
+    return run
+
+
+def _bench_set_by_slice(fixture):
+    a_list, slices = fixture.a_list.copy(), fixture.slices
+
+    def run():
+        for (start, stop) in slices:
+            a_list.set_value_by_slice(start, stop, 2.0)
+    return run
+
+
+def _bench_set_by_ids(fixture):
+    a_list, ids = fixture.a_list.copy(), fixture.ids
+    return functools.partial(a_list.set_value_by_ids, ids, 2.0)
+
+
+def _bench_iterate(fixture):
+    return functools.partial(_consume, fixture.a_list)
+
+
+def _bench_iter_ranges(fixture):
+    a_list = fixture.a_list
+    return lambda: _consume(a_list.iter_ranges())
+
+
+def _bench_export(fixture):
+    return fixture.a_list.range_arrays
+
+
+def _bench_equals(fixture):
+    a_list, copy = fixture.a_list, fixture.a_list.copy()
+    return lambda: a_list == copy
+
+
+def _bench_merge(fixture):
+    range_dict = fixture.range_dict
+    return lambda: _consume(range_dict.iter_ranges())
+
+
+def _bench_view_get_values(fixture):
+    return _window(fixture, fixture.size).get_values
+
+
+def _bench_view_update_safe(fixture):
+    view = _window(fixture, OPERATIONS)
+    return lambda: _consume(view.iter_all_values(None, update_save=True))
+
+
+def _bench_view_ids(fixture):
+    view = fixture.range_dict[sorted(set(fixture.ids))]
+    return lambda: _consume(view.iter_all_values("a"))
+
+
+def _bench_derived_add(fixture):
+    a_list, other_list = fixture.a_list, fixture.other_list
+    return lambda: _consume((a_list + other_list).iter_ranges())
+
+
+def _bench_derived_scalar(fixture):
+    a_list = fixture.a_list
+    return lambda: _consume((a_list * 2.0).iter_ranges())
+
+
+def _bench_derived_array(fixture):
+    a_list, array = fixture.a_list, numpy.ones(fixture.size)
+    return lambda: _consume((a_list + array).iter_ranges())
+
+
+#: The setup function of each benchmark, by name
+BENCHMARKS = {
+    "list.construct": _bench_construct,
+    "list.get_by_id": _bench_get_by_id,
+    "list.get_by_slice": _bench_get_by_slice,
+    "list.get_by_ids": _bench_get_by_ids,
+    "list.set_by_id": _bench_set_by_id,
+    "list.set_by_slice": _bench_set_by_slice,
+    "list.set_by_ids": _bench_set_by_ids,
+    "list.iterate": _bench_iterate,
+    "list.iter_ranges": _bench_iter_ranges,
+    "list.export": _bench_export,
+    "list.equals": _bench_equals,
+    "dict.merge": _bench_merge,
+    "view.get_values": _bench_view_get_values,
+    "view.update_safe": _bench_view_update_safe,
+    "view.ids": _bench_view_ids,
+    "derived.add": _bench_derived_add,
+    "derived.scalar": _bench_derived_scalar,
+    "derived.array": _bench_derived_array,
+}
+
+
+def run_benchmarks(
+        sizes=SIZES, fragmentations=tuple(FRAGMENTATION), benchmarks=None,
+        repeat=3, seed=0, log=None):
+    """
+    Runs the benchmarks.
+
+    :param iterable(int) sizes: The sizes of list to benchmark
+    :param iterable(str) fragmentations:
+        The keys of :py:data:`FRAGMENTATION` to benchmark
+    :param benchmarks: The names of the benchmarks to run, or ``None`` for
+        all of them. A name ending in ``.`` selects a group.
+    :type benchmarks: iterable(str) or None
+    :param int repeat: How many times to time each benchmark
+    :param int seed: Seed for the random IDs and slices
+    :param log: Where to report progress, if anywhere
+    :type log: ~io.TextIOBase or None
+    :return: The results, ready to be written as JSON
+    :rtype: dict
+    """
+    names = [
+        name for name in BENCHMARKS if benchmarks is None or any(
+            name == wanted or (wanted.endswith(".") and name.startswith(
+                wanted)) for wanted in benchmarks)]
+    results = []
+    for size in sizes:
+        for fragmentation in fragmentations:
+            fixture = _Fixture(size, fragmentation, seed)
+            for name in names:
+                times = time_operation(
+                    functools.partial(BENCHMARKS[name], fixture), repeat)
+                results.append({
+                    "benchmark": name, "size": size,
+                    "fragmentation": fragmentation, "times": times,
+                    "min": min(times), "median": statistics.median(times)})
+                if log is not None:
+                    log.write(f"{name:20} {size:>10} {fragmentation:5} "
+                              f"{min(times):.6f}s\n")
+    return describe_environment(repeat=repeat, seed=seed, results=results)
+
+
+def compare(old, new):
+    """
+    Compares the results of two runs.
+
+    :param dict old: Results from :py:func:`run_benchmarks`
+    :param dict new: Results from :py:func:`run_benchmarks`
+    :return: The benchmark, size, fragmentation, old and new best times and
+        new / old ratio, for each benchmark in both runs
+    :rtype: list(tuple(str, int, str, float, float, float))
+    """
+    def index(results):
+        return {(result["benchmark"], result["size"],
+                 result["fragmentation"]): result["min"]
+                for result in results["results"]}
+    old_times = index(old)
+    comparison = []
+    for key, new_time in index(new).items():
+        if key in old_times:
+            old_time = old_times[key]
+            comparison.append(key + (
+                old_time, new_time,
+                new_time / old_time if old_time else float("inf")))
+    return comparison
+
+
+def main(arguments=None):
+    """
+    Command line interface.
+
+    :param list(str) arguments: Command line arguments.
+    """
+    parser = argparse.ArgumentParser(
+        description="Benchmark the ranged package")
+    parser.add_argument(
+        "--sizes", nargs="+", type=lambda size: int(float(size)),
+        default=SIZES, help="The sizes of list to benchmark, e.g. 1e5")
+    parser.add_argument(
+        "--fragmentation", nargs="+", choices=tuple(FRAGMENTATION),
+        default=tuple(FRAGMENTATION), help="The fragmentation levels")
+    parser.add_argument(
+        "--benchmarks", nargs="+", choices=tuple(BENCHMARKS) + tuple(
+            {name.split(".")[0] + "." for name in BENCHMARKS}),
+        help="The benchmarks, or groups such as 'list.', to run")
+    parser.add_argument(
+        "--repeat", type=int, default=3, help="Times to run each benchmark")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="File to write the results to")
+    parser.add_argument(
+        "--compare", nargs=2, metavar=("OLD", "NEW"),
+        help="Compare two result files instead of running")
+    args = parser.parse_args(arguments)
+
+    if args.compare:
+        with open(args.compare[0], encoding="utf-8") as f:
+            old = json.load(f)
+        with open(args.compare[1], encoding="utf-8") as f:
+            new = json.load(f)
+        print(f"{old['commit']} -> {new['commit']}")
+        for (name, size, fragmentation, old_time, new_time, ratio) in \
+                compare(old, new):
+            print(f"{name:20} {size:>10} {fragmentation:5} {old_time:.6f}s "
+                  f"{new_time:.6f}s {ratio:6.2f}x")
+        return
+
+    results = run_benchmarks(
+        args.sizes, args.fragmentation, args.benchmarks, args.repeat,
+        args.seed, sys.stderr)
+    write_results(results, args.output)
+
+
+if __name__ == "__main__":
+    main()  # pragma: no cover
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import numpy
 from spinn_utilities.overrides import overrides
 from .abstract_dict import AbstractDict
 from .abstract_view import AbstractView
@@ -52,8 +53,24 @@ class _IdsView(AbstractView):
 
     @overrides(AbstractDict.iter_all_values)
     def iter_all_values(self, key, update_save=False):
-        return self._range_dict.iter_values_by_ids(
-            ids=self._ids, key=key, update_save=update_save)
+        if update_save:
+            return self._update_safe_iter_values(key, self._ids)
+        return self._range_dict.iter_values_by_ids(ids=self._ids, key=key)
+
+    @overrides(AbstractView.get_values)
+    def get_values(self, keys=None):
+        # The IDs may be in any order so find the range of each in one go
+        if isinstance(keys, str):
+            keys = [keys]
+        elif keys is None:
+            keys = self.keys()
+        ids = numpy.asarray(self._ids, dtype=numpy.intp)
+        results = dict()
+        for key in keys:
+            starts, _, values = self._range_dict.get_list(key).range_arrays()
+            indexes = numpy.searchsorted(starts, ids, side="right") - 1
+            results[key] = values[indexes].tolist()
+        return results
 
     @overrides(AbstractDict.iter_ranges)
     def iter_ranges(self, key=None):
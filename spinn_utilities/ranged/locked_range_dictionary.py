@@ -0,0 +1,166 @@
+# Copyright (c) 2023 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from spinn_utilities.overrides import overrides
+from spinn_utilities.read_write_lock import ReadWriteLock
+from .abstract_dict import AbstractDict
+from .locked_ranged_list import LockedRangedList
+from .range_dictionary import RangeDictionary
+from .ranged_list import RangedList
+
+
+class LockedRangeDictionary(RangeDictionary):
+    """
+    A :py:class:`RangeDictionary` that may be safely shared between threads.
+
+    The dictionary and all the lists it creates share a single
+    :py:class:`~spinn_utilities.read_write_lock.ReadWriteLock`,
+    so many threads may read at once while writes are exclusive.
+    Reads over several keys see all of the keys in the same state,
+    and iterators work over snapshots so are not affected by later writes.
+
+    The exception is the update-safe iterators, asked for with
+    ``update_save=True``, which by design see writes made while they are
+    in use. Each value is read under the lock as it is reached, so the
+    iteration as a whole is not atomic.
+
+    To make several updates appear as one, hold the :py:attr:`lock` for
+    writing around them.
+
+    .. note::
+        Lists added with ``dict[str] = AbstractList`` are stored as is,
+        so are only protected if they were created with this
+        dictionary's lock.
+    """
+    __slots__ = [
+        "_lock"]
+
+    def __init__(self, size, defaults=None):
+        """
+        :param int size: Fixed number of IDs / Length of lists
+        :param defaults: Default dictionary where all keys must be str
+        :type defaults: dict(str,object)
+        """
+        self._lock = ReadWriteLock()
+        super().__init__(size, defaults)
+
+    @property
+    def lock(self):
+        """
+        The lock shared by this dictionary and its lists.
+
+        :rtype: ~spinn_utilities.read_write_lock.ReadWriteLock
+        """
+        return self._lock
+
+    @overrides(RangeDictionary.__setstate__)
+    def __setstate__(self, state):
+        super().__setstate__(state)
+        # Each list was unpickled with its own lock so share this one again
+        for a_list in self._value_lists.values():
+            if isinstance(a_list, LockedRangedList):
+                a_list.lock = self._lock
+
+    @overrides(RangeDictionary.list_factory)
+    def list_factory(self, size, value, key):
+        return LockedRangedList(size, value, key, lock=self._lock)
+
+    @overrides(RangeDictionary.get_value, extend_defaults=True)
+    def get_value(self, key=None):
+        with self._lock.read():
+            return super().get_value(key)
+
+    @overrides(RangeDictionary.get_values_by_id)
+    def get_values_by_id(self, key, the_id):
+        with self._lock.read():
+            return super().get_values_by_id(key, the_id)
+
+    @overrides(AbstractDict.iter_all_values, extend_defaults=True)
+    def iter_all_values(self, key=None, update_save=False):
+        # An update-safe iterator reads under the lock only as it goes
+        with self._lock.read():
+            return super().iter_all_values(key, update_save)
+
+    @overrides(RangeDictionary.iter_values_by_slice)
+    def iter_values_by_slice(
+            self, slice_start, slice_stop, key=None, update_save=False):
+        with self._lock.read():
+            return super().iter_values_by_slice(
+                slice_start, slice_stop, key, update_save)
+
+    @overrides(RangeDictionary.iter_values_by_ids)
+    def iter_values_by_ids(self, ids, key=None, update_save=False):
+        with self._lock.read():
+            return super().iter_values_by_ids(ids, key, update_save)
+
+    @overrides(RangeDictionary.__setitem__)
+    def __setitem__(self, key, value):
+        with self._lock.write():
+            super().__setitem__(key, value)
+
+    @overrides(RangeDictionary.keys)
+    def keys(self):
+        with self._lock.read():
+            return list(self._value_lists.keys())
+
+    @overrides(RangeDictionary.iter_ranges)
+    def iter_ranges(self, key=None):
+        with self._lock.read():
+            return super().iter_ranges(key)
+
+    @overrides(RangeDictionary.iter_ranges_by_id)
+    def iter_ranges_by_id(self, key=None, the_id=None):
+        with self._lock.read():
+            return super().iter_ranges_by_id(key, the_id)
+
+    @overrides(RangeDictionary.iter_ranges_by_slice)
+    def iter_ranges_by_slice(self, key, slice_start, slice_stop):
+        with self._lock.read():
+            return super().iter_ranges_by_slice(key, slice_start, slice_stop)
+
+    @overrides(RangeDictionary.iter_ranges_by_ids)
+    def iter_ranges_by_ids(self, ids, key=None):
+        with self._lock.read():
+            return super().iter_ranges_by_ids(ids, key)
+
+    @staticmethod
+    def _snapshot(a_list):
+        if isinstance(a_list, LockedRangedList):
+            return a_list.snapshot()
+        return a_list
+
+    @overrides(RangeDictionary.copy_into)
+    def copy_into(self, other):
+        # Snapshot first so two dicts copying each other can not deadlock
+        if isinstance(other, LockedRangeDictionary):
+            with other.lock.read():
+                values = {key: self._snapshot(other[key])
+                          for key in other.keys()}
+        else:
+            values = {key: other[key] for key in other.keys()}
+        with self._lock.write():
+            for key, value in values.items():
+                if key not in self._value_lists:
+                    default = None
+                    if isinstance(value, RangedList):
+                        default = value.get_default()
+                    self._value_lists[key] = self.list_factory(
+                        size=self._size, value=default, key=key)
+                self._value_lists[key].copy_into(value)
+
+    @overrides(RangeDictionary.copy)
+    def copy(self):
+        copy = LockedRangeDictionary(self._size)
+        copy.copy_into(self)
+        return copy
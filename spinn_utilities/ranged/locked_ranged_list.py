@@ -0,0 +1,209 @@
+# Copyright (c) 2023 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from spinn_utilities.overrides import overrides
+from spinn_utilities.read_write_lock import ReadWriteLock
+from .ranged_list import RangedList
+
+
+class LockedRangedList(RangedList):
+    """
+    A :py:class:`RangedList` that may be safely shared between threads.
+
+    Reads hold a shared read lock so many may run at once, while writes
+    hold the lock exclusively.
+    Iterators work over a snapshot of the ranges taken when the iterator
+    is created, so they are not affected by later writes.
+
+    .. note::
+        Taking a snapshot copies the internal ranges, which for a list that
+        is not range based is one entry per ID.
+    """
+    __slots__ = [
+        "_lock"]
+
+    def __init__(
+            self, size=None, value=None, key=None, use_list_as_value=False,
+            lock=None):
+        """
+        :param size:
+            Fixed length of the list;
+            if ``None``, the value must be a sized object.
+        :type size: int or None
+        :param value: value to given to all elements in the list
+        :type value: object or ~collections.abc.Sized
+        :param key: The dict key this list covers.
+            This is used only for better Exception messages
+        :param bool use_list_as_value: True if the value *is* a list
+        :param lock: The lock to use, to share one between several lists,
+            or ``None`` to create a new one
+        :type lock: ~spinn_utilities.read_write_lock.ReadWriteLock or None
+        """
+        self._lock = ReadWriteLock() if lock is None else lock
+        super().__init__(
+            size=size, value=value, key=key,
+            use_list_as_value=use_list_as_value)
+
+    @property
+    def lock(self):
+        """
+        The lock protecting this list.
+
+        Hold it for writing to make several updates appear as one.
+
+        :rtype: ~spinn_utilities.read_write_lock.ReadWriteLock
+        """
+        return self._lock
+
+    @lock.setter
+    def lock(self, lock):
+        """
+        Shares another lock, such as that of the dictionary holding this
+        list.
+
+        :param ~spinn_utilities.read_write_lock.ReadWriteLock lock:
+        """
+        self._lock = lock
+
+    @overrides(RangedList.snapshot)
+    def snapshot(self):
+        """
+        Creates an unlocked copy of the current state of this list.
+
+        :rtype: RangedList
+        """
+        with self._lock.read():
+            return super().snapshot()
+
+    @overrides(RangedList.range_based)
+    def range_based(self):
+        with self._lock.read():
+            return self._ranged_based
+
+    @overrides(RangedList.get_value_by_id)
+    def get_value_by_id(self, the_id):
+        with self._lock.read():
+            return super().get_value_by_id(the_id)
+
+    @overrides(RangedList.get_value_by_id_with_cursor)
+    def get_value_by_id_with_cursor(self, the_id, cursor=0):
+        with self._lock.read():
+            return super().get_value_by_id_with_cursor(the_id, cursor)
+
+    @overrides(RangedList.get_single_value_by_slice)
+    def get_single_value_by_slice(self, slice_start, slice_stop):
+        with self._lock.read():
+            return super().get_single_value_by_slice(slice_start, slice_stop)
+
+    @overrides(RangedList.get_single_value_by_ids)
+    def get_single_value_by_ids(self, ids):
+        with self._lock.read():
+            return super().get_single_value_by_ids(ids)
+
+    @overrides(RangedList.get_ranges)
+    def get_ranges(self):
+        with self._lock.read():
+            return super().get_ranges()
+
+    @overrides(RangedList.get_default)
+    def get_default(self):
+        with self._lock.read():
+            return super().get_default()
+
+    def __iter__(self):
+        return iter(self.snapshot())
+
+    @overrides(RangedList.iter_by_id)
+    def iter_by_id(self, the_id):
+        return self.snapshot().iter_by_id(the_id)
+
+    @overrides(RangedList.iter_by_ids)
+    def iter_by_ids(self, ids):
+        return self.snapshot().iter_by_ids(ids)
+
+    @overrides(RangedList.iter_by_slice)
+    def iter_by_slice(self, slice_start, slice_stop):
+        return self.snapshot().iter_by_slice(slice_start, slice_stop)
+
+    @overrides(RangedList.iter_ranges)
+    def iter_ranges(self):
+        return self.snapshot().iter_ranges()
+
+    @overrides(RangedList.iter_ranges_by_id)
+    def iter_ranges_by_id(self, the_id):
+        return self.snapshot().iter_ranges_by_id(the_id)
+
+    @overrides(RangedList.iter_ranges_by_slice)
+    def iter_ranges_by_slice(self, slice_start, slice_stop):
+        return self.snapshot().iter_ranges_by_slice(slice_start, slice_stop)
+
+    @overrides(RangedList.iter_ranges_by_ids)
+    def iter_ranges_by_ids(self, ids):
+        return self.snapshot().iter_ranges_by_ids(ids)
+
+    @overrides(RangedList.set_value)
+    def set_value(self, value, use_list_as_value=False):
+        with self._lock.write():
+            super().set_value(value, use_list_as_value)
+
+    @overrides(RangedList.set_value_by_id)
+    def set_value_by_id(self, the_id, value):
+        with self._lock.write():
+            super().set_value_by_id(the_id, value)
+
+    @overrides(RangedList.set_value_by_slice)
+    def set_value_by_slice(
+            self, slice_start, slice_stop, value, use_list_as_value=False):
+        with self._lock.write():
+            super().set_value_by_slice(
+                slice_start, slice_stop, value, use_list_as_value)
+
+    @overrides(RangedList.set_value_by_ids)
+    def set_value_by_ids(self, ids, value, use_list_as_value=False):
+        with self._lock.write():
+            super().set_value_by_ids(ids, value, use_list_as_value)
+
+    @overrides(RangedList.set_value_by_selector)
+    def set_value_by_selector(self, selector, value, use_list_as_value=False):
+        with self._lock.write():
+            super().set_value_by_selector(selector, value, use_list_as_value)
+
+    __setitem__ = set_value_by_selector
+
+    @overrides(RangedList.set_default)
+    def set_default(self, default):
+        with self._lock.write():
+            super().set_default(default)
+
+    @overrides(RangedList.copy_into)
+    def copy_into(self, other):
+        # Snapshot first so two lists copying each other can not deadlock
+        if isinstance(other, LockedRangedList):
+            other = other.snapshot()
+        with self._lock.write():
+            super().copy_into(other)
+
+    @overrides(RangedList.copy)
+    def copy(self):
+        """
+        Creates a copy of this list.
+
+        .. note::
+            The copy is a plain :py:class:`RangedList` that is not shared
+            with other threads, so has no lock.
+
+        :return: The copy
+        :rtype: RangedList
+        """
+        return self.snapshot()
@@ -0,0 +1,272 @@
+# Copyright (c) 2023 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from collections.abc import Sequence
+import itertools
+import os
+import tempfile
+import weakref
+import numpy
+from spinn_utilities.data import UtilsDataView
+from spinn_utilities.overrides import overrides
+from .multiple_values_exception import MultipleValuesException
+from .ranged_list import RangedList, function_iterator
+
+#: Number of values read or written at a time when working over the
+#: whole of a memory-mapped list
+CHUNK_SIZE = 65536
+
+
+def _remove_file(path):
+    try:
+        os.remove(path)
+    except OSError:  # pragma: no cover
+        # Still mapped on a system that does not allow removal;
+        # the temporary directory will be tidied later
+        pass
+
+
+class MemmapRangedList(RangedList):
+    """
+    A :py:class:`RangedList` which, when holding a value per ID, keeps the
+    values in a :py:class:`numpy.memmap` file rather than in memory.
+
+    The file is created in the run directory given by
+    :py:meth:`~spinn_utilities.data.UtilsDataView.get_run_dir_path`
+    and is removed when the list goes back to holding ranges or is
+    garbage collected.
+    Pages of the file are only loaded by the operating system as they are
+    touched, so memory use scales with the IDs accessed rather than with
+    the size of the list.
+
+    While range based, the list behaves exactly as a :py:class:`RangedList`.
+
+    .. note::
+        Values set while the list holds a value per ID must be convertible
+        to the ``dtype`` of the list, and are read back as NumPy scalars.
+        A list can then not be set as a value.
+    """
+    __slots__ = [
+        "_dtype", "_finalizer", "__weakref__"]
+
+    def __init__(
+            self, size=None, value=None, key=None, use_list_as_value=False,
+            dtype=numpy.float64):
+        """
+        :param size:
+            Fixed length of the list;
+            if ``None``, the value must be a sized object.
+        :type size: int or None
+        :param value: value to given to all elements in the list
+        :type value: object or ~collections.abc.Sized
+        :param key: The dict key this list covers.
+            This is used only for better Exception messages
+        :param bool use_list_as_value: True if the value *is* a list
+        :param ~numpy.dtype dtype:
+            The type of the values when held one per ID
+        """
+        self._dtype = numpy.dtype(dtype)
+        self._finalizer = None
+        super().__init__(
+            size=size, value=value, key=key,
+            use_list_as_value=use_list_as_value)
+
+    def _new_mapping(self):
+        """
+        Creates a new memory-mapped array the size of the list.
+
+        :return: The array, and the finalizer that removes its file
+        :rtype: tuple(~numpy.ndarray, ~weakref.finalize or None)
+        """
+        if self._size == 0:
+            # An empty file can not be mapped
+            return numpy.zeros(0, dtype=self._dtype), None
+        fd, path = tempfile.mkstemp(
+            suffix=".memmap", dir=UtilsDataView.get_run_dir_path())
+        os.close(fd)
+        mapping = numpy.memmap(
+            path, dtype=self._dtype, mode="w+", shape=(self._size,))
+        return mapping, weakref.finalize(self, _remove_file, path)
+
+    def _fill(self, mapping, value):
+        """
+        Writes the values into the array a chunk at a time.
+
+        :raises ValueError: if the number of values and the size do not match
+        """
+        if callable(value):
+            value = function_iterator(value, self._size)
+        if isinstance(value, (Sequence, numpy.ndarray)):
+            count = len(value)
+            if count == self._size:
+                for start in range(0, count, CHUNK_SIZE):
+                    mapping[start:start + CHUNK_SIZE] = \
+                        value[start:start + CHUNK_SIZE]
+        else:
+            values = iter(value)
+            count = 0
+            while True:
+                chunk = list(itertools.islice(values, CHUNK_SIZE))
+                if not chunk:
+                    break
+                if count < self._size:
+                    mapping[count:count + len(chunk)] = \
+                        chunk[:self._size - count]
+                count += len(chunk)
+        if count != self._size:
+            raise ValueError(f"The number of values:{count} "
+                             f"does not equal the size:{self._size}")
+
+    def _release(self):
+        """
+        Removes the file behind the current mapping, if there is one.
+        """
+        if self._finalizer is not None:
+            self._finalizer()
+            self._finalizer = None
+
+    def _map_values(self, value):
+        """
+        Switches the list to holding a value per ID in a new mapping.
+        The current state is kept if the values can not be written.
+        """
+        mapping, finalizer = self._new_mapping()
+        try:
+            self._fill(mapping, value)
+        except Exception:
+            if finalizer is not None:
+                finalizer()
+            raise
+        self._release()
+        self._ranges = mapping
+        self._ranged_based = False
+        self._finalizer = finalizer
+
+    @property
+    def dtype(self):
+        """
+        The type of the values when held one per ID.
+
+        :rtype: ~numpy.dtype
+        """
+        return self._dtype
+
+    @overrides(RangedList.set_value)
+    def set_value(self, value, use_list_as_value=False):
+        if not use_list_as_value and self.is_list(value, self._size):
+            self._map_values(value)
+        else:
+            super().set_value(value, use_list_as_value)
+            self._release()
+
+    @overrides(RangedList.set_value_by_slice)
+    def set_value_by_slice(
+            self, slice_start, slice_stop, value, use_list_as_value=False):
+        if self._ranged_based:
+            super().set_value_by_slice(
+                slice_start, slice_stop, value, use_list_as_value)
+            return
+        if use_list_as_value:
+            raise TypeError(
+                f"The values for key {self._key} are held one per ID as "
+                f"{self._dtype}, so a list can not be a value")
+        slice_start, slice_stop = self._check_slice_in_range(
+            slice_start, slice_stop)
+        if slice_start == slice_stop:
+            return  # Empty list so do nothing
+        if not use_list_as_value and self.is_list(
+                value, size=slice_stop - slice_start):
+            value = self.as_list(
+                value, slice_stop - slice_start,
+                ids=range(slice_start, slice_stop))
+        self._ranges[slice_start:slice_stop] = value
+
+    @overrides(RangedList.get_single_value_by_slice)
+    def get_single_value_by_slice(self, slice_start, slice_stop):
+        if self._ranged_based:
+            return super().get_single_value_by_slice(slice_start, slice_stop)
+        slice_start, slice_stop = self._check_slice_in_range(
+            slice_start, slice_stop)
+        result = self._ranges[slice_start]
+        for start in range(slice_start + 1, slice_stop, CHUNK_SIZE):
+            values = self._ranges[start:min(start + CHUNK_SIZE, slice_stop)]
+            different = numpy.flatnonzero(values != result)
+            if len(different):
+                raise MultipleValuesException(
+                    self._key, result, values[different[0]])
+        return result
+
+    def _iter_mapped_ranges(self, slice_start, slice_stop):
+        """
+        Builds the ranges of the mapped values in the slice by comparing
+        each chunk of values with the values one before them.
+        """
+        mapping = self._ranges
+        previous_start = slice_start
+        previous_value = mapping[slice_start]
+        for start in range(slice_start + 1, slice_stop, CHUNK_SIZE):
+            stop = min(start + CHUNK_SIZE, slice_stop)
+            values = mapping[start - 1:stop]
+            for index in numpy.flatnonzero(values[1:] != values[:-1]):
+                change = start + int(index)
+                yield (previous_start, change, previous_value)
+                previous_start = change
+                previous_value = mapping[change]
+        yield (previous_start, slice_stop, previous_value)
+
+    @overrides(RangedList.iter_ranges)
+    def iter_ranges(self):
+        if self._ranged_based:
+            return super().iter_ranges()
+        return self._iter_mapped_ranges(0, self._size)
+
+    @overrides(RangedList.iter_ranges_by_slice)
+    def iter_ranges_by_slice(self, slice_start, slice_stop):
+        if self._ranged_based:
+            return super().iter_ranges_by_slice(slice_start, slice_stop)
+        slice_start, slice_stop = self._check_slice_in_range(
+            slice_start, slice_stop)
+        return self._iter_mapped_ranges(slice_start, slice_stop)
+
+    @overrides(RangedList._reduce_args)
+    def _reduce_args(self):
+        return (self._size, None, self._key, True, self._dtype)
+
+    def __setstate__(self, state):
+        """
+        Sets the values from the table made by :py:meth:`__reduce__`,
+        putting values held one per ID into a new file.
+        """
+        (default, starts, values) = state
+        if starts is None:
+            self._default = default
+            self._map_values(values)
+        else:
+            super().__setstate__(state)
+
+    @overrides(RangedList.copy_into)
+    def copy_into(self, other):
+        if other.range_based():
+            self._ranged_based = True
+            self._ranges = list(other.iter_ranges())
+            self._release()
+        else:
+            self._map_values(iter(other))
+
+    @overrides(RangedList.copy)
+    def copy(self):
+        clone = MemmapRangedList(
+            self._size, self._default, self._key, dtype=self._dtype)
+        clone.copy_into(self)
+        return clone
@@ -392,6 +392,15 @@ class RangeDictionary(AbstractSized, AbstractDict):
                 iter_ranges_by_ids(ids=ids)
         return self._merge_ranges(ranges)
 
+    def __reduce__(self):
+        """
+        Pickles the dictionary as its lists, which each pickle compactly.
+        """
+        return (self.__class__, (self._size, ), self._value_lists)
+
+    def __setstate__(self, state):
+        self._value_lists = dict(state)
+
     def set_default(self, key, default):
         """
         Sets the default value for a single key.
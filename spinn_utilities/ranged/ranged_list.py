@@ -12,10 +12,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from collections.abc import Iterator
+import itertools
 import numpy
 from spinn_utilities.overrides import overrides
 from spinn_utilities.helpful_functions import is_singleton
-from .abstract_list import AbstractList
+from .abstract_list import AbstractList, values_equal
 from .multiple_values_exception import MultipleValuesException
 
 
@@ -42,6 +44,78 @@ def function_iterator(function, size, ids=None):
         yield function(_id)
 
 
+#: Number of values pulled from an iterator at a time by
+#: :py:func:`iterator_to_ranges`
+DEFAULT_CHUNK_SIZE = 4096
+
+
+def iterator_to_ranges(
+        values, size, chunk_size=DEFAULT_CHUNK_SIZE, equals=values_equal):
+    """
+    Run-length compresses the values from an iterator into ranges.
+
+    The values are pulled from the iterator ``chunk_size`` at a time so
+    that the values themselves are never all held in memory at once;
+    only the current chunk and the ranges found so far are kept.
+
+    :param ~collections.abc.Iterator values: The values to compress
+    :param int size:
+        The number of values the iterator is expected to yield
+    :param int chunk_size:
+        The maximum number of values pulled from the iterator at a time
+    :param ~collections.abc.Callable[[object,object],bool] equals:
+        The test of whether two consecutive values are the same
+    :return: The ranges as (start, stop, value) tuples
+    :rtype: list(tuple(int,int,object))
+    :raises ValueError: if the number of values and the size do not match
+    """
+    ranges = []
+    count = 0
+    previous_start = 0
+    previous_value = None
+    while True:
+        chunk = list(itertools.islice(values, chunk_size))
+        if not chunk:
+            break
+        for value in chunk:
+            if count == 0:
+                previous_value = value
+            elif not equals(value, previous_value):
+                ranges.append((previous_start, count, previous_value))
+                previous_start = count
+                previous_value = value
+            count += 1
+    if count != size:
+        raise ValueError(f"The number of values:{count} "
+                         f"does not equal the size:{size}")
+    if count > 0:
+        ranges.append((previous_start, count, previous_value))
+    return ranges
+
+
+def pack_values(values):
+    """
+    Packs the values into a NumPy array if they are all Python ints or all
+    Python floats, so that they pickle compactly.
+
+    :param list values:
+    :rtype: ~numpy.ndarray or list
+    """
+    if values:
+        kind = type(values[0])
+        if kind in (int, float) and all(
+                type(value) is kind for value in values):
+            if kind is float:
+                return numpy.array(values, dtype=numpy.float64)
+            # Use the smallest integer type that holds all the values
+            dtype = numpy.result_type(
+                numpy.min_scalar_type(min(values)),
+                numpy.min_scalar_type(max(values)))
+            if dtype.kind in "iu":
+                return numpy.array(values, dtype=dtype)
+    return values
+
+
 class RangedList(AbstractList):
     """
     A list that is able to efficiently hold large numbers of elements
@@ -97,6 +171,21 @@ class RangedList(AbstractList):
         # Non-range-based so just return the value
         return self._ranges[the_id]
 
+    @overrides(AbstractList.get_value_by_id_with_cursor)
+    def get_value_by_id_with_cursor(self, the_id, cursor=0):
+        self._check_id_in_range(the_id)
+        if not self._ranged_based:
+            return self._ranges[the_id], cursor
+
+        # The cursor is the index of a range, but the ranges may have
+        # changed since so start again if it is past the ID
+        ranges = self._ranges
+        if cursor >= len(ranges) or the_id < ranges[cursor][0]:
+            cursor = 0
+        while ranges[cursor][1] <= the_id:
+            cursor += 1
+        return ranges[cursor][2], cursor
+
     @overrides(AbstractList.get_single_value_by_slice)
     def get_single_value_by_slice(self, slice_start, slice_stop):
         slice_start, slice_stop = self._check_slice_in_range(
@@ -116,7 +205,7 @@ class RangedList(AbstractList):
                     # If we have already found a range in the slice, check the
                     # value is the same
                     if found_value:
-                        if not numpy.array_equal(result, value):
+                        if not self.values_equal(result, value):
                             raise MultipleValuesException(
                                 self._key, result, value)
 
@@ -138,7 +227,7 @@ class RangedList(AbstractList):
         # they are all the same within the slice
         result = self._ranges[slice_start]
         for _value in self._ranges[slice_start+1: slice_stop]:
-            if not numpy.array_equal(result, _value):
+            if not self.values_equal(result, _value):
                 raise MultipleValuesException(self._key, result, _value)
         return result
 
@@ -149,10 +238,16 @@ class RangedList(AbstractList):
         result = self.get_value_by_id(ids[0])
         for id_value in ids[1:]:
             value = self.get_value_by_id(id_value)
-            if not numpy.array_equal(result, value):
+            if not self.values_equal(result, value):
                 raise MultipleValuesException(self._key, result, value)
         return result
 
+    @overrides(AbstractList.values_array)
+    def values_array(self):
+        if not self._ranged_based and isinstance(self._ranges, numpy.ndarray):
+            return self._ranges
+        return super().values_array()
+
     def __iter__(self):
         """
         Fast but *not* update-safe iterator of all elements.
@@ -215,7 +310,7 @@ class RangedList(AbstractList):
             for start, value in enumerate(self._ranges):
                 current_start = start
                 current_value = value
-                if not numpy.array_equal(value, previous_value):
+                if not self.values_equal(value, previous_value):
                     yield (previous_start, start, previous_value)
                     previous_start = start
                     previous_value = value
@@ -244,7 +339,7 @@ class RangedList(AbstractList):
             previous_start = slice_start
             for index, value in enumerate(
                     self._ranges[slice_start: slice_stop]):
-                if not numpy.array_equal(value, previous_value):
+                if not self.values_equal(value, previous_value):
                     # Index is one ahead so no need for a + 1 here
                     yield (previous_start, slice_start + index, previous_value)
                     previous_start = slice_start + index
@@ -281,6 +376,11 @@ class RangedList(AbstractList):
         :param value:
         :return: value as a list
         :raises Exception: if the number of values and the size do not match
+
+        .. note::
+            This builds the whole list in memory; iterators are better
+            handled by :py:func:`iterator_to_ranges` which keeps only the
+            compressed ranges.
         """
         if callable(value):
             values = list(function_iterator(value, size, ids))
@@ -304,8 +404,23 @@ class RangedList(AbstractList):
 
         # If the value to set is a list, just copy the values
         if not use_list_as_value and self.is_list(value, self._size):
-            self._ranges = self.as_list(value, self._size)
-            self._ranged_based = False
+            # An iterator is streamed into ranges so it is never all held
+            # in memory
+            if isinstance(value, Iterator):
+                ranges = iterator_to_ranges(
+                    value, self._size, equals=self.values_equal)
+                if len(ranges) > self._size // 2:
+                    # The values hardly compress so are faster as a list
+                    self._ranges = [
+                        _value for (start, stop, _value) in ranges
+                        for _ in range(start, stop)]
+                    self._ranged_based = False
+                else:
+                    self._ranges = ranges
+                    self._ranged_based = True
+            else:
+                self._ranges = self.as_list(value, self._size)
+                self._ranged_based = False
 
         # Otherwise store the value directly assuming it is the same value
         # for all items
@@ -338,7 +453,7 @@ class RangedList(AbstractList):
             if the_id < stop:
 
                 # If already set as needed, do nothing
-                if numpy.array_equal(value, old_value):
+                if self.values_equal(value, old_value):
                     return
 
                 # Split the ID out of the range
@@ -356,7 +471,7 @@ class RangedList(AbstractList):
                 # If not at the last range, update the start and stop value of
                 # the next range
                 if index < len(self._ranges) - 1:
-                    if numpy.array_equal(self._ranges[index][2],
+                    if self.values_equal(self._ranges[index][2],
                                          self._ranges[index + 1][2]):
                         self._ranges[index] = (
                             self._ranges[index][0],
@@ -367,7 +482,7 @@ class RangedList(AbstractList):
                 # If not at the first range, update the start and stop value
                 # of the first range
                 if index > 0:
-                    if numpy.array_equal(self._ranges[index][2],
+                    if self.values_equal(self._ranges[index][2],
                                          self._ranges[index - 1][2]):
                         self._ranges[index - 1] = (
                             self._ranges[index - 1][0],
@@ -400,6 +515,16 @@ class RangedList(AbstractList):
         # If the value to set is a list, set the values directly
         if not use_list_as_value and self.is_list(
                 value, size=slice_stop - slice_start):
+            # If range based, an iterator is compressed first and then each
+            # of the ranges found is set
+            if self._ranged_based and isinstance(value, Iterator):
+                for (start, stop, _value) in iterator_to_ranges(
+                        value, slice_stop - slice_start,
+                        equals=self.values_equal):
+                    self.set_value_by_slice(
+                        slice_start + start, slice_start + stop, _value,
+                        use_list_as_value=True)
+                return
             return self._set_values_list(range(slice_start, slice_stop), value)
 
         # If non-ranged-based, set the values directly
@@ -422,7 +547,7 @@ class RangedList(AbstractList):
         if slice_start > _start:
 
             # If the values are different, add a new range with the old value
-            if not numpy.array_equal(value, old_value):
+            if not self.values_equal(value, old_value):
                 self._ranges.insert(index, (_start, slice_start, old_value))
 
                 # We have added a value so move on one
@@ -448,14 +573,14 @@ class RangedList(AbstractList):
             self._ranges.insert(index+1, (slice_stop, _stop, old_value))
 
         # merge with previous if same value
-        if index > 0 and numpy.array_equal(self._ranges[index-1][2], value):
+        if index > 0 and self.values_equal(self._ranges[index-1][2], value):
             self._ranges[index-1] = (self._ranges[index-1][0], slice_stop,
                                      value)
             self._ranges.pop(index)
             index -= 1
 
         # merge with next if same value
-        if index < len(self._ranges) - 1 and numpy.array_equal(
+        if index < len(self._ranges) - 1 and self.values_equal(
                 self._ranges[index+1][2], value):
             self._ranges[index] = (self._ranges[index][0],
                                    self._ranges[index + 1][1], value)
@@ -515,6 +640,49 @@ class RangedList(AbstractList):
             return list(self._ranges)
         return list(self.iter_ranges())
 
+    def _reduce_args(self):
+        """
+        The arguments to the constructor used when unpickling.
+        The values are then set by :py:meth:`__setstate__`.
+
+        :rtype: tuple
+        """
+        return (self._size, None, self._key, True)
+
+    def __reduce__(self):
+        """
+        Pickles the list as a compact table of its ranges, being the starts
+        of the ranges and the values as NumPy arrays where possible.
+        """
+        if self._ranged_based:
+            starts = numpy.array(
+                [start for (start, _, _) in self._ranges],
+                dtype=numpy.min_scalar_type(self._size))
+            values = pack_values([value for (_, _, value) in self._ranges])
+        elif isinstance(self._ranges, numpy.ndarray):
+            starts = None
+            values = numpy.asarray(self._ranges)
+        else:
+            starts = None
+            values = pack_values(self._ranges)
+        return (self.__class__, self._reduce_args(),
+                (self._default, starts, values))
+
+    def __setstate__(self, state):
+        """
+        Sets the values from the table made by :py:meth:`__reduce__`.
+        """
+        (self._default, starts, values) = state
+        if isinstance(values, numpy.ndarray):
+            values = values.tolist()
+        if starts is None:
+            self._ranges = values
+            self._ranged_based = False
+        else:
+            starts = starts.tolist()
+            self._ranges = list(zip(starts, starts[1:] + [self._size], values))
+            self._ranged_based = True
+
     def set_default(self, default):
         """
         Sets the default value.
@@ -557,6 +725,38 @@ class RangedList(AbstractList):
         else:
             self._ranges.extend(other)
 
+    def snapshot(self):
+        """
+        Creates a plain :py:class:`RangedList` holding a copy of the
+        current values of this list.
+
+        Unlike :py:meth:`copy` the values are copied directly, without
+        going through any methods a subclass overrides.
+
+        :rtype: RangedList
+        """
+        return RangedList._from_state(
+            self._size, self._key, self._default, self._ranged_based,
+            list(self._ranges))
+
+    @classmethod
+    def _from_state(cls, size, key, default, ranged_based, ranges):
+        """
+        Creates a list directly from the internal state of another.
+
+        :param int size: Fixed length of the list
+        :param key: The dict key the list covers
+        :param object default: The default value
+        :param bool ranged_based: Whether the ranges are (start, stop, value)
+        :param list ranges: The ranges or values, which are not copied
+        :rtype: RangedList
+        """
+        clone = cls(size, None, key)
+        clone._default = default
+        clone._ranged_based = ranged_based
+        clone._ranges = ranges
+        return clone
+
     def copy(self):
         """
         Creates a copy of this list.
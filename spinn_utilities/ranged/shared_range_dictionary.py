@@ -0,0 +1,390 @@
+# Copyright (c) 2023 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pickle
+import struct
+import numpy
+from spinn_utilities.abstract_context_manager import AbstractContextManager
+from spinn_utilities.overrides import overrides
+from .abstract_dict import AbstractDict
+from .abstract_list import (
+    AbstractList, array_changes, held_values_array, range_values_array,
+    read_only)
+from .multiple_values_exception import MultipleValuesException
+from .range_dictionary import RangeDictionary
+from .ranged_list import pack_values
+try:
+    from multiprocessing.shared_memory import SharedMemory
+except ImportError:  # pragma: no cover
+    # Shared memory needs Python 3.8 or later
+    SharedMemory = None
+
+#: Offset and length of the manifest describing the tables in the segment
+_HEADER = struct.Struct("<QQ")
+#: Alignment of each table in the segment
+_ALIGN = 8
+#: Number of values converted at a time when iterating over a table
+_CHUNK_SIZE = 65536
+
+
+def _align(offset):
+    return (offset + _ALIGN - 1) // _ALIGN * _ALIGN
+
+
+class _SharedRangedList(AbstractList):
+    """
+    A read-only list backed by NumPy arrays, as used by
+    :py:class:`SharedRangeDictionary`.
+
+    If range based, ``starts`` holds the first ID of each range and
+    ``values`` the value of each range; otherwise ``starts`` is ``None`` and
+    ``values`` holds one value per ID.
+    """
+    __slots__ = [
+        "_default", "_starts", "_values"]
+
+    def __init__(self, size, key, default, starts, values):
+        """
+        :param int size: Fixed length of the list
+        :param key: The dict key this list covers.
+        :param default: The default value of the list
+        :param starts: The start of each range or ``None``
+        :type starts: ~numpy.ndarray or None
+        :param values: The value of each range or ID
+        :type values: ~numpy.ndarray or list
+        """
+        super().__init__(size=size, key=key)
+        self._default = default
+        self._starts = starts
+        self._values = values
+
+    def release(self):
+        """
+        Drops the arrays so the memory behind them can be closed.
+        The list can not be used after this.
+        """
+        self._starts = None
+        self._values = None
+
+    def _value(self, index):
+        if isinstance(self._values, numpy.ndarray):
+            return self._values.item(index)
+        return self._values[index]
+
+    def _range_index(self, the_id):
+        return int(numpy.searchsorted(self._starts, the_id, side="right")) - 1
+
+    def _refuse_write(self, *args, **kwargs):
+        raise TypeError(f"The list for key {self._key} is read only")
+
+    set_value = set_value_by_id = set_value_by_slice = set_value_by_ids = \
+        set_value_by_selector = __setitem__ = set_default = _refuse_write
+
+    @overrides(AbstractList.range_based)
+    def range_based(self):
+        return self._starts is not None
+
+    @overrides(AbstractList.values_array)
+    def values_array(self):
+        if self._starts is None and isinstance(self._values, numpy.ndarray):
+            return self._values
+        return super().values_array()
+
+    @overrides(AbstractList.get_value_by_id)
+    def get_value_by_id(self, the_id):
+        self._check_id_in_range(the_id)
+        if self._starts is None:
+            return self._value(the_id)
+        return self._value(self._range_index(the_id))
+
+    @overrides(AbstractList.get_single_value_by_slice)
+    def get_single_value_by_slice(self, slice_start, slice_stop):
+        slice_start, slice_stop = self._check_slice_in_range(
+            slice_start, slice_stop)
+        if self._starts is None:
+            first, last = slice_start, max(slice_start, slice_stop - 1)
+        else:
+            first = self._range_index(slice_start)
+            last = max(first, self._range_index(slice_stop - 1))
+        result = self._value(first)
+        if isinstance(self._values, numpy.ndarray):
+            different = numpy.flatnonzero(
+                self._values[first + 1:last + 1] != self._values[first])
+            if len(different):
+                raise MultipleValuesException(
+                    self._key, result, self._value(first + 1 + different[0]))
+        else:
+            for index in range(first + 1, last + 1):
+                if not self.values_equal(result, self._values[index]):
+                    raise MultipleValuesException(
+                        self._key, result, self._values[index])
+        return result
+
+    @overrides(AbstractList.get_single_value_by_ids)
+    def get_single_value_by_ids(self, ids):
+        result = self.get_value_by_id(ids[0])
+        for id_value in ids[1:]:
+            value = self.get_value_by_id(id_value)
+            if not self.values_equal(result, value):
+                raise MultipleValuesException(self._key, result, value)
+        return result
+
+    def __iter__(self):
+        return self.iter_by_slice(0, self._size)
+
+    @overrides(AbstractList.iter_by_slice)
+    def iter_by_slice(self, slice_start, slice_stop):
+        slice_start, slice_stop = self._check_slice_in_range(
+            slice_start, slice_stop)
+        if self._starts is not None:
+            for (start, stop, value) in self.iter_ranges_by_slice(
+                    slice_start, slice_stop):
+                for _ in range(start, stop):
+                    yield value
+        elif isinstance(self._values, numpy.ndarray):
+            for start in range(slice_start, slice_stop, _CHUNK_SIZE):
+                yield from self._values[
+                    start:min(start + _CHUNK_SIZE, slice_stop)].tolist()
+        else:
+            yield from self._values[slice_start:slice_stop]
+
+    @overrides(AbstractList.iter_ranges)
+    def iter_ranges(self):
+        return self.iter_ranges_by_slice(0, self._size)
+
+    @overrides(AbstractList.iter_ranges_by_slice)
+    def iter_ranges_by_slice(self, slice_start, slice_stop):
+        slice_start, slice_stop = self._check_slice_in_range(
+            slice_start, slice_stop)
+        if self._starts is None:
+            return self._iter_value_ranges(slice_start, slice_stop)
+        return self._iter_table_ranges(slice_start, slice_stop)
+
+    def _iter_table_ranges(self, slice_start, slice_stop):
+        first = self._range_index(slice_start)
+        last = self._range_index(max(slice_start, slice_stop - 1))
+        starts = self._starts[first:last + 1].tolist()
+        stops = starts[1:] + [
+            int(self._starts[last + 1]) if last + 1 < len(self._starts)
+            else self._size]
+        for index, (start, stop) in enumerate(zip(starts, stops)):
+            yield (max(start, slice_start), min(stop, slice_stop),
+                   self._value(first + index))
+
+    def _iter_value_ranges(self, slice_start, slice_stop):
+        previous_start = slice_start
+        previous_value = self._value(slice_start)
+        if isinstance(self._values, numpy.ndarray):
+            changes = array_changes(self._values[slice_start:slice_stop])
+            for change in changes.tolist():
+                change += slice_start
+                yield (previous_start, change, previous_value)
+                previous_start = change
+                previous_value = self._value(change)
+        else:
+            for index in range(slice_start + 1, slice_stop):
+                value = self._values[index]
+                if not self.values_equal(value, previous_value):
+                    yield (previous_start, index, previous_value)
+                    previous_start = index
+                    previous_value = value
+        yield (previous_start, slice_stop, previous_value)
+
+    @overrides(AbstractList.range_arrays)
+    def range_arrays(self):
+        if self._starts is None:
+            return super().range_arrays()
+        # The same types as the base gives, not the compact stored ones
+        starts = self._starts.astype(numpy.intp)
+        stops = numpy.append(starts[1:], self._size)
+        values = self._values
+        if isinstance(values, numpy.ndarray):
+            values = values.tolist()
+        return (read_only(starts), read_only(stops),
+                read_only(range_values_array(values)))
+
+    @overrides(AbstractList.get_default)
+    def get_default(self):
+        return self._default
+
+
+class SharedRangeDictionary(RangeDictionary, AbstractContextManager):
+    """
+    A frozen, read-only :py:class:`RangeDictionary` held in a
+    :py:class:`multiprocessing.shared_memory.SharedMemory` segment so that
+    many processes can read it without each having a copy.
+
+    Use :py:meth:`publish` to copy a dictionary into shared memory, and
+    construct with the :py:attr:`name` of the segment to attach to it from
+    another process.
+    Pickling one of these only pickles the name, so they can be passed
+    directly to process pool workers, which then attach to the segment.
+
+    Ranges and values that are all of one numerical type are held as arrays
+    in the segment and are read in place; other values are copied into
+    each process when it attaches.
+
+    .. note::
+        Every process must :py:meth:`close` the dictionary when done with
+        it. Closing the dictionary returned by :py:meth:`publish` also
+        removes the segment.
+    """
+    __slots__ = [
+        "_memory", "_owner"]
+
+    def __init__(self, name):
+        """
+        :param str name: The name of a segment made by :py:meth:`publish`
+        """
+        # pylint: disable=super-init-not-called
+        if SharedMemory is None:  # pragma: no cover
+            raise NotImplementedError("Shared memory needs Python 3.8")
+        self._owner = False
+        self._attach(SharedMemory(name=name))
+
+    @classmethod
+    def publish(cls, range_dict, name=None):
+        """
+        Copies the current state of a dictionary into a new shared memory
+        segment.
+
+        :param RangeDictionary range_dict: The dictionary to copy
+        :param name: The name of the segment, or ``None`` to generate one
+        :type name: str or None
+        :return: The read-only copy, which owns the segment
+        :rtype: SharedRangeDictionary
+        """
+        if SharedMemory is None:  # pragma: no cover
+            raise NotImplementedError("Shared memory needs Python 3.8")
+        offset = _HEADER.size
+        arrays = []
+        tables = []
+
+        def place(values):
+            # Arrays go in the segment; anything else in the manifest
+            nonlocal offset
+            if isinstance(values, numpy.ndarray) and values.dtype.kind in \
+                    "biuf" and values.ndim == 1:
+                offset = _align(offset)
+                arrays.append((offset, values))
+                spec = (offset, values.dtype.str, len(values))
+                offset += values.nbytes
+                return spec
+            return list(values)
+
+        for key in range_dict.keys():
+            a_list = range_dict.get_list(key)
+            array = held_values_array(a_list)
+            if not a_list.range_based() and array is not None:
+                starts = None
+                values = place(array)
+            else:
+                ranges = list(a_list.iter_ranges())
+                starts = place(numpy.array(
+                    [start for (start, _, _) in ranges],
+                    dtype=numpy.min_scalar_type(len(a_list))))
+                values = place(pack_values(
+                    [value for (_, _, value) in ranges]))
+            tables.append((key, a_list.get_default(), starts, values))
+
+        manifest = pickle.dumps((len(range_dict), tables))
+        memory = SharedMemory(
+            name=name, create=True, size=offset + len(manifest))
+        for (start, values) in arrays:
+            memory.buf[start:start + values.nbytes] = values.tobytes()
+        memory.buf[offset:offset + len(manifest)] = manifest
+        _HEADER.pack_into(memory.buf, 0, offset, len(manifest))
+
+        shared = cls.__new__(cls)
+        shared._owner = True
+        shared._attach(memory)
+        return shared
+
+    def _attach(self, memory):
+        """
+        Builds the read-only lists over the tables in the segment.
+        """
+        self._memory = memory
+        (offset, length) = _HEADER.unpack_from(memory.buf, 0)
+        (size, tables) = pickle.loads(memory.buf[offset:offset + length])
+        super().__init__(size)
+
+        def table(spec):
+            if spec is None or isinstance(spec, list):
+                return spec
+            (start, dtype, count) = spec
+            array = numpy.ndarray(
+                (count, ), dtype=dtype, buffer=memory.buf, offset=start)
+            array.flags.writeable = False
+            return array
+
+        for (key, default, starts, values) in tables:
+            self._value_lists[key] = _SharedRangedList(
+                size, key, default, table(starts), table(values))
+
+    @property
+    def name(self):
+        """
+        The name of the shared memory segment.
+
+        :rtype: str
+        """
+        return self._memory.name
+
+    @overrides(AbstractContextManager.close)
+    def close(self):
+        """
+        Detaches from the segment, and if this process published it also
+        removes it. The dictionary can not be used after this.
+
+        :raises BufferError:
+            If arrays taken from the dictionary are still in use
+        """
+        if self._memory is None:
+            return
+        for a_list in self._value_lists.values():
+            a_list.release()
+        self._value_lists = dict()
+        self._memory.close()
+        if self._owner:
+            self._memory.unlink()
+        self._memory = None
+
+    def __reduce__(self):
+        return (self.__class__, (self.name, ))
+
+    def _refuse_write(self, *args, **kwargs):
+        raise TypeError("A SharedRangeDictionary is read only")
+
+    @overrides(AbstractDict.set_value)
+    def set_value(self, key, value, use_list_as_value=False):
+        self._refuse_write()
+
+    @overrides(RangeDictionary.__setitem__)
+    def __setitem__(self, key, value):
+        self._refuse_write()
+
+    @overrides(RangeDictionary.set_default)
+    def set_default(self, key, default):
+        self._refuse_write()
+
+    @overrides(RangeDictionary.copy_into)
+    def copy_into(self, other):
+        self._refuse_write()
+
+    @overrides(RangeDictionary.copy)
+    def copy(self):
+        copy = RangeDictionary(self._size)
+        copy.copy_into(self)
+        return copy
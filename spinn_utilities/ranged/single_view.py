@@ -37,15 +37,11 @@ class _SingleView(AbstractView):
 
     @overrides(AbstractDict.get_value)
     def get_value(self, key):
-        return self._range_dict.get_list(key).get_value_by_id(the_id=self._id)
+        return self._get_value_by_id(key, self._id)
 
     @overrides(AbstractDict.iter_all_values)
     def iter_all_values(self, key, update_save=False):
-        if isinstance(key, str):
-            yield self._range_dict.get_list(key).get_value_by_id(
-                the_id=self._id)
-        else:
-            yield self._range_dict.get_values_by_id(key=key, the_id=self._id)
+        return self._update_safe_iter_values(key, self.ids())
 
     @overrides(AbstractDict.set_value)
     def set_value(self, key, value, use_list_as_value=False):
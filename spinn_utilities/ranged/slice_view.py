@@ -42,20 +42,17 @@ class _SliceView(AbstractView):
             slice_start=self._start, slice_stop=self._stop)
 
     def update_save_iter_all_values(self, key):
-        ranged_list = self._range_dict.get_list(key)
-        for the_id in self.ids():
-            yield ranged_list.get_value_by_id(the_id=the_id)
+        return self._update_safe_iter_values(key, self.ids())
 
     @overrides(AbstractDict.iter_all_values, extend_defaults=True)
     def iter_all_values(self, key=None, update_save=False):
+        if update_save:
+            return self.update_save_iter_all_values(key)
         if isinstance(key, str):
-            if update_save:
-                return self.update_save_iter_all_values(key)
             return self._range_dict.get_list(key).iter_by_slice(
                 slice_start=self._start, slice_stop=self._stop)
         return self._range_dict.iter_values_by_slice(
-            key=key, slice_start=self._start, slice_stop=self._stop,
-            update_save=update_save)
+            key=key, slice_start=self._start, slice_stop=self._stop)
 
     @overrides(AbstractDict.set_value)
     def set_value(self, key, value, use_list_as_value=False):
@@ -0,0 +1,141 @@
+# Copyright (c) 2023 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from contextlib import contextmanager
+import threading
+
+
+class ReadWriteLock(object):
+    """
+    A re-entrant readers-writer lock.
+
+    Any number of threads may hold the lock for reading at the same time,
+    but a thread holding it for writing has exclusive access.
+    Waiting writers are preferred over new readers so that a steady stream
+    of readers can not starve a writer.
+
+    A thread that already holds the lock may take it again for reading, and
+    a thread that holds it for writing may also take it again for writing.
+    Upgrading a read to a write is *not* supported, as two threads trying to
+    do so at once would deadlock.
+
+    Usage::
+
+        lock = ReadWriteLock()
+        with lock.read():
+            ...
+        with lock.write():
+            ...
+    """
+
+    __slots__ = (
+        "_condition", "_local", "_readers", "_waiting_writers",
+        "_write_depth", "_writer")
+
+    def __init__(self):
+        self._condition = threading.Condition(threading.Lock())
+        self._local = threading.local()
+        self._readers = 0
+        self._waiting_writers = 0
+        self._write_depth = 0
+        self._writer = None
+
+    def acquire_read(self):
+        """
+        Takes the lock for reading, blocking while another thread holds
+        it for writing or is waiting to do so.
+        """
+        depth = getattr(self._local, "read_depth", 0)
+        # A nested read, or a read inside a write, needs no waiting
+        if depth == 0 and self._writer != threading.get_ident():
+            with self._condition:
+                while self._writer is not None or self._waiting_writers:
+                    self._condition.wait()
+                self._readers += 1
+        self._local.read_depth = depth + 1
+
+    def release_read(self):
+        """
+        Releases one hold of the lock for reading.
+
+        :raises RuntimeError: If this thread does not hold the read lock
+        """
+        depth = getattr(self._local, "read_depth", 0)
+        if depth == 0:
+            raise RuntimeError("Read lock released but not held")
+        self._local.read_depth = depth - 1
+        if depth == 1 and self._writer != threading.get_ident():
+            with self._condition:
+                self._readers -= 1
+                if self._readers == 0:
+                    self._condition.notify_all()
+
+    def acquire_write(self):
+        """
+        Takes the lock for writing, blocking until no other thread holds it.
+
+        :raises RuntimeError: If this thread holds the lock for reading only
+        """
+        me = threading.get_ident()
+        if self._writer == me:
+            self._write_depth += 1
+            return
+        if getattr(self._local, "read_depth", 0):
+            raise RuntimeError(
+                "A read lock can not be upgraded to a write lock")
+        with self._condition:
+            self._waiting_writers += 1
+            try:
+                while self._writer is not None or self._readers:
+                    self._condition.wait()
+            finally:
+                self._waiting_writers -= 1
+            self._writer = me
+            self._write_depth = 1
+
+    def release_write(self):
+        """
+        Releases one hold of the lock for writing.
+
+        :raises RuntimeError: If this thread does not hold the write lock
+        """
+        if self._writer != threading.get_ident():
+            raise RuntimeError("Write lock released but not held")
+        self._write_depth -= 1
+        if self._write_depth == 0:
+            with self._condition:
+                self._writer = None
+                self._condition.notify_all()
+
+    @contextmanager
+    def read(self):
+        """
+        Context manager holding the lock for reading.
+        """
+        self.acquire_read()
+        try:
+            yield
+        finally:
+            self.release_read()
+
+    @contextmanager
+    def write(self):
+        """
+        Context manager holding the lock for writing.
+        """
+        self.acquire_write()
+        try:
+            yield
+        finally:
+            self.release_write()
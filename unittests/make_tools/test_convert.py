@@ -14,12 +14,18 @@
 
 import os
 import shutil
+import sqlite3
 import sys
 import tempfile
+import threading
+import time
 import unittest
 
+from spinn_utilities.make_tools.benchmark import (
+    run_benchmarks, run_scanner_benchmark)
 from spinn_utilities.make_tools.converter import convert
-from spinn_utilities.make_tools.log_sqllite_database import LogSqlLiteDatabase
+from spinn_utilities.make_tools.log_sqllite_database import (
+    LogSqlLiteDatabase, SchemaVersionException, SCHEMA_VERSION)
 
 
 class TestConverter(unittest.TestCase):
@@ -64,3 +70,246 @@ class TestConverter(unittest.TestCase):
         convert(src, dest, True)
         self.assertTrue(os.path.exists(e1))
         convert(src, dest, True)
+
+    def _convert_and_read(self, src, dest, jobs, existing=()):
+        shutil.rmtree(dest, ignore_errors=True)
+        # Outputs left from some other build
+        for name in existing:
+            os.makedirs(os.path.dirname(os.path.join(dest, name)),
+                        exist_ok=True)
+            with open(os.path.join(dest, name), "w", encoding="utf-8") as f:
+                f.write("old\n")
+        convert(src, dest, True, jobs)
+        files = {}
+        for dir_path, _, file_names in os.walk(dest):
+            for file_name in file_names:
+                file_path = os.path.join(dir_path, file_name)
+                with open(file_path, "rb") as f:
+                    files[os.path.relpath(file_path, dest)] = f.read()
+        with LogSqlLiteDatabase() as sql:
+            logs = sql._db.execute(
+                "SELECT * FROM log ORDER BY log_id").fetchall()
+            file_rows = sql._db.execute(
+                "SELECT file_id, directory_id, file_name FROM file "
+                "ORDER BY file_id").fetchall()
+            directories = sql._db.execute(
+                "SELECT * FROM directory ORDER BY directory_id").fetchall()
+        return files, logs, file_rows, directories
+
+    def test_parallel(self):
+        class_file = sys.modules[self.__module__].__file__
+        path = os.path.dirname(os.path.abspath(class_file))
+        os.chdir(path)
+        os.environ["C_LOGS_DICT"] = tempfile.mktemp()
+        src = "mock_src"
+        shutil.copyfile("formats.c2", os.path.join(src, "formats.c"))
+        dest = os.path.join(tempfile.mkdtemp(), "modified_src")
+        serial = self._convert_and_read(src, dest, 1)
+        parallel = self._convert_and_read(src, dest, 2)
+        self.assertGreater(len(serial[1]), 0)
+        self.assertEqual(serial, parallel)
+        shutil.rmtree(os.path.dirname(dest))
+
+    def test_parallel_existing_outputs(self):
+        class_file = sys.modules[self.__module__].__file__
+        path = os.path.dirname(os.path.abspath(class_file))
+        os.environ["C_LOGS_DICT"] = tempfile.mktemp()
+        work = tempfile.mkdtemp()
+        src = os.path.join(work, "src")
+        dest = os.path.join(work, "dest")
+        for sub_dir in ("a", "b"):
+            shutil.copytree(os.path.join(path, "mock_src"),
+                            os.path.join(src, sub_dir))
+        for sub_dir in ("a", "b"):
+            existing = [os.path.join(sub_dir, name)
+                        for name in os.listdir(os.path.join(src, sub_dir))]
+            serial = self._convert_and_read(src, dest, 1, existing)
+            parallel = self._convert_and_read(src, dest, 2, existing)
+            self.assertEqual(2, len(serial[3]))
+            self.assertEqual(serial, parallel)
+        shutil.rmtree(work)
+
+    def test_transaction(self):
+        os.environ["C_LOGS_DICT"] = tempfile.mktemp()
+        with LogSqlLiteDatabase(True) as sql:
+            with sql.transaction():
+                directory_id = sql.get_directory_id("src", "dest")
+                file_id = sql.get_file_id(directory_id, "a.c")
+                log_id = sql.set_log_info(20, 3, "kept", file_id)
+            with self.assertRaises(KeyError):
+                with sql.transaction():
+                    with sql.transaction():
+                        sql.set_log_info(20, 4, "lost", file_id)
+                    raise KeyError("roll back")
+            self.assertEqual(log_id, sql.get_max_log_id())
+            sql.check_original("kept")
+            with self.assertRaises(ValueError):
+                sql.check_original("lost")
+
+    def test_migrate(self):
+        self._make_version_1_db().close()
+        with LogSqlLiteDatabase() as sql:
+            self.assertEqual((20, "a.c", 3, "old"), sql.get_log_info(1))
+            self.assertEqual(1, sql.set_log_info(20, 3, "old", 1))
+        db = sqlite3.connect(os.environ["C_LOGS_DICT"])
+        self.assertEqual(
+            [(SCHEMA_VERSION, )],
+            db.execute("SELECT version FROM schema_version").fetchall())
+        indexes = {row[0] for row in db.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'index'")}
+        self.assertTrue({"log_lookup", "file_lookup"} <= indexes)
+        # A database from newer code is not touched
+        db.execute("UPDATE schema_version SET version = version + 1")
+        db.commit()
+        db.close()
+        with self.assertRaises(SchemaVersionException) as context:
+            LogSqlLiteDatabase()
+        self.assertIn("upgrade", str(context.exception))
+
+    def test_migrate_concurrently(self):
+        self._make_version_1_db().close()
+        # Another converter takes the write lock, as if migrating first
+        other = sqlite3.connect(os.environ["C_LOGS_DICT"])
+        other.execute("BEGIN IMMEDIATE")
+        errors = []
+
+        def open_db():
+            try:
+                LogSqlLiteDatabase().close()
+            except Exception as ex:  # pylint: disable=broad-except
+                errors.append(ex)
+
+        thread = threading.Thread(target=open_db)
+        thread.start()
+        # Let the thread see version 1 and wait for the lock
+        time.sleep(0.2)
+        other.execute("ALTER TABLE file ADD COLUMN content_hash STRING")
+        other.execute("ALTER TABLE file ADD COLUMN content_size INTEGER")
+        other.execute("CREATE TABLE schema_version(version INTEGER NOT NULL)")
+        other.execute(
+            "INSERT INTO schema_version VALUES(?)", [SCHEMA_VERSION])
+        other.commit()
+        other.close()
+        thread.join()
+        self.assertEqual([], errors)
+        with LogSqlLiteDatabase() as sql:
+            self.assertEqual((20, "a.c", 3, "old"), sql.get_log_info(1))
+
+    def _make_version_1_db(self):
+        """
+        Makes a database as made before the schema had a version.
+
+        :return: A connection to the database
+        :rtype: ~sqlite3.Connection
+        """
+        os.environ["C_LOGS_DICT"] = tempfile.mktemp()
+        db = sqlite3.connect(os.environ["C_LOGS_DICT"])
+        db.executescript("""
+            CREATE TABLE log(
+                log_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                log_level INTEGER NOT NULL, line_num INTEGER NOT NUll,
+                original STRING NOT NULL, file_id STRING NOT NULL);
+            CREATE TABLE file(
+                file_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                directory_id INTEGER NOT NULL, file_name STRING NOT NULL,
+                convert_time INTEGER, last_build INTEGER);
+            CREATE TABLE directory(
+                directory_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                src_path STRING NOT NULL, dest_path STRING NOT NULL);
+            CREATE VIEW current_file_view AS
+                SELECT log_id, log_level, file_name, line_num, original
+                FROM log NATURAL JOIN file NATURAL JOIN directory
+                WHERE last_build = 1;
+            INSERT INTO directory(src_path, dest_path) VALUES("src", "dest");
+            INSERT INTO file(directory_id, file_name, convert_time, last_build)
+                VALUES(1, "a.c", 0, 1);
+            INSERT INTO log(log_level, line_num, original, file_id)
+                VALUES(20, 3, "old", 1);
+            """)
+        return db
+
+    def test_benchmark(self):
+        results = run_benchmarks(
+            dictionary_sizes=(0, 100), files=2, logs=3, repeat=1)
+        self.assertEqual(4, len(results["results"]))
+        self.assertEqual(SCHEMA_VERSION, results["schema_version"])
+        for result in results["results"]:
+            self.assertGreater(result["first"], 0)
+            self.assertGreater(result["again"], 0)
+            self.assertGreater(result["unchanged"], 0)
+
+    def test_scanner_benchmark(self):
+        results = run_scanner_benchmark(lines=100, repeat=1)
+        self.assertEqual(100, results["lines"])
+        self.assertGreater(results["characters_per_second"], 0)
+
+    def test_incremental(self):
+        class_file = sys.modules[self.__module__].__file__
+        path = os.path.dirname(os.path.abspath(class_file))
+        os.environ["C_LOGS_DICT"] = tempfile.mktemp()
+        work = tempfile.mkdtemp()
+        src = os.path.join(work, "src")
+        dest = os.path.join(work, "dest")
+        shutil.copytree(os.path.join(path, "mock_src"), src)
+        shutil.copyfile(
+            os.path.join(path, "formats.c1"), os.path.join(src, "formats.c"))
+
+        def builds():
+            with LogSqlLiteDatabase() as sql:
+                return sql._db.execute(
+                    "SELECT file_name FROM file ORDER BY file_id").fetchall()
+
+        convert(src, dest, True)
+        first = builds()
+        with LogSqlLiteDatabase() as sql:
+            max_id = sql.get_max_log_id()
+        # Nothing changed so nothing converted
+        convert(src, dest, False)
+        self.assertEqual(first, builds())
+        # Only the changed file is converted
+        shutil.copyfile(
+            os.path.join(path, "formats.c2"), os.path.join(src, "formats.c"))
+        convert(src, dest, False)
+        self.assertEqual(["formats.c"],
+                         [row[0] for row in builds()[len(first):]])
+        with LogSqlLiteDatabase() as sql:
+            self.assertEqual(max_id + 2, sql.get_max_log_id())
+        # A missing converted file is made again, in parallel too
+        os.remove(os.path.join(dest, "bit_field.c"))
+        convert(src, dest, False, 2)
+        self.assertEqual(["formats.c", "bit_field.c"],
+                         [row[0] for row in builds()[len(first):]])
+        self.assertTrue(os.path.exists(os.path.join(dest, "bit_field.c")))
+        shutil.rmtree(work)
+
+    def test_unchanged_output_not_written(self):
+        class_file = sys.modules[self.__module__].__file__
+        path = os.path.dirname(os.path.abspath(class_file))
+        os.environ["C_LOGS_DICT"] = tempfile.mktemp()
+        work = tempfile.mkdtemp()
+        src = os.path.join(work, "src")
+        dest = os.path.join(work, "dest")
+        shutil.copytree(os.path.join(path, "mock_src"), src)
+        shutil.copyfile(
+            os.path.join(path, "formats.c1"), os.path.join(src, "formats.c"))
+        convert(src, dest, True)
+        for file_name in os.listdir(dest):
+            os.utime(os.path.join(dest, file_name), (0, 0))
+        with open(os.path.join(dest, "formats.c"), "rb") as f:
+            formats = f.read()
+        # A new dictionary converts everything again, to the same output
+        convert(src, dest, True)
+        for file_name in os.listdir(dest):
+            self.assertEqual(
+                0, os.path.getmtime(os.path.join(dest, file_name)))
+        # Changed output is replaced, leaving nothing else behind
+        shutil.copyfile(
+            os.path.join(path, "formats.c2"), os.path.join(src, "formats.c"))
+        convert(src, dest, False)
+        with open(os.path.join(dest, "formats.c"), "rb") as f:
+            self.assertNotEqual(formats, f.read())
+        self.assertNotEqual(
+            0, os.path.getmtime(os.path.join(dest, "formats.c")))
+        self.assertFalse(
+            [name for name in os.listdir(dest) if name.endswith(".tmp")])
+        shutil.rmtree(work)
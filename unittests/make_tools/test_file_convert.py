@@ -159,6 +159,22 @@ class TestConverter(unittest.TestCase):
             self.assertIn("open.c", str(ex1))
             self.assertIn("mistakes", str(ex1))
 
+    def test_unclosed_string(self):
+        class_file = sys.modules[self.__module__].__file__
+        path = os.path.dirname(os.path.abspath(class_file))
+        os.environ["C_LOGS_DICT"] = tempfile.mktemp()
+        # clear the database and create a new one
+        LogSqlLiteDatabase(True)
+        src = os.path.join(path, "mistakes")
+        dest = os.path.join(path, "modified_src")
+        try:
+            FileConverter.convert(src, dest, "string.c")
+            assert False
+        except Exception as ex1:
+            self.assertIn('Unclosed string literal in ', str(ex1))
+            self.assertIn("string.c", str(ex1))
+            self.assertIn("line: 19", str(ex1))
+
     def test_too_few(self):
         class_file = sys.modules[self.__module__].__file__
         path = os.path.dirname(os.path.abspath(class_file))
@@ -192,3 +208,11 @@ class TestConverter(unittest.TestCase):
                           str(ex1))
             self.assertIn("mistakes", str(ex1))
             self.assertIn("too_many.c", str(ex1))
+
+    def test_render_in_memory(self):
+        text, logs = FileConverter.render_in_memory(
+            "/src/a.c", "/dest/a.c",
+            'int a;\nlog_info("a is %d", a); /* note */\n')
+        self.assertIn("GENERATED FROM ../../src/a.c", text)
+        self.assertEqual([(20, 2, "a is %d")], logs)
+        self.assertIn('log_mini_info("%u\x1e%d", \x000\x00,  a);', text)
@@ -26,11 +26,16 @@ Note: if weird,file.c changes you may have to manually fix the tests
     especially the log_id and row numbers
 """
 
+import io
 import math
+import shutil
+import tempfile
 import unittest
 import os
-from spinn_utilities.make_tools.replacer import Replacer
+from spinn_utilities.make_tools import iobuf_decoder
+from spinn_utilities.make_tools.replacer import Replacer, _Template
 from spinn_utilities.make_tools.file_converter import TOKEN
+from spinn_utilities.make_tools.log_sqllite_database import LogSqlLiteDatabase
 
 PATH = os.path.dirname(os.path.abspath(__file__))
 
@@ -154,3 +159,108 @@ class TestReplacer(unittest.TestCase):
             assert self.near_equals(
                 0.0000000004,
                 replacer._hexes_to_double("3dfb7cdf", "d9d7bdbb"))
+
+    def test_refresh(self):
+        os.environ["C_LOGS_DICT"] = tempfile.mktemp()
+        with LogSqlLiteDatabase(True) as sql:
+            directory_id = sql.get_directory_id("src", "dest")
+            file_id = sql.get_file_id(directory_id, "a.c")
+            first = sql.set_log_info(20, 3, "first", file_id)
+        replacer = Replacer()
+        self.assertEqual("[INFO] (a.c: 3): first", replacer.replace(
+            str(first)))
+        self.assertFalse(replacer.refresh())
+        # A log added by another connection is found when first asked for
+        with LogSqlLiteDatabase() as sql:
+            second = sql.set_log_info(30, 4, "second", file_id)
+        self.assertEqual("[WARN] (a.c: 4): second", replacer.replace(
+            str(second)))
+        # A log moved to a new build is seen once refreshed
+        with LogSqlLiteDatabase() as sql:
+            file_id = sql.get_file_id(directory_id, "b.c")
+            sql.set_log_info(20, 3, "first", file_id)
+        self.assertTrue(replacer.refresh())
+        self.assertEqual("[INFO] (b.c: 3): first", replacer.replace(
+            str(first)))
+        replacer.close()
+
+    def test_template(self):
+        template = _Template("a %d b %5u %%d %f c %F\\t%x")
+        self.assertEqual(
+            "a 1 b 2 3 -3.0 c 23.6\t5", template.format(
+                ["9", "1", "2", "3", "c0400000", "40379999", "9999999a",
+                 "5"]))
+        # The escapes are still decoded when there are no values
+        self.assertEqual("a %d b %5u %%d %f c %F\t%x", template.format(["9"]))
+        with self.assertRaises(IndexError):
+            template.format(["9", "1"])
+        self.assertEqual("12", _Template("%d%d").format(["9", "1", "2"]))
+
+    def test_template_value_like_format(self):
+        # A value that looks like a format is not replaced by a later value
+        self.assertEqual(
+            "%d and 5", _Template("%s and %d").format(["1", "%d", "5"]))
+
+    def test_replace_lines(self):
+        os.environ["C_LOGS_DICT"] = str(os.path.join(PATH, "replacer.sqlite3"))
+        lines = ["5\n", "2" + TOKEN + "0xc0400000\r\n", "not a log\n", "5"]
+        with Replacer() as replacer:
+            self.assertEqual([
+                "[INFO] (weird,file.c: 37): this is ok\n",
+                "[INFO] (weird,file.c: 31): test -three -3.0\r\n",
+                "not a log\n",
+                "[INFO] (weird,file.c: 37): this is ok"],
+                list(replacer.replace_lines(lines, chunk_size=3)))
+
+    def test_iobuf_decoder(self):
+        os.environ["C_LOGS_DICT"] = str(os.path.join(PATH, "replacer.sqlite3"))
+        work = tempfile.mkdtemp()
+        iobuf = "5\n" + "11" + TOKEN + "10" + TOKEN + "20\n" + "other \xff\n"
+        expected = (
+            "[INFO] (weird,file.c: 37): this is ok\n"
+            "[INFO] (weird,file.c: 57): \t back off = 10, time between "
+            "spikes 20\nother \xff\n")
+        sources = []
+        for name in ("a.txt", "b.txt"):
+            sources.append(os.path.join(work, name))
+            with open(sources[-1], "w", encoding="utf-8") as f:
+                f.write(iobuf)
+        output_dir = os.path.join(work, "decoded")
+        iobuf_decoder.main(
+            sources + ["--output-dir", output_dir, "--jobs", "2"])
+        for name in ("a.txt", "b.txt"):
+            with open(os.path.join(output_dir, name),
+                      encoding="utf-8") as f:
+                self.assertEqual(expected, f.read())
+        with Replacer() as replacer:
+            out_f = io.StringIO()
+            self.assertEqual((3, len(iobuf)), iobuf_decoder.decode_stream(
+                replacer, io.StringIO(iobuf), out_f))
+        self.assertEqual(expected, out_f.getvalue())
+        # Leaving the block closes the database
+        self.assertIsNone(replacer._db)
+        # Files with the same name would be decoded to the same file
+        os.mkdir(os.path.join(work, "other"))
+        sources.append(os.path.join(work, "other", "a.txt"))
+        shutil.copy(sources[0], sources[-1])
+        with self.assertRaises(SystemExit):
+            iobuf_decoder.main(sources + ["--output-dir", output_dir])
+        shutil.rmtree(work)
+
+    def test_replace_all(self):
+        os.environ["C_LOGS_DICT"] = str(os.path.join(PATH, "replacer.sqlite3"))
+        shorts = [
+            "2" + TOKEN + hex_value for hex_value in (
+                "0xc0400000", "7fc00000", "ffc00001", "80000000", "1",
+                "7f800000", "c0400000")] + [
+            "3" + TOKEN + "40379999" + TOKEN + "9999999a",
+            "3" + TOKEN + "40379999", "5", "11" + TOKEN + "10", "plain"]
+        with Replacer() as replacer:
+            expected = [replacer.replace(short) for short in shorts]
+            self.assertEqual(expected, replacer._replace_all(shorts))
+            self.assertEqual(
+                "[INFO] (weird,file.c: 31): test -three -0.0", expected[3])
+            # A value that is not a word fails only its own line
+            bad = shorts + ["2" + TOKEN + "100000000"]
+            self.assertEqual(expected + [bad[-1]], replacer._replace_all(bad))
+            self.assertEqual([], replacer._replace_all([]))
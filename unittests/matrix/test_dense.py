@@ -0,0 +1,57 @@
+# Copyright (c) 2023 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy
+import pytest
+from spinn_utilities.matrix import DenseMatrix, DoubleDict
+
+
+def test_get_set():
+    matrix = DenseMatrix(["a", "b", "c"], [1, 2])
+    assert matrix.get_data("b", 2) == 0
+    matrix.set_data("b", 2, 3.5)
+    assert matrix.get_data("b", 2) == 3.5
+    assert type(matrix.get_data("b", 2)) is float
+    assert matrix.x_keys == ("a", "b", "c")
+    assert matrix.y_keys == (1, 2)
+    assert matrix.array.shape == (3, 2)
+    with pytest.raises(KeyError):
+        matrix.get_data("d", 1)
+    with pytest.raises(KeyError):
+        matrix.set_data("a", 3, 1.0)
+    with pytest.raises(ValueError):
+        DenseMatrix(["a", "a"], [1])
+
+
+def test_double_dict():
+    matrix = DenseMatrix(["foo", "bar"], [1, 2], dtype=object, fill_value="")
+    double = DoubleDict(xtype=str, ytype=int, matrix=matrix)
+    double["foo"][1] = "One"
+    double[2]["bar"] = "Two"
+    assert double["bar"][2] == "Two"
+    assert double[1]["foo"] == "One"
+    double["bar"] = {1: "Uno"}
+    assert matrix.get_data("bar", 1) == "Uno"
+
+
+def test_views():
+    matrix = DenseMatrix(["a", "b"], [1, 2, 3], dtype=numpy.int32)
+    row = matrix.row_array("a")
+    column = matrix.column_array(2)
+    row[:] = [1, 2, 3]
+    assert matrix.get_data("a", 3) == 3
+    matrix.set_data("b", 2, 7)
+    assert column.tolist() == [2, 7]
+    assert numpy.shares_memory(row, matrix.array)
+    assert numpy.shares_memory(column, matrix.array)
@@ -12,7 +12,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from spinn_utilities.matrix import DoubleDict, DemoMatrix
+import numpy
+import pytest
+from spinn_utilities.matrix import (
+    DoubleDict, DemoMatrix, DenseMatrix, SparseMatrix)
 
 
 def test_insert():
@@ -85,3 +88,38 @@ def test_errors():
         assert False
     except KeyError as ex:
         assert "unexpected type" in str(ex)
+
+
+@pytest.mark.parametrize("matrix", [
+    DemoMatrix(), DenseMatrix(["foo", "bar"], [1, 2, 3], dtype=object),
+    SparseMatrix(dtype=object)])
+def test_bulk(matrix):
+    double = DoubleDict(xtype=str, ytype=int, matrix=matrix)
+    double["foo"] = {1: "a", 2: "b"}
+    double["bar"] = (numpy.array([3, 1]), ["c", "d"])
+    double[2] = (["bar"], ["e"])
+    double[3] = {"foo": "f"}
+    assert matrix.get_data("foo", 1) == "a"
+    assert matrix.get_data("foo", 2) == "b"
+    assert matrix.get_data("foo", 3) == "f"
+    assert matrix.get_data("bar", 1) == "d"
+    assert matrix.get_data("bar", 2) == "e"
+    assert matrix.get_data("bar", 3) == "c"
+    with pytest.raises(ValueError):
+        double["foo"] = (numpy.array([1.5]), ["x"])
+    with pytest.raises(ValueError):
+        double["foo"] = (numpy.array([1, 2]), ["x"])
+    with pytest.raises(ValueError):
+        double[1] = (numpy.array(["foo"]), [])
+
+
+def test_set_row_and_column():
+    matrix = DenseMatrix(["a", "b", "c"], [1, 2])
+    matrix.set_row("b", {1: 1.5, 2: 2.5})
+    matrix.set_column(1, ["a", "c"], numpy.array([3.5, 4.5]))
+    assert matrix.array.tolist() == [[3.5, 0], [1.5, 2.5], [4.5, 0]]
+    sparse = SparseMatrix()
+    sparse.set_data("a", 1, 9.0)
+    sparse.get_data("a", 1)
+    sparse.set_row("a", [1, 2], [1.0, 2.0])
+    assert list(sparse.iter_row("a")) == [(1, 1.0), (2, 2.0)]
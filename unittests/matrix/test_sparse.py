@@ -0,0 +1,99 @@
+# Copyright (c) 2023 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import os
+import tempfile
+from spinn_utilities.matrix import DoubleDict, SparseMatrix
+from spinn_utilities.matrix.benchmark import MATRICES, main, run_benchmarks
+
+
+def test_get_set():
+    matrix = SparseMatrix()
+    assert matrix.get_data("a", 1) == 0
+    matrix.set_data("a", 1, 1.5)
+    matrix.set_data("b", 2, 2.5)
+    matrix.set_data("a", 1, 3.5)
+    assert matrix.get_data("a", 1) == 3.5
+    assert matrix.get_data("a", 2) == 0
+    assert matrix.get_data("c", 2) == 0
+    assert len(matrix) == 2
+    # Frozen cells are updated in place, new ones added on the next read
+    matrix.set_data("b", 2, 4.5)
+    matrix.set_data("b", 1, 5.5)
+    assert matrix.get_data("b", 2) == 4.5
+    assert matrix.get_data("b", 1) == 5.5
+    assert len(matrix) == 3
+    assert matrix.x_keys == ("a", "b")
+    assert matrix.y_keys == (1, 2)
+
+
+def test_set_data_after_set_row():
+    matrix = SparseMatrix()
+    matrix.set_data("a", 1, 1.0)
+    assert len(matrix) == 1
+    matrix.set_row("a", [1, 2], [2.0, 2.0])
+    matrix.set_data("a", 1, 3.0)
+    assert matrix.get_data("a", 1) == 3.0
+    matrix.set_column(2, ["a", "b"], [4.0, 4.0])
+    matrix.set_data("a", 2, 5.0)
+    matrix.set_data("b", 2, 6.0)
+    assert list(matrix.iter_row("a")) == [(1, 3.0), (2, 5.0)]
+    assert list(matrix.iter_column(2)) == [("a", 5.0), ("b", 6.0)]
+
+
+def test_rows_and_columns():
+    matrix = SparseMatrix(dtype=int, fill_value=-1)
+    for x in range(5):
+        for y in range(x, 5):
+            matrix.set_data(x, y, x * 10 + y)
+    assert list(matrix.iter_row(2)) == [(2, 22), (3, 23), (4, 24)]
+    assert list(matrix.iter_column(2)) == [(0, 2), (1, 12), (2, 22)]
+    assert list(matrix.iter_row(7)) == []
+    matrix.set_data(7, 2, 72)
+    assert list(matrix.iter_column(2))[-1] == (7, 72)
+    assert list(matrix.iter_row(7)) == [(2, 72)]
+    assert matrix.get_data(4, 0) == -1
+
+
+def test_objects_and_double_dict():
+    matrix = SparseMatrix(dtype=object, fill_value=None)
+    double = DoubleDict(xtype=str, ytype=int, matrix=matrix)
+    double["foo"][1] = [1, 2]
+    double[2]["bar"] = "Two"
+    assert double["foo"][1] == [1, 2]
+    assert double[2]["bar"] == "Two"
+    assert double["bar"][1] is None
+    double["foo"] = {1: (3, 4), 2: "x"}
+    assert double[1]["foo"] == (3, 4)
+    assert list(matrix.iter_row("foo")) == [(1, (3, 4)), (2, "x")]
+
+
+def test_benchmark():
+    results = run_benchmarks(sizes=[20], densities=[0.1], repeat=1)
+    assert [result["matrix"] for result in results["results"]] == list(
+        MATRICES)
+    for result in results["results"]:
+        assert result["memory"] > 0
+        assert result["build"] > 0
+
+
+def test_benchmark_main():
+    output = os.path.join(tempfile.mkdtemp(), "matrix.json")
+    main(["--sizes", "10", "--densities", "0.5", "--matrices", "sparse",
+          "--repeat", "1", "--output", output])
+    with open(output, encoding="utf-8") as f:
+        results = json.load(f)
+    assert [result["matrix"] for result in results["results"]] == ["sparse"]
+    os.remove(output)
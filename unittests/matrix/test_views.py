@@ -0,0 +1,71 @@
+# Copyright (c) 2023 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy
+import pytest
+from spinn_utilities.matrix import (
+    AbstractMatrix, DemoMatrix, DenseMatrix, DoubleDict, SparseMatrix)
+from spinn_utilities.overrides import overrides
+
+
+def _fill(matrix):
+    double = DoubleDict(xtype=str, ytype=int, matrix=matrix)
+    double["a"] = {1: 1.5, 3: 3.5}
+    double["b"] = {2: 2.5}
+    return double
+
+
+@pytest.mark.parametrize("matrix", [DemoMatrix(), SparseMatrix()])
+def test_held_values(matrix):
+    double = _fill(matrix)
+    assert double["a"].keys() == [1, 3]
+    assert list(double["a"]) == [1, 3]
+    assert len(double["a"]) == 2
+    assert double["a"].values() == [1.5, 3.5]
+    assert double["a"].items() == [(1, 1.5), (3, 3.5)]
+    assert double["a"].to_dict() == {1: 1.5, 3: 3.5}
+    assert double["a"].to_numpy().tolist() == [1.5, 3.5]
+    assert double[2].to_dict() == {"b": 2.5}
+    assert double[3].items() == [("a", 3.5)]
+    assert len(double["c"]) == 0
+    assert double[4].to_dict() == {}
+
+
+def test_dense():
+    matrix = DenseMatrix(["a", "b"], [1, 2, 3])
+    double = _fill(matrix)
+    assert double["a"].to_dict() == {1: 1.5, 2: 0, 3: 3.5}
+    assert len(double[2]) == 2
+    assert double[2].items() == [("a", 0), ("b", 2.5)]
+    column = double[3].to_numpy()
+    assert numpy.shares_memory(column, matrix.array)
+
+
+class _Unlisted(AbstractMatrix):
+    @overrides(AbstractMatrix.get_data)
+    def get_data(self, x, y):
+        return 0
+
+    @overrides(AbstractMatrix.set_data)
+    def set_data(self, x, y, value):
+        pass
+
+
+def test_not_listable():
+    double = DoubleDict(xtype=str, ytype=int, matrix=_Unlisted())
+    assert double["a"][1] == 0
+    with pytest.raises(NotImplementedError):
+        double["a"].keys()
+    with pytest.raises(NotImplementedError):
+        len(double[1])
@@ -0,0 +1,80 @@
+# Copyright (c) 2023 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy
+import pytest
+from spinn_utilities.ranged import (
+    ArrayDualList, MultipleValuesException, RangedList)
+
+
+def test_piecewise_constant():
+    rl = RangedList(8, 2.0)
+    rl[6:8] = 4.0
+    array = numpy.array([1, 1, 1, 1, 3, 3, 3, 3])
+    result = rl * array
+    assert isinstance(result, ArrayDualList)
+    assert result.range_based()
+    assert list(result.iter_ranges()) == [
+        (0, 4, 2.0), (4, 6, 6.0), (6, 8, 12.0)]
+    assert list(result) == [2, 2, 2, 2, 6, 6, 12, 12]
+    assert result.get_single_value_by_slice(0, 4) == 2
+    assert result.get_single_value_by_ids([4, 5]) == 6
+    with pytest.raises(MultipleValuesException):
+        result.get_single_value_by_slice(3, 5)
+
+
+def test_per_element():
+    rl = RangedList(5, 10)
+    array = numpy.arange(5)
+    assert not (rl + array).range_based()
+    assert list(rl + array) == [10, 11, 12, 13, 14]
+    assert list(rl - array) == [10, 9, 8, 7, 6]
+    assert list((rl // (array + 1)).iter_by_slice(1, 4)) == [5, 3, 2]
+    assert (rl / (array + 1))[3] == 2.5
+    rl[2] = 20
+    assert list(rl + array) == [10, 11, 22, 13, 14]
+
+
+def test_non_range_based_list():
+    rl = RangedList(4, [1, 2, 3, 4])
+    array = numpy.array([10, 10, 20, 20])
+    assert list(rl * array) == [10, 20, 60, 80]
+    assert list((rl * array).iter_ranges()) == [
+        (0, 1, 10), (1, 2, 20), (2, 3, 60), (3, 4, 80)]
+
+
+def test_array_values():
+    rl = RangedList(3, numpy.arange(2), use_list_as_value=True)
+    result = list(rl + numpy.array([0, 10, 10]))
+    assert numpy.array_equal(result, [[0, 1], [10, 11], [10, 11]])
+
+
+def test_bad_arrays():
+    rl = RangedList(3, 1)
+    with pytest.raises(ValueError):
+        rl + numpy.arange(4)
+    with pytest.raises(ZeroDivisionError):
+        rl / numpy.arange(3)
+    with pytest.raises(ZeroDivisionError):
+        rl // numpy.arange(3)
+
+
+def test_0d_array():
+    rl = RangedList(3, 2)
+    result = rl * numpy.array(3)
+    assert not isinstance(result, ArrayDualList)
+    assert list(result) == [6, 6, 6]
+    assert list(rl + numpy.array(1.5)) == [3.5, 3.5, 3.5]
+    with pytest.raises(ZeroDivisionError):
+        rl / numpy.array(0)
@@ -113,3 +113,15 @@ def test_defaults():
 def test_str():
     s = str(ranged_view)
     assert len(s) > 0
+
+
+def test_iter_values_update_safe():
+    rd1 = RangeDictionary(10, defaults)
+    view = rd1[[8, 2, 3]]
+    values = view.iter_all_values("a", update_save=True)
+    assert next(values) == "alpha"
+    rd1["a"][2] = "x"
+    assert list(values) == ["x", "alpha"]
+    assert list(view.iter_all_values(None, update_save=True)) == [
+        {"a": "alpha", "b": "bravo"}, {"a": "x", "b": "bravo"},
+        {"a": "alpha", "b": "bravo"}]
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import random
 import pytest
 from spinn_utilities.ranged import RangeDictionary
 from spinn_utilities.ranged.single_view import _SingleView
@@ -190,3 +191,41 @@ def test_check_slice_in_range():
     assert (2, 10) == rd._check_slice_in_range(2, 12)
     assert (10, 10) == rd._check_slice_in_range(10, 12)
     assert (10, 10) == rd._check_slice_in_range(4, 2)
+
+
+def test_update_safe_cursor():
+    rd1 = RangeDictionary(10, defaults)
+    rd1["a"][5] = "x"
+    slice_view1 = rd1[3:9]
+    values = slice_view1.iter_all_values("a", update_save=True)
+    assert next(values) == "alpha"
+    assert next(values) == "alpha"
+    rd1["a"][3:8] = "y"
+    assert list(values) == ["y", "y", "y", "alpha"]
+    both = slice_view1.iter_all_values(["a", "b"], update_save=True)
+    assert next(both) == {"a": "y", "b": "bravo"}
+    rd1["b"] = "z"
+    assert next(both) == {"a": "y", "b": "z"}
+
+
+def test_get_values():
+    rd1 = RangeDictionary(10, defaults)
+    rd1["a"][5] = "x"
+    assert rd1[4:7].get_values() == {
+        "a": ["alpha", "x", "alpha"], "b": ["bravo", "bravo", "bravo"]}
+    assert rd1[4:7].get_values("a") == {"a": ["alpha", "x", "alpha"]}
+    assert rd1[5].get_values(["b"]) == {"b": ["bravo"]}
+    assert rd1[[6, 5, 1]].get_values("a") == {"a": ["alpha", "x", "alpha"]}
+
+
+def test_get_values_shuffled_ids():
+    rd1 = RangeDictionary(100, {"a": 0, "b": "bravo"})
+    for i in range(0, 100, 5):
+        rd1["a"][i] = i
+        rd1["b"][i] = str(i)
+    ids = list(range(100))
+    random.Random(42).shuffle(ids)
+    values = rd1[ids].get_values()
+    assert values["a"] == [i if i % 5 == 0 else 0 for i in ids]
+    assert values["b"] == [str(i) if i % 5 == 0 else "bravo" for i in ids]
+    assert values["a"] == [rd1["a"][i] for i in ids]
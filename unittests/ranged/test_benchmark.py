@@ -0,0 +1,54 @@
+# Copyright (c) 2023 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import os
+import tempfile
+from spinn_utilities.ranged.benchmark import (
+    BENCHMARKS, FRAGMENTATION, compare, main, run_benchmarks)
+
+
+def test_run_benchmarks():
+    results = run_benchmarks(sizes=[1000], repeat=1)
+    assert len(results["results"]) == len(BENCHMARKS) * len(FRAGMENTATION)
+    for result in results["results"]:
+        assert result["min"] >= 0
+    json.dumps(results)
+
+
+def test_select_and_compare():
+    old = run_benchmarks(
+        sizes=[100], fragmentations=["high"],
+        benchmarks=["list.", "dict.merge"], repeat=2)
+    names = {result["benchmark"] for result in old["results"]}
+    assert "dict.merge" in names
+    assert all(name.startswith("list.") or name == "dict.merge"
+               for name in names)
+    new = run_benchmarks(
+        sizes=[100], fragmentations=["high"], benchmarks=["dict.merge"],
+        repeat=1)
+    comparison = compare(old, new)
+    assert [row[:3] for row in comparison] == [("dict.merge", 100, "high")]
+
+
+def test_main(capsys):
+    with tempfile.TemporaryDirectory() as directory:
+        old = os.path.join(directory, "old.json")
+        new = os.path.join(directory, "new.json")
+        for output in (old, new):
+            main(["--sizes", "1e2", "--fragmentation", "low",
+                  "--benchmarks", "view.", "--repeat", "1",
+                  "--output", output])
+        main(["--compare", old, new])
+    assert "view.get_values" in capsys.readouterr().out
@@ -16,6 +16,8 @@ import pytest
 import numpy
 from spinn_utilities.ranged import MultipleValuesException
 from spinn_utilities.ranged import RangedList
+from spinn_utilities.ranged.abstract_list import values_equal
+from spinn_utilities.ranged.ranged_list import iterator_to_ranges
 
 
 def test_simple():
@@ -483,3 +485,136 @@ def test_numpy_selector():
     rl = RangedList(value=range(5))
     selector = numpy.array([1, 3, 4])
     assert [1, 3, 4] == rl.selector_to_ids(selector)
+
+
+def test_generator():
+    rl = RangedList(10, (i // 4 for i in range(10)))
+    assert rl.range_based()
+    assert rl.get_ranges() == [(0, 4, 0), (4, 8, 1), (8, 10, 2)]
+    assert list(rl) == [0, 0, 0, 0, 1, 1, 1, 1, 2, 2]
+    with pytest.raises(ValueError):
+        RangedList(10, (i for i in range(9)))
+    with pytest.raises(ValueError):
+        RangedList(10, (i for i in range(11)))
+
+
+def test_generator_incompressible():
+    rl = RangedList(10, (i // 2 if i < 4 else i for i in range(10)))
+    assert not rl.range_based()
+    assert list(rl) == [0, 0, 1, 1, 4, 5, 6, 7, 8, 9]
+    assert rl[7] == 7
+    rl[3] = "a"
+    assert rl.get_ranges()[:3] == [(0, 2, 0), (2, 3, 1), (3, 4, "a")]
+
+
+def test_generator_by_slice():
+    rl = RangedList(10, "a")
+    rl[2:8] = iter(["b", "b", "c", "c", "a", "a"])
+    assert rl.get_ranges() == [(0, 2, "a"), (2, 4, "b"), (4, 6, "c"),
+                               (6, 10, "a")]
+    with pytest.raises(ValueError):
+        rl[2:8] = iter(["b"])
+    assert rl.get_ranges() == [(0, 2, "a"), (2, 4, "b"), (4, 6, "c"),
+                               (6, 10, "a")]
+
+
+def test_iterator_to_ranges_chunks():
+    values = iter([1, 1, 1, 2, 2, 3, 3, 3, 3])
+    assert iterator_to_ranges(values, 9, chunk_size=2) == [
+        (0, 3, 1), (3, 5, 2), (5, 9, 3)]
+    assert iterator_to_ranges(iter([]), 0) == []
+
+
+def test_values_equal():
+    assert values_equal(1, 1.0)
+    assert values_equal("a", "a")
+    assert not values_equal(1, "1")
+    assert not values_equal(float("nan"), float("nan"))
+    assert values_equal(numpy.float64(2), 2)
+    assert values_equal(numpy.arange(3), [0, 1, 2])
+    assert not values_equal(numpy.arange(3), numpy.arange(4))
+    assert not values_equal(numpy.arange(3), 1)
+
+
+def test_plugged_values_equal():
+    class CaseInsensitiveList(RangedList):
+        __slots__ = []
+
+        @staticmethod
+        def values_equal(value, other):
+            return value.lower() == other.lower()
+
+    rl = CaseInsensitiveList(5, "a")
+    rl[2] = "A"
+    assert rl.get_ranges() == [(0, 5, "a")]
+    rl[1:3] = "B"
+    rl[3] = "b"
+    assert rl.get_ranges() == [(0, 1, "a"), (1, 4, "b"), (4, 5, "a")]
+    assert rl.count("b") == 3
+
+
+def test_eq_ranges_not_aligned():
+    rl = RangedList(6, 3)
+    dual = RangedList(6, 1) + RangedList(6, [2, 2, 2, 2, 2, 2])
+    # The dual list ranges are not merged but the values are the same
+    assert len(list(dual.iter_ranges())) == 1
+    assert rl == dual
+    other = RangedList(6, 3)
+    other[2:4] = 4
+    rl[2] = 4
+    assert rl != other
+    rl[3] = 4
+    assert rl == other
+    assert rl != RangedList(5, 3)
+
+
+def test_eq_stops_early():
+    calls = []
+
+    class CountingList(RangedList):
+        __slots__ = []
+
+        @staticmethod
+        def values_equal(value, other):
+            calls.append((value, other))
+            return value == other
+
+    rl = CountingList(1000, list(range(1000)))
+    other = RangedList(1000, list(range(1000)))
+    other[1] = -1
+    assert not rl == other
+    assert calls == [(0, 0), (1, -1)]
+
+    calls.clear()
+    rl = CountingList(1000, 0)
+    rl[10:20] = 1
+    other = RangedList(1000, 0)
+    other[10:15] = 2
+    calls.clear()
+    assert not rl == other
+    assert calls == [(0, 0), (1, 2)]
+
+
+def test_eq_other_types():
+    rl = RangedList(3, [1, 2, 3])
+    assert rl == [1, 2, 3]
+    assert rl == (1, 2, 3)
+    assert rl == numpy.array([1, 2, 3])
+    assert not rl == [1, 2]
+    assert not rl == [1, 2, 4]
+
+
+def test_get_value_by_id_with_cursor():
+    rl = RangedList(10, 0, "a")
+    rl[3:5] = 1
+    rl[7] = 2
+    cursor = 0
+    values = []
+    for the_id in range(10):
+        value, cursor = rl.get_value_by_id_with_cursor(the_id, cursor)
+        values.append(value)
+    assert values == list(rl)
+    # A stale cursor is only a hint
+    rl[0:9] = 4
+    assert rl.get_value_by_id_with_cursor(8, cursor) == (4, 0)
+    assert rl.get_value_by_id_with_cursor(9, 7)[0] == 0
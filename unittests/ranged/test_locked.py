@@ -0,0 +1,149 @@
+# Copyright (c) 2023 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+from spinn_utilities.ranged import (
+    LockedRangeDictionary, LockedRangedList, RangedList)
+
+SIZE = 100
+
+
+def test_list_api():
+    rl = LockedRangedList(10, "a")
+    rl[3:5] = "b"
+    rl[7] = "c"
+    assert rl.get_ranges() == [
+        (0, 3, "a"), (3, 5, "b"), (5, 7, "a"), (7, 8, "c"), (8, 10, "a")]
+    assert list(rl.iter_by_slice(2, 4)) == ["a", "b"]
+    assert rl.get_single_value_by_ids([0, 5]) == "a"
+    copy = rl.copy()
+    assert type(copy) is RangedList
+    assert copy == rl
+
+
+def test_iterator_is_snapshot():
+    rl = LockedRangedList(10, "a")
+    values = iter(rl)
+    ranges = rl.iter_ranges()
+    rl[0:10] = "b"
+    assert list(values) == ["a"] * 10
+    assert list(ranges) == [(0, 10, "a")]
+
+
+def test_snapshot():
+    rl = LockedRangedList(6, [1, 2, 3, 4, 5, 6])
+    rl.set_default(0)
+    snapshot = rl.snapshot()
+    assert type(snapshot) is RangedList
+    assert not snapshot.range_based()
+    assert snapshot.get_default() == 0
+    rl[0] = 9
+    assert list(snapshot) == [1, 2, 3, 4, 5, 6]
+    snapshot = RangedList(10, "a").snapshot()
+    assert snapshot.get_ranges() == [(0, 10, "a")]
+
+
+def test_dict_api():
+    rd = LockedRangeDictionary(10, {"a": 1, "b": 2})
+    rd["c"] = 3
+    assert isinstance(rd["c"], LockedRangedList)
+    assert rd["c"].lock is rd.lock
+    rd[2:4]["a"] = 5
+    assert list(rd.iter_ranges(key="a")) == [(0, 2, 1), (2, 4, 5), (4, 10, 1)]
+    copy = rd.copy()
+    assert isinstance(copy, LockedRangeDictionary)
+    assert copy.get_ranges() == rd.get_ranges()
+    rd.set_value("a", 7)
+    assert copy["a"].get_ranges() == [(0, 2, 1), (2, 4, 5), (4, 10, 1)]
+
+
+def test_update_safe_iterator_sees_writes():
+    rd = LockedRangeDictionary(4, {"a": 1})
+    values = rd.iter_all_values("a", update_save=True)
+    assert next(values) == 1
+    rd["a"] = 2
+    assert list(values) == [2, 2, 2]
+    rl = LockedRangedList(4, 1)
+    lock = rd.lock
+    rl.lock = lock
+    assert rl.lock is lock
+
+
+def _check_tiled(ranges):
+    assert ranges[0][0] == 0
+    assert ranges[-1][1] == SIZE
+    for (_, stop, _), (start, _, _) in zip(ranges, ranges[1:]):
+        assert stop == start
+
+
+def _run(readers, writers):
+    errors = []
+    stop = threading.Event()
+
+    def wrap(target):
+        def run():
+            try:
+                while not stop.is_set():
+                    target()
+            except Exception as ex:  # pylint: disable=broad-except
+                errors.append(ex)
+                stop.set()
+        return run
+
+    threads = [threading.Thread(target=wrap(target))
+               for target in readers + writers]
+    for thread in threads:
+        thread.start()
+    stop.wait(0.5)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    assert errors == []
+
+
+def test_stress_list():
+    rl = LockedRangedList(SIZE, 0)
+    counter = iter(range(1, 10 ** 9))
+
+    def writer():
+        value = next(counter)
+        start = value % SIZE
+        rl[start:start + 7] = value
+        rl[value % 13] = -value
+
+    def reader():
+        _check_tiled(list(rl.iter_ranges()))
+        assert len(list(rl)) == SIZE
+
+    _run([reader] * 4, [writer] * 2)
+
+
+def test_stress_dict():
+    rd = LockedRangeDictionary(SIZE, {"a": 0, "b": 0})
+    counter = iter(range(1, 10 ** 9))
+
+    def writer():
+        value = next(counter)
+        start = value % SIZE
+        with rd.lock.write():
+            rd[start:start + 5]["a"] = value
+            rd[start:start + 5]["b"] = value
+
+    def reader():
+        ranges = list(rd.iter_ranges())
+        _check_tiled(ranges)
+        for (_, _, values) in ranges:
+            assert values["a"] == values["b"]
+
+    _run([reader] * 4, [writer] * 2)
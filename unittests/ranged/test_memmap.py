@@ -0,0 +1,137 @@
+# Copyright (c) 2023 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import numpy
+import pytest
+from spinn_utilities.config_setup import unittest_setup
+from spinn_utilities.data import UtilsDataView
+from spinn_utilities.ranged import (
+    MemmapRangedList, MultipleValuesException, RangedList)
+
+
+def setup_module():
+    unittest_setup()
+
+
+def _files():
+    return [name for name in os.listdir(UtilsDataView.get_run_dir_path())
+            if name.endswith(".memmap")]
+
+
+def test_range_based():
+    rl = MemmapRangedList(10, 1.5)
+    assert rl.range_based()
+    rl[3:5] = 2.5
+    assert rl.get_ranges() == [(0, 3, 1.5), (3, 5, 2.5), (5, 10, 1.5)]
+
+
+def test_list_mode():
+    before = len(_files())
+    rl = MemmapRangedList(10, [1, 1, 2, 2, 2, 3, 3, 3, 3, 4], dtype="int32")
+    assert not rl.range_based()
+    assert isinstance(rl._ranges, numpy.memmap)
+    assert len(_files()) == before + 1
+    assert rl.dtype == numpy.int32
+    assert rl[4] == 2
+    assert rl.get_ranges() == [(0, 2, 1), (2, 5, 2), (5, 9, 3), (9, 10, 4)]
+    assert list(rl.iter_ranges_by_slice(1, 6)) == [
+        (1, 2, 1), (2, 5, 2), (5, 6, 3)]
+    assert rl.get_single_value_by_slice(5, 9) == 3
+    with pytest.raises(MultipleValuesException):
+        rl.get_single_value_by_slice(4, 9)
+    rl[0:4] = 7
+    rl[9] = 7
+    assert list(rl) == [7, 7, 7, 7, 2, 3, 3, 3, 3, 7]
+    rl[4:9] = range(5)
+    assert list(rl.iter_by_slice(3, 10)) == [7, 0, 1, 2, 3, 4, 7]
+    assert rl.count(7) == 5
+    assert rl == [7, 7, 7, 7, 0, 1, 2, 3, 4, 7]
+
+    # Going back to ranges removes the file
+    rl.set_value(6)
+    assert rl.range_based()
+    assert len(_files()) == before
+
+
+def test_sources():
+    assert list(MemmapRangedList(5, lambda x: x * 2)) == [0, 2, 4, 6, 8]
+    assert list(MemmapRangedList(5, (i for i in range(5)))) == [
+        0, 1, 2, 3, 4]
+    assert list(MemmapRangedList(value=numpy.arange(5))) == [0, 1, 2, 3, 4]
+    with pytest.raises(ValueError):
+        MemmapRangedList(5, (i for i in range(6)))
+    with pytest.raises(ValueError):
+        MemmapRangedList(5, [1, 2])
+
+
+def test_failed_set_keeps_values():
+    before = len(_files())
+    rl = MemmapRangedList(5, [1, 2, 3, 4, 5])
+    with pytest.raises(ValueError):
+        rl.set_value([1, 2])
+    assert list(rl) == [1, 2, 3, 4, 5]
+    assert len(_files()) == before + 1
+
+
+def test_list_as_value():
+    rl = MemmapRangedList(4, 1.0)
+    rl.set_value_by_slice(0, 2, [7, 8], use_list_as_value=True)
+    assert rl[0] == [7, 8]
+    rl = MemmapRangedList(4, [1, 2, 3, 4])
+    with pytest.raises(TypeError):
+        rl.set_value_by_slice(0, 2, [7, 8], use_list_as_value=True)
+    assert list(rl) == [1, 2, 3, 4]
+
+
+def test_large_chunks():
+    size = 200000
+    rl = MemmapRangedList(size, (i // 50000 for i in range(size)))
+    assert rl.get_ranges() == [
+        (0, 50000, 0), (50000, 100000, 1), (100000, 150000, 2),
+        (150000, 200000, 3)]
+    assert rl.get_single_value_by_slice(100000, 150000) == 2
+
+
+def test_copy():
+    rl = MemmapRangedList(5, [1, 2, 3, 4, 5])
+    clone = rl.copy()
+    assert isinstance(clone, MemmapRangedList)
+    clone[0] = 9
+    assert list(rl) == [1, 2, 3, 4, 5]
+    assert list(clone) == [9, 2, 3, 4, 5]
+    other = MemmapRangedList(5, 0)
+    other.copy_into(RangedList(5, [5, 4, 3, 2, 1]))
+    assert list(other) == [5, 4, 3, 2, 1]
+
+
+def test_range_arrays():
+    ml = MemmapRangedList(5, numpy.arange(5.0), "a")
+    starts, stops, values = ml.range_arrays()
+    assert starts.tolist() == [0, 1, 2, 3, 4]
+    assert stops.tolist() == [1, 2, 3, 4, 5]
+    assert values.tolist() == [0.0, 1.0, 2.0, 3.0, 4.0]
+    assert not values.flags.writeable
+    ml[2] = 7.0
+    assert values[2] == 7.0
+
+
+def test_values_array():
+    ml = MemmapRangedList(5, numpy.arange(5.0), "a")
+    assert ml.values_array().tolist() == [0.0, 1.0, 2.0, 3.0, 4.0]
+    assert ml == RangedList(5, [0.0, 1.0, 2.0, 3.0, 4.0])
+    with pytest.raises(TypeError):
+        MemmapRangedList(5, 1.5).values_array()
+    with pytest.raises(TypeError):
+        RangedList(5, [0.0, 1.0, 2.0, 3.0, 4.0]).values_array()
@@ -68,3 +68,28 @@ def test_list_of_numpy_list(ranged_list, range_based):
         ranged_list.get_single_value_by_slice(0, 5), numpy.arange(10))
     assert numpy.array_equal(
         ranged_list.get_single_value_by_ids([0, 9]), numpy.arange(10))
+
+
+def test_range_arrays():
+    rl = RangedList(10, 1, "a")
+    rl[2:4] = 3
+    rl[8] = 2
+    starts, stops, values = rl.range_arrays()
+    assert starts.tolist() == [0, 2, 4, 8, 9]
+    assert stops.tolist() == [2, 4, 8, 9, 10]
+    assert values.tolist() == [1, 3, 1, 2, 1]
+    assert numpy.array_equal(numpy.repeat(values, stops - starts), rl)
+    assert values[numpy.searchsorted(starts, 3, side="right") - 1] == 3
+    with pytest.raises(ValueError):
+        values[0] = 4
+    rl[0] = 4
+    assert values[0] == 1
+
+
+def test_range_arrays_objects():
+    rl = RangedList(4, "a", "a")
+    rl.set_value_by_slice(1, 2, [1, 2], use_list_as_value=True)
+    rl[2] = 1.5
+    _, _, values = rl.range_arrays()
+    assert values.dtype == object
+    assert values.tolist() == ["a", [1, 2], 1.5, "a"]
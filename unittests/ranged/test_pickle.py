@@ -0,0 +1,112 @@
+# Copyright (c) 2023 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from concurrent.futures import ProcessPoolExecutor
+import pickle
+import numpy
+from spinn_utilities.config_setup import unittest_setup
+from spinn_utilities.ranged import (
+    LockedRangeDictionary, LockedRangedList, MemmapRangedList,
+    RangeDictionary, RangedList, RangedListOfList)
+
+
+def setup_module():
+    unittest_setup()
+
+
+def _round_trip(item):
+    return pickle.loads(pickle.dumps(item))
+
+
+def test_ranged_list():
+    rl = RangedList(10, 1.5, "a")
+    rl[2:4] = 2.5
+    clone = _round_trip(rl)
+    assert clone.get_ranges() == rl.get_ranges()
+    assert type(clone.get_ranges()[1][2]) is float
+    assert clone.get_default() == 1.5
+    clone[0] = 7
+    assert rl[0] == 1.5
+
+
+def test_value_types():
+    for values in ([1, 2, 2, 3], [0.5, 0.5, 1.0, 2.0], ["a", "b", "b", "c"],
+                   [2 ** 70, 1, 1, 1], [2 ** 63, -1, 0, 0],
+                   [True, 1, 1.0, None]):
+        rl = RangedList(4, values)
+        clone = _round_trip(rl)
+        assert not clone.range_based()
+        assert list(clone) == values
+        assert [type(value) for value in clone] == [
+            type(value) for value in values]
+        ranged = RangedList(4, iter(values))
+        assert _round_trip(ranged).get_ranges() == ranged.get_ranges()
+    rl = RangedListOfList(3, [[1, 2], [3], [4, 5]])
+    assert list(_round_trip(rl)) == [[1, 2], [3], [4, 5]]
+
+
+def test_compact():
+    rl = RangedList(10000, iter(
+        float(i // 4 % 2 * i // 4) for i in range(10000)))
+    assert rl.range_based()
+    assert len(pickle.dumps(rl)) * 4 < len(pickle.dumps(rl.get_ranges())) * 3
+
+
+def test_derived_lists():
+    left = RangedList(5, 10)
+    right = RangedList(5, [1, 2, 3, 4, 5])
+    for derived in (left + right, left - 2, left * 3, left / right,
+                    left // 4, left - numpy.arange(5)):
+        assert list(_round_trip(derived)) == list(derived)
+
+
+def test_dictionary():
+    rd = RangeDictionary(10, {"a": 1, "b": "x"})
+    rd[3:5]["a"] = 4
+    rd["c"] = rd["a"] * 2
+    clone = _round_trip(rd)
+    assert type(clone) is RangeDictionary
+    assert clone.get_ranges() == rd.get_ranges()
+    assert clone[2:6].get_ranges() == rd[2:6].get_ranges()
+
+
+def test_locked():
+    rd = LockedRangeDictionary(10, {"a": 1, "b": 2})
+    clone = _round_trip(rd)
+    assert clone.get_ranges() == rd.get_ranges()
+    assert isinstance(clone["a"], LockedRangedList)
+    assert clone["a"].lock is clone.lock
+    assert clone.lock is not rd.lock
+
+
+def test_memmap():
+    rl = MemmapRangedList(5, [1, 2, 3, 4, 5], dtype=numpy.int32)
+    clone = _round_trip(rl)
+    assert isinstance(clone._ranges, numpy.memmap)
+    assert clone.dtype == numpy.int32
+    assert clone == rl
+    clone[0] = 9
+    assert rl[0] == 1
+
+
+def _sum_slice(view):
+    return sum(view.iter_all_values("a"))
+
+
+def test_process_pool():
+    rd = RangeDictionary(100, {"a": 1})
+    rd[50:100]["a"] = 2
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        results = list(executor.map(_sum_slice, [rd[0:50], rd[50:100]]))
+    assert results == [50, 100]
@@ -0,0 +1,120 @@
+# Copyright (c) 2023 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from concurrent.futures import ProcessPoolExecutor
+import pickle
+import numpy
+import pytest
+from spinn_utilities.config_setup import unittest_setup
+from spinn_utilities.ranged import (
+    MemmapRangedList, MultipleValuesException, RangeDictionary,
+    SharedRangeDictionary)
+
+
+def setup_module():
+    unittest_setup()
+
+
+def _source():
+    rd = RangeDictionary(10, {"a": 1, "b": 2.5, "c": "foo"})
+    rd["a"][3:6] = 7
+    rd["b"][8] = 4.5
+    rd["c"][0:2] = "bar"
+    rd["d"] = MemmapRangedList(10, numpy.arange(10.0), "d")
+    return rd
+
+
+def test_publish():
+    rd = _source()
+    with SharedRangeDictionary.publish(rd) as shared:
+        assert len(shared) == 10
+        assert set(shared.keys()) == {"a", "b", "c", "d"}
+        for key in rd.keys():
+            assert list(shared.iter_ranges(key)) == list(rd.iter_ranges(key))
+            assert list(shared[key]) == list(rd[key])
+            assert shared[key] == rd[key]
+            assert shared.get_default(key) == rd.get_default(key)
+        assert type(shared["a"][4]) is int
+        assert shared["a"][4] == 7
+        assert shared[2:4].get_value("c") == "foo"
+        assert shared[3:5].get_value("a") == 7
+        with pytest.raises(MultipleValuesException):
+            shared["a"].get_single_value_by_slice(2, 4)
+        with pytest.raises(MultipleValuesException):
+            shared["d"].get_single_value_by_slice(2, 4)
+        assert shared["d"].get_single_value_by_slice(2, 3) == 2.0
+        assert list(shared["a"].iter_ranges_by_slice(4, 8)) == [
+            (4, 6, 7), (6, 8, 1)]
+        assert list(shared["d"].iter_ranges_by_slice(4, 6)) == [
+            (4, 5, 4.0), (5, 6, 5.0)]
+        assert shared.get_values_by_id("b", 8) == 4.5
+
+
+def test_read_only():
+    with SharedRangeDictionary.publish(_source()) as shared:
+        with pytest.raises(TypeError):
+            shared["a"] = 3
+        with pytest.raises(TypeError):
+            shared["a"][2] = 3
+        with pytest.raises(TypeError):
+            shared[2:4]["b"] = 3.5
+        copy = shared.copy()
+        copy["a"][2] = 3
+        assert copy["a"][2] == 3
+        assert shared["a"][2] == 1
+
+
+def test_attach_and_close():
+    shared = SharedRangeDictionary.publish(_source())
+    other = SharedRangeDictionary(shared.name)
+    assert list(other.iter_ranges("a")) == list(shared.iter_ranges("a"))
+    clone = pickle.loads(pickle.dumps(shared))
+    assert clone.name == shared.name
+    assert list(clone["d"]) == list(range(10))
+    other.close()
+    clone.close()
+    name = shared.name
+    shared.close()
+    shared.close()
+    with pytest.raises(FileNotFoundError):
+        SharedRangeDictionary(name)
+
+
+def _sum(args):
+    shared, key = args
+    with shared:
+        return sum(shared[key])
+
+
+def test_workers():
+    with SharedRangeDictionary.publish(_source()) as shared:
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            totals = list(executor.map(
+                _sum, [(shared, "a"), (shared, "b"), (shared, "d")]))
+    assert totals == [28, 27.0, 45.0]
+
+
+def test_range_arrays():
+    rd = _source()
+    with SharedRangeDictionary.publish(rd) as shared:
+        for key in rd.keys():
+            expected = rd[key].range_arrays()
+            arrays = shared[key].range_arrays()
+            for array, other in zip(arrays, expected):
+                assert array.tolist() == other.tolist()
+                assert array.dtype == other.dtype
+                assert not array.flags.writeable
+        starts, _, values = shared["a"].range_arrays()
+        assert not starts.flags.writeable
+        del starts, values
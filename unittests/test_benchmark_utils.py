@@ -0,0 +1,50 @@
+# Copyright (c) 2017 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import json
+import os
+import tempfile
+import time
+from spinn_utilities.benchmark_utils import (
+    describe_environment, time_operation, write_results)
+
+
+def test_time_operation(monkeypatch):
+    # A fake clock, moved on only by preparing and running the operation
+    now = [0.0]
+    monkeypatch.setattr(time, "perf_counter", lambda: now[0])
+    made = []
+
+    def run():
+        now[0] += 1.0
+
+    def make():
+        # Preparing is not timed
+        now[0] += 100.0
+        made.append(len(made))
+        return run
+
+    times = time_operation(make, 3)
+    assert made == [0, 1, 2]
+    assert times == [1.0, 1.0, 1.0]
+
+
+def test_describe_and_write():
+    results = describe_environment(repeat=2, results=[])
+    assert results["repeat"] == 2
+    assert "python" in results and "commit" in results
+    output = os.path.join(tempfile.mkdtemp(), "results.json")
+    write_results(results, output)
+    with open(output, encoding="utf-8") as f:
+        assert json.load(f) == results
+    os.remove(output)
@@ -0,0 +1,79 @@
+# Copyright (c) 2023 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+import pytest
+from spinn_utilities.read_write_lock import ReadWriteLock
+
+
+def test_many_readers():
+    lock = ReadWriteLock()
+    inside = threading.Barrier(3, timeout=5)
+
+    def reader():
+        with lock.read():
+            # All three must be inside at once to pass the barrier
+            inside.wait()
+
+    threads = [threading.Thread(target=reader) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert not inside.broken
+
+
+def test_writer_excludes_readers():
+    lock = ReadWriteLock()
+    events = []
+    lock.acquire_write()
+
+    def reader():
+        with lock.read():
+            events.append("read")
+
+    thread = threading.Thread(target=reader)
+    thread.start()
+    thread.join(0.1)
+    events.append("write done")
+    lock.release_write()
+    thread.join()
+    assert events == ["write done", "read"]
+
+
+def test_reentrant():
+    lock = ReadWriteLock()
+    with lock.write():
+        with lock.write():
+            with lock.read():
+                pass
+    with lock.read():
+        with lock.read():
+            pass
+    # Fully released so another thread can write
+    thread = threading.Thread(target=lambda: lock.write().__enter__())
+    thread.start()
+    thread.join(1)
+    assert not thread.is_alive()
+
+
+def test_bad_use():
+    lock = ReadWriteLock()
+    with pytest.raises(RuntimeError):
+        lock.release_read()
+    with pytest.raises(RuntimeError):
+        lock.release_write()
+    with lock.read():
+        with pytest.raises(RuntimeError):
+            lock.acquire_write()